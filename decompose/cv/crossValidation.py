@@ -0,0 +1,88 @@
+from typing import Tuple, Dict, Any, Union
+import os
+import multiprocessing
+import numpy as np
+from numpy import ndarray
+
+from decompose.cv.cv import Block
+
+
+def fitFold(path: str, nFolds: Tuple[int, ...], foldNumber: int,
+            modelDirectory: str, kwargs: Dict[str, Any]) -> Tuple[float, float]:
+    """Fits a `DECOMPOSE` model to one fold of the data.
+
+    The data is mapped read-only from the `.npy` file at `path` and fed
+    from the mapped pages in every step. Unless `residentData` is given
+    in `kwargs` it is not loaded into a variable of the graph, which
+    would hold a private copy of the data in every worker. The fed
+    batch is still copied into the session in every step, as is the
+    whole mapped array if its type differs from the `dtype` of the
+    model.
+
+    Returns:
+        `Tuple[float, float]` of the test llh and the test loss of the fold.
+    """
+    from decompose.sklearn import DECOMPOSE
+    X = np.asarray(np.load(path, mmap_mode="r"))
+    kwargs = dict(kwargs)
+    kwargs.setdefault("residentData", False)
+    model = DECOMPOSE(modelDirectory=modelDirectory,
+                      cv=Block(nFolds=nFolds, foldNumber=foldNumber),
+                      **kwargs)
+    model.fit(X)
+    return(float(model.llh), float(model.loss))
+
+
+def crossValidate(X: Union[ndarray, str], nFolds: Tuple[int, ...],
+                  modelDirectory: str, nProcesses: int = None,
+                  **kwargs) -> Dict[str, Union[ndarray, float]]:
+    """Runs all folds of a `Block` cross validation in parallel.
+
+    The data is written once into a `.npy` file in `modelDirectory`
+    unless `X` is already the path of a `.npy` file. Every worker maps
+    the file read-only such that the processes share the pages of the
+    data in the page cache, only the batch fed in the current step is
+    copied by each worker (see `fitFold`). The model of each fold is stored in the
+    subdirectory `fold<foldNumber>` of `modelDirectory`. The workers are
+    started with `spawn` since tensorflow must not be forked.
+
+    Arguments:
+        X: `ndarray` or `str`, the data or the path of a `.npy` file.
+        nFolds: `Tuple[int, ...]`, number of folds along each axis.
+        modelDirectory: `str`, directory of the models and the data.
+        nProcesses: `int`, number of folds that are fitted concurrently,
+            by default the number of folds or of cpus if that is smaller.
+        kwargs: arguments of `DECOMPOSE` other than `modelDirectory`
+            and `cv`.
+
+    Returns:
+        `Dict` containing the test llh and the test loss of each fold
+        under the keys `llh` and `loss` and their sums over all folds
+        under the keys `totalLlh` and `totalLoss`.
+    """
+    os.makedirs(modelDirectory, exist_ok=True)
+    if isinstance(X, str):
+        path = X
+    else:
+        path = os.path.join(modelDirectory, "data.npy")
+        data = np.lib.format.open_memmap(path, mode="w+", dtype=X.dtype,
+                                         shape=X.shape)
+        data[...] = X
+        data.flush()
+        del data
+
+    nFoldsTotal = int(np.prod(nFolds))
+    if nProcesses is None:
+        nProcesses = min(nFoldsTotal, os.cpu_count() or 1)
+    args = [(path, tuple(nFolds), foldNumber,
+             os.path.join(modelDirectory, f"fold{foldNumber}"), kwargs)
+            for foldNumber in range(nFoldsTotal)]
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Pool(nProcesses) as pool:
+        results = pool.starmap(fitFold, args)
+
+    llh, loss = (np.array(r) for r in zip(*results))
+    scores = {"llh": llh, "loss": loss,
+              "totalLlh": float(np.sum(llh)),
+              "totalLoss": float(np.sum(loss))}
+    return(scores)
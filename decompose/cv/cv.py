@@ -1,7 +1,8 @@
-from typing import Tuple
+from typing import Tuple, List
 from abc import ABCMeta, abstractmethod
 import string
 import numpy as np
+from numpy import ndarray
 import tensorflow as tf
 from tensorflow import Tensor
 
@@ -19,8 +20,45 @@ class CV(metaclass=ABCMeta):
     def mask(self, X: Tensor) -> Tensor:
         ...
 
+    @abstractmethod
+    def npMask(self, M: Tuple[int, ...]) -> ndarray:
+        """Test mask of data of shape `M` as a numpy array."""
+        ...
+
+    def testSlices(self, M: Tuple[int, ...]) -> Tuple[slice, ...]:
+        """Slices that select the test set of data of shape `M`.
+
+        Only cross validations whose test set is a single block provide
+        the slices.
+        """
+        raise NotImplementedError
+
+    def trainSlices(self, M: Tuple[int, ...]) -> List[Tuple[slice, ...]]:
+        """Disjoint blocks of slices that select the training set.
+
+        An entry outside of the test block is assigned to the block of
+        the first axis along which it lies outside of the test block.
+        """
+        testSlices = self.testSlices(M)
+        F = len(M)
+        slices = []  # type: List[Tuple[slice, ...]]
+        for f in range(F):
+            start, stop = testSlices[f].start, testSlices[f].stop
+            for s in [slice(0, start), slice(stop, M[f])]:
+                if s.start < s.stop:
+                    slices.append(testSlices[:f] + (s,)
+                                  + (slice(None),)*(F-f-1))
+        return(slices)
+
 
 class Block(CV):
+    """Holds out one block of a grid of `nFolds` blocks as test set.
+
+    The folds are numbered in row-major order of the grid. Along each
+    axis the blocks have `M[f]//nFolds[f]` entries except for the last
+    one which also contains the remaining entries. The test mask is the
+    outer product of an indicator vector per axis.
+    """
 
     def __init__(self, nFolds: Tuple[int, ...], foldNumber: int) -> None:
         self.__nFolds = nFolds
@@ -37,22 +75,22 @@ class Block(CV):
     def isLowrank(self) -> bool:
         return(True)
 
-    def lowrankMask(self, X: Tensor):
-        nFolds = np.array(self.nFolds)
-        foldNumber = self.foldNumber
-
-        M = np.array(X.get_shape().as_list())
-        F = len(M)
-        nValues = M//nFolds
-
-        folds = np.zeros(np.product(M)).flatten()
-        folds[foldNumber] = 1.
-        folds = folds.reshape(M)
-        foldNumbers = np.array(np.where(folds == 1.)).flatten()
+    def testSlices(self, M: Tuple[int, ...]) -> Tuple[slice, ...]:
+        foldNumbers = np.unravel_index(self.foldNumber, self.nFolds)
+        slices = []
+        for Mf, nFoldsf, foldNumberf in zip(M, self.nFolds, foldNumbers):
+            nValues = Mf//nFoldsf
+            start = int(foldNumberf)*nValues
+            stop = Mf if foldNumberf == nFoldsf-1 else start + nValues
+            slices.append(slice(start, stop))
+        return(tuple(slices))
 
+    def lowrankMask(self, X: Tensor):
+        M = X.get_shape().as_list()
         U = []
-        for f in range(F):
-            Uf = self.testMask(M[f], foldNumbers[f], nFolds[f], nValues[f])
+        for Mf, s in zip(M, self.testSlices(M)):
+            Uf = np.zeros(Mf)
+            Uf[s] = 1.
             U.append(tf.constant(Uf))
         return(U)
 
@@ -64,10 +102,135 @@ class Block(CV):
         mask = tf.cast(tf.einsum(subscripts, *U), dtype=tf.bool)
         return(mask)
 
-    def testMask(self, Mf, foldNumber, nFolds, nValues):
-        Uf = np.zeros(Mf)
-        if foldNumber == nFolds-1:
-            Uf[(nFolds-1)*nValues:] = 1.
-        else:
-            Uf[foldNumber*nValues:(foldNumber+1)*nValues] = 1.
-        return(Uf)
+    def npMask(self, M: Tuple[int, ...]) -> ndarray:
+        mask = np.zeros(M, dtype=bool)
+        mask[self.testSlices(M)] = True
+        return(mask)
+
+
+MASK32 = 0xffffffff
+
+
+def npHash32(x: ndarray) -> ndarray:
+    """Integer hash of the lower 32 bits of the `int64` array `x`.
+
+    The factors are smaller than `2^31` such that the products of 32 bit
+    numbers do not overflow `int64`.
+    """
+    x = x & MASK32
+    x = x ^ (x >> 16)
+    x = (x*0x21f0aaad) & MASK32
+    x = x ^ (x >> 15)
+    x = (x*0x735a2d97) & MASK32
+    x = x ^ (x >> 15)
+    return(x)
+
+
+def tfLogicalRightShift(x: Tensor, shift: int) -> Tensor:
+    """Right shift of the bits of the `int32` tensor `x` filling in zeros."""
+    mask = tf.constant((1 << (32 - shift)) - 1, dtype=tf.int32)
+    return(tf.bitwise.bitwise_and(tf.bitwise.right_shift(x, shift), mask))
+
+
+def tfHash32(x: Tensor) -> Tensor:
+    """Same as `npHash32` on the bits of `int32` tensors.
+
+    The products wrap around like those of unsigned 32 bit numbers such
+    that no `int64` intermediates are needed.
+    """
+    bitwise = tf.bitwise
+    x = bitwise.bitwise_xor(x, tfLogicalRightShift(x, 16))
+    x = x*tf.constant(0x21f0aaad, dtype=tf.int32)
+    x = bitwise.bitwise_xor(x, tfLogicalRightShift(x, 15))
+    x = x*tf.constant(0x735a2d97, dtype=tf.int32)
+    x = bitwise.bitwise_xor(x, tfLogicalRightShift(x, 15))
+    return(x)
+
+
+def toInt32(x: int) -> int:
+    """The signed `int32` with the same lower 32 bits as `x`."""
+    x = x & MASK32
+    return(x - 2**32 if x >= 2**31 else x)
+
+
+class RandomEntries(CV):
+    """Holds out a random fraction of the entries as test set.
+
+    Whether an entry belongs to the test set is decided by a counter
+    based hash of the seed and the coordinates of the entry. The mask is
+    therefore never stored but regenerated whenever it is needed, and
+    any tile of it can be generated independently of the others. In the
+    graph the hash is computed with 32 bit integers.
+
+    Arguments:
+        holdout: `float`, expected fraction of entries in the test set.
+        seed: `int`, seed of the hash.
+        tileSize: `int`, number of entries per tile of `npMask`.
+    """
+
+    def __init__(self, holdout: float = 0.1, seed: int = 0,
+                 tileSize: int = 2**20) -> None:
+        if not 0. < holdout < 1.:
+            raise ValueError("holdout must be between 0 and 1")
+        self.__holdout = holdout
+        self.__seed = seed
+        self.__tileSize = tileSize
+
+    @property
+    def holdout(self) -> float:
+        return(self.__holdout)
+
+    @property
+    def seed(self) -> int:
+        return(self.__seed)
+
+    @property
+    def threshold(self) -> int:
+        """Entries whose hash is below the threshold are test entries."""
+        return(int(self.holdout*2**32))
+
+    def isLowrank(self) -> bool:
+        return(False)
+
+    def lowrankMask(self, X: Tensor):
+        raise NotImplementedError
+
+    def mask(self, X: Tensor) -> Tensor:
+        M = X.get_shape().as_list()
+        F = len(M)
+        h = tfHash32(tf.constant(toInt32(self.seed), dtype=tf.int32))
+        for f in range(F):
+            shape = [1]*F
+            shape[f] = M[f]
+            coordinates = tf.reshape(tf.range(M[f], dtype=tf.int32), shape)
+            h = tfHash32(tf.bitwise.bitwise_xor(h, coordinates))
+
+        # flipping the sign bit maps the unsigned order of the hashes to
+        # the signed order of `int32`
+        signBit = tf.constant(-2**31, dtype=tf.int32)
+        threshold = tf.constant(self.threshold - 2**31, dtype=tf.int32)
+        mask = tf.less(tf.bitwise.bitwise_xor(h, signBit), threshold)
+        return(mask)
+
+    def npMaskRows(self, M: Tuple[int, ...], start: int,
+                   stop: int) -> ndarray:
+        """Rows `start` to `stop` of the test mask of data of shape `M`."""
+        F = len(M)
+        h = npHash32(np.array(self.seed, dtype=np.int64))
+        for f in range(F):
+            shape = [1]*F
+            if f == 0:
+                coordinates = np.arange(start, stop, dtype=np.int64)
+            else:
+                coordinates = np.arange(M[f], dtype=np.int64)
+            shape[f] = len(coordinates)
+            h = npHash32(h ^ coordinates.reshape(shape))
+        return(h < self.threshold)
+
+    def npMask(self, M: Tuple[int, ...]) -> ndarray:
+        mask = np.empty(M, dtype=bool)
+        tileRows = max(1, self.__tileSize//max(1, int(np.prod(M[1:]))))
+        for start in range(0, M[0], tileRows):
+            stop = min(start + tileRows, M[0])
+            mask[start:stop] = self.npMaskRows(M, start, stop)
+        return(mask)
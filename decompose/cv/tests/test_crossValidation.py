@@ -0,0 +1,28 @@
+import pytest
+import numpy as np
+
+from decompose.cv.crossValidation import crossValidate
+from decompose.distributions.cenNormal import CenNormal
+from decompose.data.lowRank import LowRank
+
+
+@pytest.mark.system
+@pytest.mark.slow
+def test_crossValidate(tmpdir):
+    K, M_train, M_test = 3, [300, 100], [10, 100]
+    lrData = LowRank(rank=K, M_train=M_train, M_test=M_test)
+    nFolds = (2, 2)
+
+    scores = crossValidate(lrData.training, nFolds=nFolds,
+                           modelDirectory=str(tmpdir.mkdir("cv")),
+                           priors=[CenNormal(), CenNormal()],
+                           n_components=K, dtype=np.float32,
+                           checkpoints="off", summarySteps=None)
+
+    assert(scores["llh"].shape == (4,))
+    assert(scores["loss"].shape == (4,))
+    assert(np.isclose(scores["totalLoss"], np.sum(scores["loss"])))
+
+    # the low rank structure generalizes to the held out blocks
+    testVarExpl = 1. - scores["totalLoss"]/np.sum(lrData.training**2)
+    assert(testVarExpl > 0.95)
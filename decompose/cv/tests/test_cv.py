@@ -0,0 +1,76 @@
+import time
+import pytest
+import numpy as np
+import tensorflow as tf
+
+from decompose.cv.cv import Block, RandomEntries
+
+
+def test_blockFoldsPartition():
+    M, nFolds = (7, 8, 9), (2, 3, 2)
+    data = tf.zeros(M)
+    masks = [Block(nFolds=nFolds, foldNumber=n).mask(data)
+             for n in range(int(np.prod(nFolds)))]
+    with tf.Session() as sess:
+        npmasks = sess.run(masks)
+
+    # every entry is in the test set of exactly one fold
+    counts = np.sum(np.array(npmasks, dtype=int), axis=0)
+    assert(np.all(counts == 1))
+    tf.reset_default_graph()
+
+
+def test_blockSlices():
+    M, nFolds = (7, 8, 9), (2, 3, 2)
+    for foldNumber in range(int(np.prod(nFolds))):
+        cv = Block(nFolds=nFolds, foldNumber=foldNumber)
+        counts = np.zeros(M, dtype=int)
+        counts[cv.testSlices(M)] += 1
+        for slices in cv.trainSlices(M):
+            counts[slices] += 1
+        assert(np.all(counts == 1))
+
+
+def test_randomEntriesMask():
+    M, holdout = (50, 40, 3), 0.2
+    cv = RandomEntries(holdout=holdout, seed=3, tileSize=100)
+    mask = cv.mask(tf.zeros(M))
+
+    # the mask is never stored
+    assert(len(tf.local_variables()) == 0)
+    assert(len(tf.global_variables()) == 0)
+    with tf.Session() as sess:
+        tfmask = sess.run(mask)
+
+    # the tiles and the graph generate the same mask
+    npmask = cv.npMask(M)
+    assert(np.all(npmask == tfmask))
+    assert(np.all(npmask == RandomEntries(holdout=holdout, seed=3).npMask(M)))
+    assert(np.abs(np.mean(npmask) - holdout) < 0.02)
+
+    # a different seed yields a different mask
+    assert(np.any(npmask != RandomEntries(holdout=holdout, seed=4).npMask(M)))
+    tf.reset_default_graph()
+
+
+@pytest.mark.slow
+def test_randomEntriesMask_benchmark():
+    """Reports the time to regenerate the mask relative to a residual."""
+    M, nRuns = (1000, 1000), 20
+    cv = RandomEntries(holdout=0.1)
+    X = tf.placeholder(dtype=tf.float32, shape=M)
+    mask = tf.reduce_sum(tf.cast(cv.mask(X), tf.int32))
+    residual = tf.reduce_sum(X - tf.matmul(X[:, :5], X[:5]))
+    data = np.random.normal(size=M).astype(np.float32)
+
+    times = {}
+    with tf.Session() as sess:
+        for name, op in [("mask", mask), ("residual", residual)]:
+            sess.run(op, feed_dict={X: data})
+            t0 = time.perf_counter()
+            for run in range(nRuns):
+                sess.run(op, feed_dict={X: data})
+            times[name] = (time.perf_counter() - t0)/nRuns
+    print(f"M={M}: mask {times['mask']:.4f}s, "
+          f"rank 5 residual {times['residual']:.4f}s per step")
+    tf.reset_default_graph()
@@ -4,6 +4,8 @@ import string
 from numpy import ndarray
 import tensorflow as tf
 
+from decompose.data.residentData import ResidentData
+
 
 class LowRank(object):
     """Create low rank training and test data.
@@ -90,6 +92,19 @@ class LowRank(object):
             shuffle=False, num_epochs=None)
         return(input_fn)
 
+    @property
+    def training_resident(self) -> ResidentData:
+        """Training data that is kept resident in the graph.
+
+        Unlike `training_input_fn` the training matrix is loaded only
+        once into the graph and reused in every step.
+
+        Returns:
+            `ResidentData` whose `input_fn` and `hook` must be passed to
+            the `train` function of an `Estimator`.
+        """
+        return(ResidentData(self.__data_train, dtype=self.__data_train.dtype))
+
     @property
     def test_input_fn(self) -> Callable:
         """Test data as a tensorflow `input_fn` function.
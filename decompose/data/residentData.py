@@ -0,0 +1,94 @@
+from typing import Callable, Dict
+import numpy as np
+from numpy import ndarray
+import tensorflow as tf
+from tensorflow import Tensor
+
+
+class ResidentData(object):
+    """Keep the training data resident in the graph during the training.
+
+    The data is copied once into a local variable when the training
+    session is created and the same variable is read in every step.
+    Unlike `numpy_input_fn` the data is neither copied into a queue nor
+    fed again in each step. The missing values (`nan`) are replaced
+    with zeros once at load time. If the data is not fully observed the
+    raw data is kept in a second variable from which the masks of the
+    observed entries are derived. The local variables are not written
+    to the checkpoints.
+
+    The `hook` must be passed along with the `input_fn` to the `train`
+    function of the estimator to load the data.
+
+    Arguments:
+        data: `ndarray`, the training data.
+        dtype: `type`, type of the data in the graph.
+        isFullyObserved: `bool`, whether the data has no missing values.
+    """
+    def __init__(self, data: ndarray, dtype: type = np.float32,
+                 isFullyObserved: bool = True) -> None:
+        self.__data = np.asarray(data, dtype=dtype)
+        self.__dtype = dtype
+        self.__isFullyObserved = isFullyObserved
+
+    @property
+    def shape(self):
+        return(self.__data.shape)
+
+    @property
+    def input_fn(self) -> Callable:
+        """The resident data as a tensorflow `input_fn` function.
+
+        Returns:
+            `Callable` that can be passed to the `train` function of
+            an `Estimator` function as `input_fn` argument. The features
+            contain the data under the key `train` and the data without
+            missing values under the key `scrubbed`.
+        """
+        def f() -> Dict[str, Tensor]:
+            dtype = tf.as_dtype(self.__dtype)
+            shape = self.shape
+            collections = [tf.GraphKeys.LOCAL_VARIABLES]
+            with tf.variable_scope("residentData"):
+                placeholder = tf.placeholder(dtype=dtype, shape=shape)
+                scrubbed = tf.Variable(tf.zeros(shape, dtype=dtype),
+                                       trainable=False, name="scrubbed",
+                                       collections=collections)
+                noNans = tf.where(tf.is_nan(placeholder),
+                                  tf.zeros_like(placeholder), placeholder)
+                if self.__isFullyObserved:
+                    raw = scrubbed
+                    load = tf.assign(scrubbed, noNans)
+                else:
+                    raw = tf.Variable(tf.zeros(shape, dtype=dtype),
+                                      trainable=False, name="train",
+                                      collections=collections)
+                    load = tf.group(tf.assign(raw, placeholder),
+                                    tf.assign(scrubbed, noNans))
+            self.__placeholder = placeholder
+            self.__load = load
+            features = {"train": raw.value(), "scrubbed": scrubbed.value()}
+            return(features)
+        return(f)
+
+    def load(self, session: tf.Session) -> None:
+        """Copies the data into the variables of the graph."""
+        session.run(self.__load, feed_dict={self.__placeholder: self.__data})
+
+    @property
+    def hook(self) -> tf.train.SessionRunHook:
+        """Hook that loads the data when the session is created."""
+        return(LoadHook(self))
+
+
+class LoadHook(tf.train.SessionRunHook):
+    """Loads `ResidentData` into the graph when the session is created.
+
+    Arguments:
+        residentData: `ResidentData`, the data to load.
+    """
+    def __init__(self, residentData: ResidentData) -> None:
+        self.__residentData = residentData
+
+    def after_create_session(self, session, coord):
+        self.__residentData.load(session)
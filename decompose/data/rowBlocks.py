@@ -0,0 +1,158 @@
+from typing import Callable, Iterator, Dict, Tuple, Union, Any
+import numpy as np
+from numpy import ndarray
+import tensorflow as tf
+
+
+class RowBlocks(object):
+    """Serve the rows of a matrix in blocks without loading it into memory.
+
+    The data can be an `ndarray`, a `np.memmap`, an HDF5 dataset or the
+    path of a `.npy` file (opened with `mmap_mode="r"`) or of an HDF5
+    file. Only one block of `blockSize` rows is read and converted to
+    `dtype` at a time. If the number of rows is not a multiple of
+    `blockSize` the last block is filled up with the first rows of
+    the data such that all blocks have the same size.
+
+    Arguments:
+        data: `ndarray`, `np.memmap`, `h5py.Dataset` or `str`, the data.
+        blockSize: `int`, number of rows per block.
+        dataset: `str`, name of the dataset if `data` is an HDF5 file.
+        dtype: `type`, type of the served blocks.
+        shuffle: `bool`, whether to serve the blocks in random order.
+        seed: `int`, seed of the random order of the blocks.
+
+    Raises:
+        ValueError:
+            if `blockSize` exceeds the number of rows of the data.
+    """
+    def __init__(self,
+                 data: Union[ndarray, str, Any],
+                 blockSize: int = 1000,
+                 dataset: str = None,
+                 dtype: type = np.float32,
+                 shuffle: bool = True,
+                 seed: int = None) -> None:
+        if isinstance(data, str):
+            data = self.open(data, dataset=dataset)
+        if blockSize > data.shape[0]:
+            raise ValueError("blockSize exceeds the number of rows")
+        self.__data = data
+        self.__blockSize = blockSize
+        self.__dtype = dtype
+        self.__shuffle = shuffle
+        self.__seed = seed
+
+    @staticmethod
+    def open(path: str, dataset: str = None) -> Union[ndarray, Any]:
+        """Opens a `.npy` or HDF5 file without reading its content.
+
+        Arguments:
+            path: `str`, path of a `.npy` or an HDF5 file.
+            dataset: `str`, name of the dataset in the HDF5 file.
+
+        Returns:
+            `np.memmap` or `h5py.Dataset` of the data.
+        """
+        if path.endswith(".npy"):
+            return(np.load(path, mmap_mode="r"))
+        import h5py
+        if dataset is None:
+            raise ValueError("dataset must be given for HDF5 files")
+        return(h5py.File(path, "r")[dataset])
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return(tuple(self.__data.shape))
+
+    @property
+    def blockSize(self) -> int:
+        return(self.__blockSize)
+
+    @property
+    def dtype(self) -> type:
+        return(self.__dtype)
+
+    @property
+    def nBlocks(self) -> int:
+        nRows, blockSize = self.shape[0], self.blockSize
+        return(-(-nRows // blockSize))
+
+    def rows(self, b: int) -> ndarray:
+        """Indices of the rows of the `b`-th block."""
+        start = b*self.blockSize
+        rows = np.arange(start, start + self.blockSize) % self.shape[0]
+        return(rows)
+
+    def block(self, b: int) -> ndarray:
+        """Reads the rows of the `b`-th block.
+
+        Arguments:
+            b: `int`, number of the block.
+
+        Returns:
+            `ndarray` of shape `(blockSize, M[1], ...)`.
+        """
+        nRows, blockSize = self.shape[0], self.blockSize
+        start = b*blockSize
+        stop = min(start + blockSize, nRows)
+        block = np.asarray(self.__data[start:stop], dtype=self.dtype)
+        if stop - start < blockSize:
+            rest = np.asarray(self.__data[:blockSize - (stop - start)],
+                              dtype=self.dtype)
+            block = np.concatenate((block, rest), axis=0)
+        return(block)
+
+    def blocks(self) -> Iterator[Dict[str, ndarray]]:
+        """Serves the blocks infinitely many times.
+
+        Every row is served once per epoch. The blocks are served in
+        random order if `shuffle` is `True`.
+
+        Returns:
+            `Iterator` over dictionaries containing a block under the key
+            `train` and the indices of its rows under the key `rows`.
+        """
+        randomState = np.random.RandomState(self.__seed)
+        while True:
+            order = np.arange(self.nBlocks)
+            if self.__shuffle:
+                randomState.shuffle(order)
+            for b in order:
+                yield {"train": self.block(b), "rows": self.rows(b)}
+
+    @property
+    def input_fn(self) -> Callable:
+        """The blocks as a tensorflow `input_fn` function.
+
+        Returns:
+            `Callable` that can be passed to the `train` function of
+            an `Estimator` function as `input_fn` argument to serve
+            the blocks.
+        """
+        blockShape = (self.blockSize,) + self.shape[1:]
+
+        def f():
+            dataset = tf.data.Dataset.from_generator(
+                self.blocks,
+                output_types={"train": tf.as_dtype(self.dtype),
+                              "rows": tf.int64},
+                output_shapes={"train": tf.TensorShape(blockShape),
+                               "rows": tf.TensorShape(blockShape[:1])})
+            dataset = dataset.prefetch(1)
+            return(dataset)
+        return(f)
+
+    def var(self) -> float:
+        """Variance of the data calculated block by block."""
+        nRows, blockSize = self.shape[0], self.blockSize
+        n, s, s2 = 0, 0., 0.
+        for start in range(0, nRows, blockSize):
+            block = np.asarray(self.__data[start:start + blockSize],
+                               dtype=np.float64)
+            n += block.size
+            s += np.sum(block)
+            s2 += np.sum(block**2)
+        mean = s/n
+        var = s2/n - mean**2
+        return(var)
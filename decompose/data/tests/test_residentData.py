@@ -0,0 +1,77 @@
+import time
+import pytest
+import numpy as np
+import tensorflow as tf
+
+from decompose.data.residentData import ResidentData
+from decompose.data.lowRank import LowRank
+from decompose.models.tensorFactorisation import TensorFactorisation
+from decompose.distributions.cenNormal import CenNormal
+from decompose.stopCriterions.llhStall import LlhStall
+
+
+@pytest.mark.parametrize("isFullyObserved", [True, False])
+def test_load(isFullyObserved):
+    M = (7, 5)
+    npdata = np.random.normal(size=M).astype(np.float32)
+    if not isFullyObserved:
+        npdata[np.random.random(size=M) < 0.3] = np.nan
+
+    data = ResidentData(npdata, isFullyObserved=isFullyObserved)
+    features = data.input_fn()
+    assert(features["train"].get_shape().as_list() == list(M))
+
+    # the data is loaded into local variables that are not checkpointed
+    assert(len(tf.global_variables()) == 0)
+    with tf.Session() as sess:
+        sess.run(tf.local_variables_initializer())
+        data.load(sess)
+        train, scrubbed = sess.run([features["train"], features["scrubbed"]])
+
+    nans = np.isnan(npdata)
+    assert(np.all(scrubbed[nans] == 0.))
+    assert(np.all(scrubbed[~nans] == npdata[~nans]))
+    if not isFullyObserved:
+        assert(np.all(np.isnan(train[nans])))
+    tf.reset_default_graph()
+
+
+class StepTimer(tf.train.SessionRunHook):
+    """Records the duration of each training step."""
+    def __init__(self):
+        self.times = []
+
+    def before_run(self, run_context):
+        self.__t0 = time.time()
+
+    def after_run(self, run_context, run_values):
+        self.times.append(time.time() - self.__t0)
+
+
+@pytest.mark.slow
+def test_stepTime(tmpdir):
+    """Benchmarks a step with fed and with resident data."""
+    M_train, K, nSteps = (4000, 2000), 3, 50
+    lrData = LowRank(rank=K, M_train=M_train, M_test=(10, M_train[1]))
+    times = {}
+    for resident in [False, True]:
+        tefa = TensorFactorisation.getEstimator(
+            priors=(CenNormal(), CenNormal()), K=K,
+            path=str(tmpdir.mkdir(f"model{resident}")),
+            stopCriterionInit=LlhStall(nSteps),
+            stopCriterionEM=LlhStall(nSteps),
+            stopCriterionBCD=LlhStall(nSteps),
+            checkpoints="off", summarySteps=None)
+        timer = StepTimer()
+        if resident:
+            data = lrData.training_resident
+            hooks = [timer, data.hook]
+            input_fn = data.input_fn
+        else:
+            hooks = [timer]
+            input_fn = lrData.training_input_fn
+        tefa.train(input_fn=input_fn, steps=nSteps, hooks=hooks)
+        times[resident] = np.median(timer.times[1:])
+    print(f"step time fed {times[False]:.4f}s, "
+          f"resident {times[True]:.4f}s")
+    assert(times[True] < times[False])
@@ -0,0 +1,28 @@
+import numpy as np
+
+from decompose.data.rowBlocks import RowBlocks
+
+
+def test_blocks(tmpdir):
+    M, blockSize = (23, 7), 5
+    npdata = np.random.normal(size=M)
+    path = str(tmpdir.join("data.npy"))
+    np.save(path, npdata)
+
+    rowBlocks = RowBlocks(path, blockSize=blockSize, dtype=np.float64,
+                          shuffle=True, seed=0)
+    assert(rowBlocks.shape == M)
+    assert(rowBlocks.nBlocks == 5)
+
+    # every row is served once per epoch and blocks have the same size
+    blocks = rowBlocks.blocks()
+    served = np.zeros(M[0])
+    for b in range(rowBlocks.nBlocks):
+        block = next(blocks)
+        assert(block["train"].shape == (blockSize, M[1]))
+        assert(np.allclose(block["train"], npdata[block["rows"]]))
+        served[block["rows"]] += 1
+    assert(np.all(served >= 1))
+    assert(np.sum(served) == rowBlocks.nBlocks*blockSize)
+
+    assert(np.allclose(rowBlocks.var(), np.var(npdata)))
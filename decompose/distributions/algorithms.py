@@ -1,8 +1,15 @@
-from typing import Tuple, Dict
+from typing import Dict
 import tensorflow as tf
 from tensorflow import Tensor
 
 
+FIT_ITERATIONS = "fitIterations"
+"""Key under which `fit` may return the number of iterations it needed.
+
+`Distribution.fit` records this number in a local variable of the same
+name which is added to the collection `FIT_ITERATIONS` of the graph."""
+
+
 class Algorithms(object):
 
     def __init__(self):
@@ -1,4 +1,4 @@
-from typing import Tuple, Dict
+from typing import Tuple, Dict, List
 import numpy as np
 import tensorflow as tf
 from tensorflow import Tensor
@@ -27,18 +27,107 @@ class CenNnFullyElasticNetAlgorithms(Algorithms):
         return(b, cenNnElasticnetParameters, exponentialParameters,
                lomaxParameters)
 
+    @classmethod
+    def components(cls, b: Tensor) -> Tensor:
+        """Index of the component selected by `b`.
+
+        The index is 0 for the elastic net, 1 for the exponential and 2
+        for the Lomax distribution.
+        """
+        zeros = tf.zeros_like(b, dtype=tf.int32)
+        components = tf.where(tf.equal(b, 0.), zeros,
+                              tf.where(tf.equal(b, 1.), zeros + 1,
+                                       zeros + 2))
+        return(components)
+
+    @classmethod
+    def partition(cls, b: Tensor, x: Tensor) -> List[Tensor]:
+        """Splits the last axis of `x` into the components selected by `b`.
+
+        Arguments:
+            b: `Tensor` of shape `(K,)`, the component selectors.
+            x: `Tensor` whose last axis has length `K`.
+
+        Returns:
+            `List[Tensor]` with the elements of `x` of each component.
+        """
+        rank = x.get_shape().ndims
+        toFront = [rank-1] + list(range(rank-1))
+        toBack = list(range(1, rank)) + [0]
+        parts = tf.dynamic_partition(tf.transpose(x, toFront),
+                                     cls.components(b), 3)
+        parts = [tf.transpose(part, toBack) for part in parts]
+        return(parts)
+
+    @classmethod
+    def stitch(cls, b: Tensor, parts: List[Tensor]) -> Tensor:
+        """Merges the `parts` of the components, the inverse of `partition`.
+        """
+        rank = parts[0].get_shape().ndims
+        toFront = [rank-1] + list(range(rank-1))
+        toBack = list(range(1, rank)) + [0]
+        indices = tf.dynamic_partition(tf.range(tf.shape(b)[0]),
+                                       cls.components(b), 3)
+        x = tf.dynamic_stitch(indices, [tf.transpose(part, toFront)
+                                        for part in parts])
+        x = tf.transpose(x, toBack)
+        x.set_shape(parts[0].get_shape()[:-1].concatenate(b.get_shape()))
+        return(x)
+
+    @classmethod
+    def partitionParameters(cls, b: Tensor, parameters: Dict[str, Tensor]
+                            ) -> List[Dict[str, Tensor]]:
+        """Splits the parameters of a component as in `partition`."""
+        ones = tf.ones_like(b)
+        partitioned = [{}, {}, {}]  # type: List[Dict[str, Tensor]]
+        for name, value in parameters.items():
+            for part, valuePart in zip(partitioned,
+                                       cls.partition(b, value*ones)):
+                part[name] = valuePart
+        return(partitioned)
+
+    @classmethod
+    def evaluate(cls, parameters: Dict[str, Tensor], data: Tensor,
+                 methodName: str) -> Tensor:
+        """Evaluates a method only for the component selected per element.
+
+        The columns of `data` are partitioned by `b`, each column is
+        passed to the method of its component only and the results are
+        merged.
+        """
+        params = cls.getParameters(parameters=parameters)
+        b, cenNnElasticnetParams, exponentialParams, lomaxParams = params
+        data = data*tf.ones_like(b)
+
+        dataParts = cls.partition(b, data)
+        elasticNetParts = cls.partitionParameters(b, cenNnElasticnetParams)
+        exponentialParts = cls.partitionParameters(b, exponentialParams)
+        lomaxParts = cls.partitionParameters(b, lomaxParams)
+
+        results = [
+            getattr(CenNnElasticNetAlgorithms, methodName)(
+                elasticNetParts[0], dataParts[0]),
+            getattr(ExponentialAlgorithms, methodName)(
+                exponentialParts[1], dataParts[1]),
+            getattr(LomaxAlgorithms, methodName)(
+                lomaxParts[2], dataParts[2])]
+        return(cls.stitch(b, results))
+
     @classmethod
     def sample(cls, parameters: Dict[str, Tensor], nSamples: Tensor) -> Tensor:
         params = cls.getParameters(parameters=parameters)
         b, cenNnElasticnetParams, exponentialParams, lomaxParams = params
 
-        rLomax = LomaxAlgorithms.sample(lomaxParams, nSamples)
-        rExponential = ExponentialAlgorithms.sample(exponentialParams, nSamples)
-        rElasticNet = CenNnElasticNetAlgorithms.sample(cenNnElasticnetParams, nSamples)
-        b = b * tf.ones_like(rLomax)
-        r = tf.where(tf.equal(b, 0.), rElasticNet,
-                     tf.where(tf.equal(b, 1.), rExponential, rLomax))
+        elasticNetParts = cls.partitionParameters(b, cenNnElasticnetParams)
+        exponentialParts = cls.partitionParameters(b, exponentialParams)
+        lomaxParts = cls.partitionParameters(b, lomaxParams)
 
+        rElasticNet = CenNnElasticNetAlgorithms.sample(elasticNetParts[0],
+                                                       nSamples)
+        rExponential = ExponentialAlgorithms.sample(exponentialParts[1],
+                                                    nSamples)
+        rLomax = LomaxAlgorithms.sample(lomaxParts[2], nSamples)
+        r = cls.stitch(b, [rElasticNet, rExponential, rLomax])
         return(r)
 
     @classmethod
@@ -48,16 +137,7 @@ class CenNnFullyElasticNetAlgorithms(Algorithms):
 
     @classmethod
     def pdf(cls, parameters: Dict[str, Tensor], data: Tensor) -> Tensor:
-        params = cls.getParameters(parameters=parameters)
-        b, cenNnElasticnetParams, exponentialParams, lomaxParams = params
-
-        pdfLomax = LomaxAlgorithms.pdf(lomaxParams, data)
-        pdfExponential = ExponentialAlgorithms.pdf(exponentialParams, data)
-        pdfElasticNet = CenNnElasticNetAlgorithms.pdf(cenNnElasticnetParams,
-                                                      data)
-        b = b[None]*tf.ones_like(pdfElasticNet)
-        pdf = tf.where(tf.equal(b, 0.), pdfElasticNet,
-                       tf.where(tf.equal(b, 1.), pdfExponential, pdfLomax))
+        pdf = cls.evaluate(parameters, data, "pdf")
         return(pdf)
 
     @classmethod
@@ -100,16 +180,7 @@ class CenNnFullyElasticNetAlgorithms(Algorithms):
 
     @classmethod
     def llh(cls, parameters: Dict[str, Tensor], data: tf.Tensor) -> float:
-        params = cls.getParameters(parameters=parameters)
-        b, cenNnElasticnetParams, exponentialParams, lomaxParams = params
-
-        llhLomax = LomaxAlgorithms.llh(lomaxParams, data)
-        llhExponential = ExponentialAlgorithms.llh(exponentialParams, data)
-        llhElasticNet = CenNnElasticNetAlgorithms.llh(cenNnElasticnetParams,
-                                                      data)
-        b = b[None]*tf.ones_like(llhElasticNet)
-        llh = tf.where(tf.equal(b, 0.), llhElasticNet,
-                       tf.where(tf.equal(b, 1.), llhExponential, llhLomax))
+        llh = cls.evaluate(parameters, data, "llh")
         return(llh)
 
     @classmethod
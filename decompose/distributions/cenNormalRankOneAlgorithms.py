@@ -3,7 +3,7 @@ import numpy as np
 import tensorflow as tf
 from tensorflow import Tensor
 
-from decompose.distributions.algorithms import Algorithms
+from decompose.distributions.algorithms import Algorithms, FIT_ITERATIONS
 
 
 class CenNormalRankOneAlgorithms(Algorithms):
@@ -35,22 +35,40 @@ class CenNormalRankOneAlgorithms(Algorithms):
         return(pdf)
 
     @classmethod
-    def fitGamma(cls, tau):
-        alpha = 0.5/(tf.log(tf.reduce_mean(tau))
-                     + 1e-6  # added due to numerical instability
-                     - tf.reduce_mean(tf.log(tau)))
-        for i in range(20):
-            alpha = (1. / (1./alpha
-                           + (tf.reduce_mean(tf.log(tau))
-                              - tf.log(tf.reduce_mean(tau))
-                              + tf.log(alpha)
-                              - tf.digamma(alpha))
-                           / (alpha**2*(1./alpha
-                                        - tf.polygamma(tf.ones_like(alpha),
-                                                       alpha)))))
-
-        beta = alpha/tf.reduce_mean(tau)
-        return(alpha, beta)
+    def fitGamma(cls, tau: Tensor, maxIterations: int = 20,
+                 tol: float = 1e-6) -> Tuple[Tensor, Tensor, Tensor]:
+        """ML estimate of a gamma distribution given the samples `tau`.
+
+        The Newton iterations on the shape `alpha` run in a
+        `tf.while_loop` on the sufficient statistics of `tau` and stop
+        once the relative change of `alpha` is below `tol` or after
+        `maxIterations` iterations.
+
+        Returns:
+            The shape, the rate and the number of Newton iterations.
+        """
+        meanTau = tf.reduce_mean(tau)
+        s = tf.log(meanTau) - tf.reduce_mean(tf.log(tau))
+        alpha = 0.5/(s + 1e-6)  # added due to numerical instability
+
+        def cond(i, alpha, converged):
+            return(tf.logical_and(tf.less(i, maxIterations),
+                                  tf.logical_not(converged)))
+
+        def body(i, alpha, converged):
+            alphaNew = (1. / (1./alpha
+                              + (tf.log(alpha) - tf.digamma(alpha) - s)
+                              / (alpha**2*(1./alpha
+                                           - tf.polygamma(tf.ones_like(alpha),
+                                                          alpha)))))
+            converged = tf.less_equal(tf.abs(alphaNew - alpha), tol*alpha)
+            return(i+1, alphaNew, converged)
+
+        loop_vars = [tf.constant(0), alpha, tf.constant(False)]
+        iterations, alpha, _ = tf.while_loop(cond, body, loop_vars)
+
+        beta = alpha/meanTau
+        return(alpha, beta, iterations)
 
     @classmethod
     def fit(cls, parameters: Dict[str, Tensor],
@@ -62,8 +80,8 @@ class CenNormalRankOneAlgorithms(Algorithms):
         tau0, tau1 = parameters["tau0"], parameters["tau1"]
 
         # hyperparameter optimization
-        alpha0, beta0 = cls.fitGamma(tau0)
-        alpha1, beta1 = cls.fitGamma(tau1)
+        alpha0, beta0, iterations0 = cls.fitGamma(tau0)
+        alpha1, beta1, iterations1 = cls.fitGamma(tau1)
 
         # sampling taus
         alphaPost0 = alpha0 + N/2
@@ -85,7 +103,8 @@ class CenNormalRankOneAlgorithms(Algorithms):
         tau0 = tau0/normTau0*normPerFactor
         tau1 = tau1/normTau1*normPerFactor
 
-        updatedParameters = {"tau0": tau0, "tau1": tau1}
+        updatedParameters = {"tau0": tau0, "tau1": tau1,
+                             FIT_ITERATIONS: iterations0 + iterations1}
         return(updatedParameters)
 
     @classmethod
@@ -3,6 +3,7 @@ import numpy as np
 import tensorflow as tf
 from tensorflow import Tensor
 
+from decompose.distributions.algorithms import FIT_ITERATIONS
 from decompose.distributions.tAlgorithms import TAlgorithms
 
 
@@ -43,28 +44,11 @@ class CenTAlgorithms(TAlgorithms):
     def fit(cls, parameters: Dict[str, Tensor],
             data: tf.Tensor) -> Dict[str, Tensor]:
         Psi, nu = parameters["Psi"], parameters["nu"]
-
-        p = 1.
-
-        n = data.get_shape()[0].value
-        Y = data
-        for i in range(5):
-            delta = Y**2/Psi
-            w = (nu + p)/(nu + delta)
-
-            PsiNew = tf.reduce_mean(w*Y**2, axis=0)
-            cond = tf.logical_and(tf.is_finite(PsiNew),
-                                  tf.greater(PsiNew, 1e-6))
-            Psi = tf.where(cond, PsiNew, Psi*tf.ones_like(PsiNew))
-
-            delta = Y**2/Psi
-            nuNew = cls.nuStep(nu, n, delta)
-            cond = tf.logical_and(tf.is_finite(nuNew),
-                                  tf.greater(nuNew, 0.))
-            nu = tf.where(cond, nuNew, nu*tf.ones_like(nuNew))
-
-        tau = w
-        updatedParameters = {"nu": nu, "Psi": Psi, "tau": tau}
+        mu = tf.zeros_like(Psi)
+        _, Psi, nu, iterations = cls.fitEm(data, mu, Psi, nu, centered=True)
+        tau = cls.fitLatents({"Psi": Psi, "nu": nu}, data)["tau"]
+        updatedParameters = {"nu": nu, "Psi": Psi, "tau": tau,
+                             FIT_ITERATIONS: iterations}
         return(updatedParameters)
 
     @classmethod
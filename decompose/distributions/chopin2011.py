@@ -1,25 +1,14 @@
-import numpy as np
+import weakref
 from numpy.random import uniform as rand, normal as randn, randint as randi
 from numpy import sqrt, pi, exp, log, floor, array
 from scipy.special import erf
 import scipy as sp
 import scipy.stats
 import tensorflow as tf
+from tensorflow.python.framework import ops
 from decompose.distributions.tfppf import tfppf
 
 
-def updateTensor(x, mask, newValues):
-    if (x.dtype == tf.float32) or (x.dtype == tf.float64):
-        indices = tf.cast(tf.where(mask), dtype=tf.int32)
-        newValuesExpanded = tf.scatter_nd(indices,  newValues, tf.shape(x))
-        updatedX = tf.where(mask, newValuesExpanded, x)
-    else:
-        indices = tf.cast(tf.where(mask), dtype=tf.int32)
-        newValuesExpanded = tf.cast(tf.scatter_nd(indices,  tf.cast(newValues, dtype=tf.float32), tf.shape(x)), dtype=x.dtype)
-        updatedX = tf.where(mask, newValuesExpanded, x)
-    return(updatedX)
-
-
 def randint(low, high):
     intervalLength = high-low
     r = tf.random_uniform(shape=tf.shape(low))
@@ -27,96 +16,99 @@ def randint(low, high):
     return(r)
 
 
-def gather(data, indexes):
-    if (data.dtype == tf.int32) or (data.dtype == tf.int64):
-        return(tf.cast(tf.gather(tf.cast(data, dtype=tf.float32),
-                                 indexes),
-                       dtype=data.dtype))
-    else:
-        return(tf.gather(data, indexes))
-
-def gather_nd(data, indexes):
-    if (data.dtype == tf.int32) or (data.dtype == tf.int64):
-        return(tf.cast(tf.gather_nd(tf.cast(data, dtype=tf.float32),
-                                    indexes),
-                       dtype=data.dtype))
-    else:
-        return(tf.gather_nd(data, indexes))
+def rejectionSamplingExp(a, b, active=None, maxIterations=100):
+    """Rejection sampling with a truncated exponential proposal.
 
-def count_nonzero(data, axis, keep_dims=False, dtype=tf.int32):
-    # nNotValid = tf.count_nonzero(data, axis=-1, keep_dims=True)  # does not work on GPU!
-    return(tf.reduce_sum(tf.cast(data, dtype=dtype),
-                         axis=axis,
-                         keep_dims=keep_dims))
+    Only the elements in `active` are resampled, at most `maxIterations`
+    times. The samples of the other elements are meaningless.
 
-
-def rejectionSamplingExp(a, b):
+    Returns:
+        The offsets `z` of the samples `a - z/a` and whether they have
+        been accepted. Inactive elements count as accepted.
+    """
     dtype = a.dtype
+    if active is None:
+        active = tf.ones_like(a, dtype=tf.bool)
 
     twoasq = 2*a**2
     expab = tf.exp(-a*(b-a)) - 1.
 
-    z = tf.log(1 + tf.random_uniform(shape=tf.shape(a), dtype=dtype)*expab)
-    e = -tf.log(tf.random_uniform(shape=tf.shape(a), dtype=dtype))
+    def propose():
+        u = tf.random_uniform(shape=tf.shape(a), dtype=dtype)
+        z = tf.log(1. + u*expab)
+        e = -tf.log(tf.random_uniform(shape=tf.shape(a), dtype=dtype))
+        return(z, e)
+
+    def notOk(z, e):
+        return(tf.logical_and(active, tf.logical_not(twoasq*e > z**2)))
 
-    def notStop(z, e):
-        stop = tf.reduce_all((twoasq*e > z ** 2))
-        notStop = tf.logical_not(stop)
-        return(notStop)
+    def notStop(i, z, e):
+        return(tf.logical_and(tf.less(i, maxIterations),
+                              tf.reduce_any(notOk(z, e))))
 
-    def body(z, e):
-        notOk = tf.logical_not(twoasq*e > z ** 2)
-        whereNotOk = tf.where(notOk)
-        nNotOk = count_nonzero(notOk, dtype=tf.int32, axis=-1, keep_dims=True)
+    def body(i, z, e):
+        resample = notOk(z, e)
+        zNew, eNew = propose()
+        z = tf.where(resample, zNew, z)
+        e = tf.where(resample, eNew, e)
+        return(i+1, z, e)
 
-        u = tf.random_uniform(shape=nNotOk, dtype=dtype)
-        expabNotOk = tf.gather(expab, whereNotOk)[..., 0]
-        zUpdates = tf.log(1. + u*expabNotOk)
-        z = updateTensor(z, notOk, zUpdates)
+    z, e = propose()
+    _, z, e = tf.while_loop(notStop, body, loop_vars=[tf.constant(0), z, e])
+    accepted = tf.logical_not(notOk(z, e))
+    return(z, accepted)
 
-        u = tf.random_uniform(shape=nNotOk, dtype=dtype)
-        eUpdates = -tf.log(u)
-        e = updateTensor(e, notOk, eUpdates)
-        return(z, e)
 
-    z, e = tf.while_loop(notStop, body, loop_vars=[z, e])
+def rejectionSamplingNorm(a, b, active=None, maxIterations=100):
+    """Rejection sampling with a standard normal proposal.
 
-    #r = a - z/a
-    r = z
-    return(r)
+    Only the elements in `active` are resampled, at most `maxIterations`
+    times. The samples of the other elements are meaningless.
 
-def rejectionSamplingNorm(a, b):
+    Returns:
+        The samples and whether they have been accepted. Inactive
+        elements count as accepted.
+    """
     dtype = a.dtype
+    if active is None:
+        active = tf.ones_like(a, dtype=tf.bool)
 
-    r = tf.random_normal(shape=tf.shape(a), dtype=dtype)
+    def notOk(r):
+        return(tf.logical_and(active,
+                              tf.logical_not((r >= a) & (r <= b))))
 
-    def notStop(r):
-        stop = tf.reduce_all((r>=a) & (r<=b))
-        notStop = tf.logical_not(stop)
-        return(notStop)
+    def notStop(i, r):
+        return(tf.logical_and(tf.less(i, maxIterations),
+                              tf.reduce_any(notOk(r))))
 
-    def body(r):
-        notOk = tf.logical_not((r>=a) & (r<=b))
-        whereNotOk = tf.where(notOk)
-        nNotOk = count_nonzero(notOk, dtype=tf.int32, axis=-1, keep_dims=True)
+    def body(i, r):
+        n = tf.random_normal(shape=tf.shape(a), dtype=dtype)
+        r = tf.where(notOk(r), n, r)
+        return(i+1, r)
 
-        n = tf.random_normal(shape=nNotOk, dtype=r.dtype)
-        r = updateTensor(r, notOk, n)
-        return(r)
+    r = tf.random_normal(shape=tf.shape(a), dtype=dtype)
+    _, r = tf.while_loop(notStop, body, loop_vars=[tf.constant(0), r])
+    accepted = tf.logical_not(notOk(r))
+    return(r, accepted)
 
-    r = tf.while_loop(notStop, body, loop_vars=[r])
-    return(r)
-#    return(tf.abs(r))
 
 def ppf(a, b):
-    # use ppf method
-    norm = tf.contrib.distributions.Normal(loc=tf.constant(0.,dtype=a.dtype),
-                                           scale=tf.constant(1., dtype=a.dtype))
-    f = norm.cdf(a)
-    t = norm.cdf(b)
-    u = tf.random_uniform(shape=tf.shape(a), dtype=a.dtype)*(t-f)+f
+    """Inverse CDF sampling of the standard normal truncated to `[a, b]`.
+
+    Intervals with positive `a` are reflected to the lower tail, where
+    the CDF does not lose precision.
+    """
+    dtype = a.dtype
+    norm = tf.distributions.Normal(loc=tf.constant(0., dtype=dtype),
+                                   scale=tf.constant(1., dtype=dtype))
+    upper = tf.greater(a, 0.)
+    f = norm.cdf(tf.where(upper, -b, a))
+    t = norm.cdf(tf.where(upper, -a, b))
+    u = tf.random_uniform(shape=tf.shape(a), dtype=dtype)*(t-f)+f
     r = tfppf(u)
-    return r
+    r = tf.where(upper, -r, r)
+    return(r)
+
 
 def rightTail(a, b):
     xmin, xmax, kmin, INCH, I0, ALPHA, N, yl0, ylN, x, yu, ncell = getConsts(a.dtype)
@@ -129,69 +121,73 @@ def rightTail(a, b):
                               tf.less(z, b-lbound))
     return(r, accepted)
 
-def getConsts(dtype):
-    xmin = tf.constant(-2.00443204036, dtype=dtype)
-    xmax = tf.constant(3.48672170399, dtype=dtype)
-    kmin = tf.constant(5, dtype=tf.int32)                        # if kb-ka < kmin then use a rejection algorithm
-    INVH = tf.constant(1631.73284006, dtype=dtype)            # 1/h, h being the minimal interval range
-    I0 = tf.constant(3271, dtype=tf.int32)                       # = - floor(x(1)/h)
-    ALPHA = tf.constant(1.837877066409345, dtype=dtype)       # = log(2*pi)
-    N = tf.constant(4000, dtype=tf.int32)                        # Index of the right tail
-    yl0 = tf.constant(0.053513975472, dtype=dtype)            # y_l of the leftmost rectangle
-    ylN = tf.constant(0.000914116389555, dtype=dtype)         # y_l of the rightmost rectangle
-    x2 = tf.constant(x, dtype=dtype)
-    yu2 = tf.constant(yu, dtype=dtype)
-    ncell2 = tf.constant(ncell, dtype=tf.int32)
-    return(xmin, xmax, kmin, INVH, I0, ALPHA, N, yl0, ylN, x2, yu2, ncell2)
 
-def twoRegions(a, b, k):
-    xmin, xmax, kmin, INCH, I0, ALPHA, N, yl0, ylN, x, yu, ncell = getConsts(a.dtype)
+__consts = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary
 
-    xk = tf.gather(x, k)
-    xkp1 = tf.gather(x, k+1)
-    sim = xk + (xkp1-xk) * tf.random_uniform(shape=tf.shape(a), dtype=a.dtype)
-    c0 = tf.logical_and(tf.greater_equal(sim, a),
-                        tf.less_equal(sim, b))
-    yuk = tf.gather(yu, k)
-    kp1 = tf.where(tf.equal(k, N), N*tf.ones_like(k), k+1)
-    yukp1 = tf.gather(yu, kp1)
-    km1 = tf.where(tf.equal(k, 0), 0*tf.ones_like(k), k-1)
-    yukm1 = tf.gather(yu, km1)
-    simy = yuk*tf.random_uniform(shape=tf.shape(a), dtype=a.dtype)
 
-    # Compute y_l from y_k
-    useKeq0 = tf.equal(k, 0)
-    useKeqN = tf.logical_and(tf.equal(k, N),
-                             tf.logical_not(useKeq0))
+def getConsts(dtype):
+    """Constants and tables of the sampler as tensors of type `dtype`.
 
-    useleq1954 = tf.logical_and(tf.less_equal(k, 1954),
-                                tf.logical_and(tf.logical_not(useKeqN),
-                                               tf.logical_not(useKeq0)))
-    useelse = tf.logical_and(tf.logical_not(useKeq0),
-                             tf.logical_and(tf.logical_not(useKeqN),
-                                            tf.logical_not(useleq1954)))
+    The tensors are created only once per graph and dtype. They are
+    created outside of any control flow context such that they can be
+    shared by all samplers of the graph, e.g. also by samplers in the
+    body of different `tf.while_loop`s.
+    """
+    dtype = tf.as_dtype(dtype)
+    constsOfGraph = __consts.setdefault(tf.get_default_graph(), {})
+    if dtype in constsOfGraph:
+        return(constsOfGraph[dtype])
+
+    with ops.init_scope(), tf.name_scope("chopin2011/"):
+        xmin = tf.constant(-2.00443204036, dtype=dtype)
+        xmax = tf.constant(3.48672170399, dtype=dtype)
+        kmin = tf.constant(5, dtype=tf.int32)                        # if kb-ka < kmin then use a rejection algorithm
+        INVH = tf.constant(1631.73284006, dtype=dtype)            # 1/h, h being the minimal interval range
+        I0 = tf.constant(3271, dtype=tf.int32)                       # = - floor(x(1)/h)
+        ALPHA = tf.constant(1.837877066409345, dtype=dtype)       # = log(2*pi)
+        N = tf.constant(4001, dtype=tf.int32)                        # Index of the right tail
+        yl0 = tf.constant(0.053513975472, dtype=dtype)            # y_l of the leftmost rectangle
+        ylN = tf.constant(0.000914116389555, dtype=dtype)         # y_l of the rightmost rectangle
+        x2 = tf.constant(x, dtype=dtype)
+        yu2 = tf.constant(yu, dtype=dtype)
+        ncell2 = tf.constant(ncell, dtype=tf.int32)
+    consts = (xmin, xmax, kmin, INVH, I0, ALPHA, N, yl0, ylN, x2, yu2, ncell2)
+    constsOfGraph[dtype] = consts
+    return(consts)
+
+
+def lowerHeights(k, dtype):
+    """Returns `x[k]`, `x[k+1]`, `y_u[k]` and `y_l[k]` of the rectangles `k`.
+
+    The rectangles are `0, ..., N-1`, the right tail `N` is clipped to
+    the rightmost rectangle such that all gathers are valid.
+    """
+    xmin, xmax, kmin, INVH, I0, ALPHA, N, yl0, ylN, x, yu, ncell = getConsts(dtype)
 
-    ylk = tf.zeros_like(a)
+    k = tf.minimum(k, N-1)
+    kp1 = k+1
+    km1 = tf.maximum(k-1, 0)
+    xk = tf.gather(x, k)
+    xkp1 = tf.gather(x, kp1)
+    yuk = tf.gather(yu, k)
 
-    nKeq0 = count_nonzero(useKeq0, dtype=tf.int32, axis=-1, keep_dims=True)
-    ylk = tf.cond(nKeq0[0]>0,
-                  lambda: updateTensor(ylk, useKeq0, yl0*tf.ones(shape=nKeq0, dtype=a.dtype)),
-                  lambda: ylk)
+    # Compute y_l from y_k, the density is maximal in rectangle 1953
+    ylk = tf.where(tf.less_equal(k, 1953),
+                   tf.gather(yu, km1),
+                   tf.gather(yu, tf.minimum(kp1, N-1)))
+    ylk = tf.where(tf.equal(k, N-1), ylN*tf.ones_like(ylk), ylk)
+    ylk = tf.where(tf.equal(k, 0), yl0*tf.ones_like(ylk), ylk)
+    return(xk, xkp1, yuk, ylk)
 
-    nKeqN = count_nonzero(useKeqN, dtype=tf.int32, axis=-1, keep_dims=True)
-    ylk = tf.cond(nKeqN[0]> 0,
-                  lambda: updateTensor(ylk, useKeqN, ylN*tf.ones(nKeqN, dtype=a.dtype)),
-                  lambda: ylk)
 
-    nUseleq1954 = count_nonzero(useleq1954, dtype=tf.int32, axis=-1, keep_dims=True)
-    ylk = tf.cond(nUseleq1954[0] > 0,
-                  lambda: updateTensor(ylk, useleq1954, tf.gather_nd(yukm1, tf.where(useleq1954))),
-                  lambda: ylk)
+def twoRegions(a, b, k):
+    xmin, xmax, kmin, INCH, I0, ALPHA, N, yl0, ylN, x, yu, ncell = getConsts(a.dtype)
 
-    nUseelse = count_nonzero(useelse, dtype=tf.int32, axis=-1, keep_dims=True)
-    ylk = tf.cond(nUseelse[0] > 0,
-                  lambda: updateTensor(ylk, useelse, tf.gather_nd(yukp1, tf.where(useelse))),
-                  lambda: ylk)
+    xk, xkp1, yuk, ylk = lowerHeights(k, a.dtype)
+    sim = xk + (xkp1-xk) * tf.random_uniform(shape=tf.shape(a), dtype=a.dtype)
+    c0 = tf.logical_and(tf.greater_equal(sim, a),
+                        tf.less_equal(sim, b))
+    simy = yuk*tf.random_uniform(shape=tf.shape(a), dtype=a.dtype)
 
     c1 = tf.logical_or(tf.less(simy, ylk),
                        tf.less((sim**2 + 2*tf.log(simy) + ALPHA), 0))
@@ -204,349 +200,129 @@ def allOther(a, b, k):
     xmin, xmax, kmin, INVH, I0, ALPHA, N, yl0, ylN, x, yu, ncell = getConsts(a.dtype)
 
     u = tf.random_uniform(shape=tf.shape(a), dtype=a.dtype)
-    #yuk = tf.gather(yu, tf.where(k<0, k+4001, k))
-
-    yuk = tf.gather(yu, k)
-    kp1 = tf.where(tf.equal(k, N), N*tf.ones_like(k), k+1)
-    yukp1 = tf.gather(yu, kp1)
-    km1 = tf.where(tf.equal(k, 0), 0*tf.ones_like(k), k-1)
-    yukm1 = tf.gather(yu, km1)
-
-
+    xk, xkp1, yuk, ylk = lowerHeights(k, a.dtype)
     simy = yuk * u
-    xkp1 = tf.gather(x, kp1)
-    xk = tf.gather(x, k)
-
     d = xkp1 - xk
 
-    # Compute y_l from y_k
-    useKeq1 = tf.equal(k, 1)
-    useKeqN = tf.logical_and(tf.equal(k, N), tf.logical_not(useKeq1))
-    useleq1954 = tf.logical_and(tf.logical_not(tf.greater(k, 1954)),
-                                tf.logical_and(tf.logical_not(useKeqN),
-                                               tf.logical_not(useKeq1)))
-    useelse = tf.logical_and(tf.logical_not(useKeq1),
-                             tf.logical_and(tf.logical_not(useKeqN),
-                                            tf.logical_not(useleq1954)))
-
-    ylk = tf.zeros_like(a)
-
-    #ylk[useKeq0] = yl0
-    nKeq1 = count_nonzero(useKeq1, dtype=tf.int32, axis=-1, keep_dims=True)
-    ylk = tf.cond(nKeq1[0]>0,
-                  lambda: updateTensor(ylk, useKeq1, yl0*tf.ones(shape=nKeq1, dtype=a.dtype)),
-                  lambda: ylk)
-
-    #ylk[useKeqN] = ylN
-    nKeqN = count_nonzero(useKeqN, dtype=tf.int32, axis=-1, keep_dims=True)
-    ylk = tf.cond(nKeqN[0]> 0,
-                  lambda: updateTensor(ylk, useKeqN, ylN*tf.ones(nKeqN, dtype=a.dtype)),
-                  lambda: ylk)
-
-    #ylk[useleq1954] = yu[k[useleq1954]-1]
-    nUseleq1954 = count_nonzero(useleq1954, dtype=tf.int32, axis=-1, keep_dims=True)
-    ylk = tf.cond(nUseleq1954[0] > 0,
-                  lambda: updateTensor(ylk, useleq1954, gather_nd(yukm1, tf.where(useleq1954))),
-                  lambda: ylk)
-
-    #ylk[useelse] = yu[k[useelse]+1]
-    nUseelse = count_nonzero(useelse, dtype=tf.int32, axis=-1, keep_dims=True)
-    ylk = tf.cond(nUseelse[0] > 0,
-                  lambda: updateTensor(ylk, useelse, gather_nd(yukp1, tf.where(useelse))),
-                  lambda: ylk)
-
     c0 = tf.less(simy, ylk)
-    r = tf.zeros_like(a)
-    r = updateTensor(r, c0, tf.gather(xk + u*d*yuk/ylk, tf.where(c0))[..., 0])
-    #r[c0] = (xk + u*d*yuk/ylk)[c0]
-
     sim = xk + d * tf.random_uniform(shape=tf.shape(a), dtype=a.dtype)
     c1 = tf.logical_and(tf.less((sim**2 + 2*tf.log(simy) + ALPHA), 0),
                         tf.logical_not(c0))
-    r = updateTensor(r, c1, tf.gather(sim, tf.where(c1))[..., 0])
-    #r[c1] = sim[c1]
+    r = tf.where(c0, xk + u*d*yuk/ylk, tf.where(c1, sim, tf.zeros_like(a)))
 
     accepted = tf.logical_or(c0, c1)
     return(r, accepted)
 
 
-def chopin(aAll, bAll):
-    dtype = aAll.dtype
+def chopin(aAll, bAll, active=None, maxIterations=100):
+    """Chopin's (2011) sampler for `xmin <= a <= xmax`.
+
+    All regions are evaluated on the whole vectors and the results are
+    selected with `tf.where`. Only the elements in `active` are sampled,
+    the samples of the other elements are meaningless. Each rejection
+    loop runs at most `maxIterations` times.
+
+    Returns:
+        The samples, whether they are offsets of an exponential rejection
+        sampler (see `rejectionSamplingExp`) and whether they have been
+        accepted. Inactive elements count as accepted.
+    """
+    if active is None:
+        active = tf.ones_like(aAll, dtype=tf.bool)
     rAll = tf.zeros_like(aAll)
     # Design variables
     xmin, xmax, kmin, INVH, I0, ALPHA, N, yl0, ylN, x, yu, ncell = getConsts(aAll.dtype)
 
-    # Compute ka and kb
-    i = I0 + tf.cast(tf.floor(aAll*INVH), dtype=tf.int32)
+    # Compute ka and kb, the bounds are clipped such that the indices of
+    # the inactive elements are valid as well
+    i = I0 + tf.cast(tf.floor(tf.clip_by_value(aAll, xmin, xmax)*INVH),
+                     dtype=tf.int32)
     i = tf.where(tf.less(i, 0), i+8961, i)
-    ka = gather(ncell, i)                   # not: +1 due to index offset in Matlab ;-)
+    ka = tf.gather(ncell, i)                   # not: +1 due to index offset in Matlab ;-)
 
-    kb = tf.zeros_like(ka)
-
-    # kb[bAll>=xmax] = N
-    nBAllGtXmax = count_nonzero(tf.greater_equal(bAll, xmax), dtype=tf.int32, axis=-1, keep_dims=True)
-    kb = updateTensor(kb, bAll>=xmax, N*tf.ones(nBAllGtXmax, dtype=tf.int32))
-
-    i = I0 + tf.cast(tf.floor(bAll*INVH), dtype=tf.int32)
-    i = tf.where(i<0, i+8961, i)
-    #kb[bAll<xmax] = ncell[i[bAll<xmax]]
-    whereBAllLtXmax = tf.where(bAll<xmax)
-    kb = updateTensor(kb, bAll<xmax, gather_nd(ncell, gather(i, whereBAllLtXmax)))
+    i = I0 + tf.cast(tf.floor(tf.minimum(bAll, xmax)*INVH), dtype=tf.int32)
+    i = tf.where(tf.less(i, 0), i+8961, i)
+    kb = tf.where(tf.greater_equal(bAll, xmax), N*tf.ones_like(ka),
+                  tf.gather(ncell, i))
 
     ## rejection sampling
     # If |b-a| is small, use rejection algorithm with a truncated exponential proposal
-    useRejectionSamplingChopin = tf.logical_and(tf.less(tf.abs(kb-ka), kmin),
+    smallInterval = tf.logical_and(active, tf.less(tf.abs(kb-ka), kmin))
+    useRejectionSamplingChopin = tf.logical_and(smallInterval,
                                                 tf.greater(tf.abs(aAll), 0.1))
-    usePpfChopin = tf.logical_and(tf.less(tf.abs(kb-ka), kmin),
+    usePpfChopin = tf.logical_and(smallInterval,
                                   tf.less_equal(tf.abs(aAll), 0.1))
 
     ### useRejectionSamplingChopin
-    a = tf.gather(aAll, tf.where(useRejectionSamplingChopin))[..., 0]
-    b = tf.gather(bAll, tf.where(useRejectionSamplingChopin))[..., 0]
-    nRejectionSamplingChopin = count_nonzero(useRejectionSamplingChopin, dtype=tf.int32, axis=-1, keep_dims=True)
-    rAll = tf.cond(nRejectionSamplingChopin[0] > 0,
-                   lambda: updateTensor(rAll, useRejectionSamplingChopin, rejectionSamplingExp(a, b)),
-                   lambda: rAll)
+    def rejectionSampling():
+        z, accepted = rejectionSamplingExp(aAll, bAll,
+                                           useRejectionSamplingChopin,
+                                           maxIterations)
+        return(tf.where(useRejectionSamplingChopin, z, rAll), accepted)
+
+    rAll, acceptedRejection = tf.cond(
+        tf.reduce_any(useRejectionSamplingChopin), rejectionSampling,
+        lambda: (rAll, tf.ones_like(active)))
 
     ### usePpfChopin
-    a = tf.gather(aAll, tf.where(usePpfChopin))[..., 0]
-    b = tf.gather(bAll, tf.where(usePpfChopin))[..., 0]
-    nPpfChopin = count_nonzero(usePpfChopin, dtype=tf.int32, axis=-1, keep_dims=True)
-    rAll = tf.cond(nPpfChopin[0] > 0,
-                   lambda: updateTensor(rAll, usePpfChopin, ppf(a, b)),
+    rAll = tf.cond(tf.reduce_any(usePpfChopin),
+                   lambda: tf.where(usePpfChopin, ppf(aAll, bAll), rAll),
                    lambda: rAll)
 
-    useSamplingInteger = tf.logical_not(tf.logical_or(useRejectionSamplingChopin, usePpfChopin))
-    kAll = tf.zeros(shape=tf.shape(aAll), dtype=tf.int32)
-    acceptedAll = tf.zeros(shape=tf.shape(aAll), dtype=tf.int32)
-
-    nNotUseSamplingInteger = count_nonzero(tf.logical_not(useSamplingInteger), dtype=tf.int32, axis=-1, keep_dims=True)
-    acceptedAll = updateTensor(acceptedAll,
-                               tf.logical_not(useSamplingInteger),
-                               tf.ones(nNotUseSamplingInteger, dtype=tf.int32))
+    useSamplingInteger = tf.logical_and(active,
+                                        tf.logical_not(smallInterval))
+    acceptedAll = tf.logical_not(useSamplingInteger)
+    kAll = ka
+    retryAll = tf.zeros_like(acceptedAll)
 
-    def notAccepted(rAll, acceptedAll, kAll):
-        return(tf.logical_not(tf.reduce_all(tf.equal(acceptedAll, 1))))
+    def notAccepted(i, rAll, acceptedAll, kAll, retryAll):
+        return(tf.logical_and(tf.less(i, maxIterations),
+                              tf.logical_not(tf.reduce_all(acceptedAll))))
 
-    def body(rAll, acceptedAll, kAll):
+    def body(i, rAll, acceptedAll, kAll, retryAll):
         # Sample integer between ka and kb
         # Note that while matlab randi has including border, for numpy the high
         # border is exclusive. Hence add one.
-        kAllNotAccepted = randint(low=gather(ka, tf.where(tf.equal(acceptedAll, 0)))[..., 0],
-                                  high=gather(kb, tf.where(tf.equal(acceptedAll, 0)))[..., 0] + 1)
-
-        kAll = updateTensor(kAll, tf.equal(acceptedAll, 0), kAllNotAccepted)
-
-        notAcceptedAll = tf.equal(acceptedAll, 0)
-        useRightTail = tf.logical_and(useSamplingInteger,
-                                      tf.logical_and(notAcceptedAll,
-                                                     tf.equal(kAll, N)))
-        useTwoRegions = tf.logical_and(useSamplingInteger,
-                                       tf.logical_and(notAcceptedAll,
-                                                      tf.logical_and(tf.logical_not(tf.equal(kAll, N)),
-                                                                     tf.logical_or(tf.less_equal(kAll, ka+2),
-                                                                                   tf.logical_and(tf.greater_equal(kAll, kb),
-                                                                                                  tf.less(bAll, xmax)))))) #### ka
-        useAllOther = tf.logical_and(useSamplingInteger,
-                                     tf.logical_and(notAcceptedAll,
-                                                    tf.logical_and(tf.logical_not(useRightTail),
-                                                                   tf.logical_not(useTwoRegions))))
-
-
-        a = tf.gather(aAll, tf.where(useRightTail))[..., 0]
-        b = tf.gather(bAll, tf.where(useRightTail))[..., 0]
-        r, accepted = rightTail(a, b)
-        rAll = updateTensor(rAll, useRightTail, r)
-
-        acceptedAll = updateTensor(acceptedAll,
-                                   useRightTail,
-                                   tf.cast(accepted, dtype=tf.int32))
-
-        a = tf.gather(aAll, tf.where(useTwoRegions))[..., 0]
-        b = tf.gather(bAll, tf.where(useTwoRegions))[..., 0]
-        k = gather(kAll, tf.where(useTwoRegions))[..., 0]
-        r, accepted = twoRegions(a, b, k)
-        r = updateTensor(r, tf.logical_not(accepted),
-                         tf.ones(tf.reduce_sum(tf.cast(tf.logical_not(accepted), dtype=tf.int32), keep_dims=True),
-                                 dtype=r.dtype))
-
-        rAll = updateTensor(rAll, useTwoRegions, r)
-        acceptedAll = updateTensor(acceptedAll,
-                                   useTwoRegions,
-                                   tf.cast(accepted, dtype=tf.int32))
-
-        a = tf.gather(aAll, tf.where(useAllOther))[..., 0]
-        b = tf.gather(bAll, tf.where(useAllOther))[..., 0]
-        k = gather(kAll, tf.where(useAllOther))[..., 0]
-        r, accepted = allOther(a, b, k)
-        rAll = updateTensor(rAll, useAllOther, r)
-
-        acceptedAll = updateTensor(acceptedAll,
-                                   useAllOther,
-                                   tf.cast(accepted, dtype=tf.int32))
-
-        return(rAll, acceptedAll, kAll)
-
-
-    rAll, acceptedAll, kAll = tf.while_loop(notAccepted, body, loop_vars=[rAll, acceptedAll, kAll])
-    return(rAll, useRejectionSamplingChopin)
-
-def rtstdnorm(aAll, bAll):
-    r"""
-    RTNORM    Pseudorandom numbers from a truncated (normalized) Gaussian
-    distribution (i.e. rtnorm(a,b,0,1)).
-    """
-    rAll = tf.zeros_like(aAll)
-
-    xmin, xmax, kmin, INVH, I0, ALPHA, N, yl0, ylN, x, yu, ncell = getConsts(aAll.dtype)
-
-    useRejectionSamplingExp = tf.greater(aAll, xmax)
-    useRejectionSamplingNorm = tf.logical_and(tf.less_equal(aAll, xmax),
-                                              tf.less(aAll, xmin))
-    useChopin = tf.logical_and(tf.less_equal(aAll, xmax),
-                               tf.greater_equal(aAll, xmin))
-
-    ### useRejectionSamplingExp
-    a = tf.gather(aAll, tf.where(useRejectionSamplingExp))[..., 0]
-    b = tf.gather(bAll, tf.where(useRejectionSamplingExp))[..., 0]
-    r = rejectionSamplingExp(a, b)
-    rAll = updateTensor(rAll, useRejectionSamplingExp, r)
-
-    ### useRecetionSamplingNorm
-    a = tf.gather(aAll, tf.where(useRejectionSamplingNorm))[..., 0]
-    b = tf.gather(bAll, tf.where(useRejectionSamplingNorm))[..., 0]
-    r = rejectionSamplingNorm(a, b)
-    rAll = updateTensor(rAll, useRejectionSamplingNorm, r)
-
-    ### useChopin
-    a = tf.gather(aAll, tf.where(useChopin))[..., 0]
-    b = tf.gather(bAll, tf.where(useChopin))[..., 0]
-    r, useRejectionSamplingChopin = chopin(a, b)
-    rAll = updateTensor(rAll, useChopin, r)
-    useRejectionSamplingExp = updateTensor(useRejectionSamplingExp, useChopin, useRejectionSamplingChopin)
-
-    return(rAll, useRejectionSamplingExp)
-
-
-def rtnorm2(a=0., b=1., mu=np.array([0.]), sigma=np.array([1.]), size=1):
-    assert_op = tf.Assert(tf.reduce_all(tf.equal(a, 0.)), [a], name='aaaaa')
-    with tf.control_dependencies([assert_op]):
-        a = a + 0.
-    assert_op = tf.Assert(tf.reduce_all(sigma>0.), [sigma], name="sigma")
+        notAcceptedAll = tf.logical_not(acceptedAll)
+        kAll = tf.where(tf.logical_and(notAcceptedAll,
+                                       tf.logical_not(retryAll)),
+                        randint(low=ka, high=kb+1), kAll)
+
+        useRightTail = tf.equal(kAll, N)
+        useTwoRegions = tf.logical_and(tf.logical_not(useRightTail),
+                                       tf.logical_or(tf.less_equal(kAll, ka+2),
+                                                     tf.logical_and(tf.greater_equal(kAll, kb),
+                                                                    tf.less(bAll, xmax)))) #### ka
+
+        rRightTail, acceptedRightTail = rightTail(aAll, bAll)
+        rTwoRegions, acceptedTwoRegions = twoRegions(aAll, bAll, kAll)
+        rAllOther, acceptedAllOther = allOther(aAll, bAll, kAll)
+
+        r = tf.where(useRightTail, rRightTail,
+                     tf.where(useTwoRegions, rTwoRegions, rAllOther))
+        accepted = tf.where(useRightTail, acceptedRightTail,
+                            tf.where(useTwoRegions, acceptedTwoRegions,
+                                     acceptedAllOther))
+
+        # The mass of the right tail equals the area of a rectangle but
+        # its exponential envelope is larger. A proposal in the tail that
+        # is rejected by the density is therefore retried in the tail,
+        # otherwise the tail would be underrepresented.
+        retryAll = tf.logical_and(
+            tf.logical_and(notAcceptedAll, useRightTail),
+            tf.logical_and(tf.logical_not(acceptedRightTail),
+                           tf.less(rRightTail, bAll)))
+
+        rAll = tf.where(notAcceptedAll, r, rAll)
+        acceptedAll = tf.logical_or(acceptedAll, accepted)
+        return(i+1, rAll, acceptedAll, kAll, retryAll)
+
+    loop_vars = [tf.constant(0), rAll, acceptedAll, kAll, retryAll]
+    _, rAll, acceptedAll, kAll, retryAll = tf.while_loop(notAccepted, body,
+                                                         loop_vars=loop_vars)
+    acceptedAll = tf.logical_and(acceptedAll, acceptedRejection)
+    return(rAll, useRejectionSamplingChopin, acceptedAll)
 
-    mu = tf.Print(mu, [tf.reduce_max(mu), tf.reduce_min(mu)], "mu=")
-    sigma = tf.Print(sigma, [tf.reduce_max(sigma), tf.reduce_min(sigma)], "sigma=")
-
-    with tf.control_dependencies([assert_op]):
-        sigma = sigma + 0.
-
-    # Scaling
-    a = (a-mu) / sigma
-    b = (b-mu) / sigma
-
-    # Check if a < b
-    isValid = a < b
-    aValid = tf.gather(a, tf.where(isValid))[..., 0]
-    bValid = tf.gather(b, tf.where(isValid))[..., 0]
-
-    # flip such that |a| < |b|
-    flip = tf.greater(tf.abs(a), tf.abs(b))
-    flipValid = tf.greater(tf.abs(aValid), tf.abs(bValid))
-    mbflipped = -tf.gather(b, tf.where(flip))[..., 0]
-    maflipped = -tf.gather(a, tf.where(flip))[..., 0]
-    aFlipped = updateTensor(a, flip, mbflipped)
-    bFlipped = updateTensor(b, flip, maflipped)
-
-    aFlippedValid = tf.gather(aFlipped, tf.where(isValid))[..., 0]
-    bFlippedValid = tf.gather(bFlipped, tf.where(isValid))[..., 0]
-
-    assert_op = tf.Assert(tf.reduce_all(tf.equal(aFlippedValid, 0.)), [aFlippedValid], name='aaaFlippedValid')
-    with tf.control_dependencies([assert_op]):
-        aFlippedValid = aFlippedValid + 0.
-
-    rValid = rtstdnorm(aFlippedValid, bFlippedValid)
-    rValid = tf.where(flipValid, -rValid, rValid)
-
-    isNotValid = tf.logical_not(isValid)
-#    nNotValid = tf.cast(tf.count_nonzero(tf.cast(isNotValid, dtype=tf.float32), dtype=tf.float32, axis=-1, keep_dims=True), dtype=tf.int32)
-    nNotValid = tf.expand_dims(tf.reduce_sum(tf.cast(isNotValid, dtype=tf.int32)), axis=-1)
-    rNotValid = tf.ones(shape=nNotValid, dtype=a.dtype)*np.nan
-
-    r = tf.zeros_like(a)
-    r = updateTensor(r, isValid, rValid)
-    r = updateTensor(r, isNotValid, rNotValid)
-
-    # Scaling back
-    r = r * sigma + mu
-
-    r = tf.where(r>=a, r, a)
-    r = tf.where(r<=b, r, b)
-
-    return(r)
-
-
-def rtnormFlipped(a=0., b=1., mu=np.array([0.]), sigma=np.array([1.])):
-    A = (a-mu) / sigma
-    B = (b-mu) / sigma
-
-    assertBgA = tf.Assert(tf.reduce_all(tf.greater(B, A)), [A, B], name='BgA')
-    with tf.control_dependencies([assertBgA]):
-        R, useRejectionSamplingExp = rtstdnorm(A, B)
-
-    r = tf.where(useRejectionSamplingExp, a-R*sigma**2/(a-mu), R*sigma + mu)
-
-    r = tf.where(r>=a, r, a)
-    r = tf.where(r<=b, r, b)
-
-    assertAllZero = tf.Assert(tf.reduce_any(tf.logical_not(tf.equal(r, 0.))), [r], name='allZero')
-    with tf.control_dependencies([assertAllZero]):
-        r = r + 0.
-
-    return(r)
-
-def rtnorm(a=0., b=1., mu=np.array([0.]), sigma=np.array([1.]), nSamples=1):
-    assertSigma0 = tf.Assert(tf.reduce_all(tf.greater(sigma, 0.)), [sigma], name='sigmaNotPositive')
-    assertSigma1 = tf.Assert(tf.reduce_all(tf.is_finite(sigma)), [sigma], name='sigmaNotFinite')
-    assertMu = tf.Assert(tf.reduce_all(tf.is_finite(mu)), [mu], name='muNotFinite')
-    assertA = tf.Assert(tf.reduce_all(tf.logical_not(tf.is_nan(a))), [a], name='aIsNan')
-    assertB = tf.Assert(tf.reduce_all(tf.logical_not(tf.is_nan(b))), [b], name='bIsNan')
-    assertab = tf.Assert(tf.reduce_all((tf.greater(b, a))), [a, b], name='aGreaterb')
-
-    with tf.control_dependencies([assertSigma0, assertSigma1, assertMu, assertA, assertB, assertab]):
-        # check shapes
-        aOnes = tf.ones_like(a)
-        bOnes = tf.ones_like(b)
-        muOnes = tf.ones_like(mu)
-        sigmaOnes = tf.ones_like(sigma)
-        ones = aOnes*bOnes*muOnes*sigmaOnes
-        a = a * ones
-        b = b * ones
-        mu = mu * ones
-        sigma = sigma * ones
-
-        multiples = np.concatenate(([nSamples], np.ones_like(mu.get_shape().as_list())))
-        shape = np.concatenate(([nSamples], mu.get_shape().as_list()))
-        a = tf.reshape(tf.tile(a[None], multiples), (-1,))
-        b = tf.reshape(tf.tile(b[None], multiples), (-1,))
-        mu = tf.reshape(tf.tile(mu[None], multiples), (-1,))
-        sigma = tf.reshape(tf.tile(sigma[None], multiples), (-1,))
-
-        # flip such that |a| < |b|
-        flip = tf.greater(tf.abs(a), tf.abs(b))
-        mbflipped = -tf.gather(b, tf.where(flip))[..., 0]
-        maflipped = -tf.gather(a, tf.where(flip))[..., 0]
-        aFlipped = updateTensor(a, flip, mbflipped)
-        bFlipped = updateTensor(b, flip, maflipped)
-        mmuFlipped = -tf.gather(mu, tf.where(flip))[..., 0]
-        muFlipped = updateTensor(mu, flip, mmuFlipped)
-
-        # sample
-        rFlipped = rtnormFlipped(aFlipped, bFlipped, mu=muFlipped, sigma=sigma)
-
-        # flip back
-        r = tf.where(flip, -rFlipped, rFlipped)
-        r = tf.reshape(r, shape)
-    return(r)
 
 # Tables
 x = array([
@@ -1,13 +1,14 @@
 from abc import ABCMeta, abstractmethod
 from tensorflow.python.framework.dtypes import DType
 from enum import Enum
-from typing import Tuple, Dict, Type
+from typing import Tuple, Dict, Type, Callable, Union
 import tensorflow as tf
 from tensorflow import Tensor, Variable
+from tensorflow.python.framework import ops
 import numpy as np
 
 from decompose.distributions.productDistLookup import ProductDict
-from decompose.distributions.algorithms import Algorithms
+from decompose.distributions.algorithms import Algorithms, FIT_ITERATIONS
 
 
 ParameterInfo = Dict[str, Tuple[Tuple[int, ...], bool]]
@@ -34,6 +35,40 @@ class UpdateType(Enum):
     """Indicates that the `update` method updates only the latent variables."""
 
 
+class SwitchedType(object):
+    """Type that is chosen at runtime by a boolean `Tensor`.
+
+    A `SwitchedType` can be used as the `drawType` or the `updateType`
+    of a `Distribution`. Its `draw` and `update` methods then create the
+    ops of both types and select one of them with a `tf.cond`. The same
+    instance has to be shared by all distributions that are multiplied
+    with each other.
+
+    Arguments:
+        condition: scalar boolean `Tensor`.
+        ifTrue: `DrawType` or `UpdateType` used if `condition` is true.
+        ifFalse: `DrawType` or `UpdateType` used otherwise.
+    """
+
+    def __init__(self, condition: Tensor, ifTrue: Enum,
+                 ifFalse: Enum) -> None:
+        self.__condition = condition
+        self.__ifTrue = ifTrue
+        self.__ifFalse = ifFalse
+
+    @property
+    def condition(self) -> Tensor:
+        return(self.__condition)
+
+    @property
+    def ifTrue(self) -> Enum:
+        return(self.__ifTrue)
+
+    @property
+    def ifFalse(self) -> Enum:
+        return(self.__ifFalse)
+
+
 class Properties(object):
     def __init__(self,
                  name: str = "NA",
@@ -95,6 +130,7 @@ class Distribution(metaclass=ABCMeta):
                  parameters: Dict[str, Tensor],
                  properties: Properties,
                  hyperParameters: Tuple[str] = ()) -> None:
+        self.__deferAssignments = False
         self.__algorithms = algorithms
         self.__hyperParameters = hyperParameters
         if properties is not None:
@@ -126,13 +162,19 @@ class Distribution(metaclass=ABCMeta):
         instanceName = self.name
         distributionName = type(self).__name__
         scope = f"{instanceName}/{distributionName}"
-        with tf.variable_scope(scope):
+        self.__deferAssignments = True
+        with tf.variable_scope(scope) as variableScope:
+            self.__variableScope = variableScope
             for parameterName, value in parameters.items():
                 if self.persistent:
                     value = tf.get_variable(parameterName, dtype=self.dtype,
                                             initializer=value)
                     self.__vars[parameterName] = value
+                    # read in the current context, e.g. in every
+                    # iteration of a `tf.while_loop`
+                    value = value.read_value()
                 setattr(self, parameterName, value)
+        self.__deferAssignments = False
 
     def get_parameters(self) -> Dict[str, Tensor]:
         parameters = {}
@@ -319,6 +361,17 @@ class Distribution(metaclass=ABCMeta):
         """
         return(self.__persistent)
 
+    @property
+    def assignsVariables(self) -> bool:
+        """`bool` whether setting a parameter assigns it to its variable.
+
+        This is the case for persistent distributions except while the
+        parameters are initialized with their variables and while the
+        branches of a `SwitchedType` update are created. The parameters
+        are then assigned once after the `tf.cond`.
+        """
+        return(self.persistent and not self.__deferAssignments)
+
     @property
     def algorithms(self) -> Type[Algorithms]:
         return(self.__algorithms)
@@ -357,7 +410,7 @@ class Distribution(metaclass=ABCMeta):
         ...
 
     @property
-    def drawType(self) -> DrawType:
+    def drawType(self) -> Union[DrawType, SwitchedType]:
         """`DrawType` indicating whether `draw` returns a sampel or the mode.
 
         If `drawType` is `DrawType.SAMPLE` then `draw` returns a sample from
@@ -367,7 +420,7 @@ class Distribution(metaclass=ABCMeta):
         return(self.__drawType)
 
     @property
-    def updateType(self) -> UpdateType:
+    def updateType(self) -> Union[UpdateType, SwitchedType]:
         """`UpdateType` indicating whether `update` updates all parameters.
 
         If `updateType` is `UpdateType.ALL` then `update` will update all
@@ -377,11 +430,11 @@ class Distribution(metaclass=ABCMeta):
         return(self.__updateType)
 
     @drawType.setter
-    def drawType(self, drawType: DrawType):
+    def drawType(self, drawType: Union[DrawType, SwitchedType]):
         self.__drawType = drawType
 
     @updateType.setter
-    def updateType(self, updateType: UpdateType):
+    def updateType(self, updateType: Union[UpdateType, SwitchedType]):
         self.__updateType = updateType
 
     @property
@@ -402,13 +455,22 @@ class Distribution(metaclass=ABCMeta):
 
         If `drawType` is equal to `DrawType.SAMPLE` the function returns a
         sample. If `drawType` is equal to `DrawType.MODE` the function returns
-        the mode of the distribution.
+        the mode of the distribution. If `drawType` is a `SwitchedType`
+        both are created and selected at runtime.
 
         Returns:
             `Tensor` of the same shape as the distribution containing either
             a sample from the distribution or the mode of the distribution.
         """
-        if self.drawType == DrawType.SAMPLE:
+        drawType = self.drawType
+        if isinstance(drawType, SwitchedType):
+            return(tf.cond(drawType.condition,
+                           lambda: self.__drawAs(drawType.ifTrue),
+                           lambda: self.__drawAs(drawType.ifFalse)))
+        return(self.__drawAs(drawType))
+
+    def __drawAs(self, drawType: DrawType) -> Tensor:
+        if drawType == DrawType.SAMPLE:
             return(self.sample(1)[0, ...])
         else:
             return(self.mode())
@@ -419,16 +481,74 @@ class Distribution(metaclass=ABCMeta):
         If `updateType` is `UpdateType.ALL` then all parameters
         will be updated by calling `fit`. If `updateType` is
         `UpdateType.ONLYLATENTS` then only the latents will be updated
-        by calling `fitLatents`.
+        by calling `fitLatents`. If `updateType` is a `SwitchedType`
+        both updates are created and selected at runtime.
 
         Arguments:
             data: `Tensor` data used to fit the parameters.
         """
-        if self.updateType == UpdateType.ALL:
+        if isinstance(self.updateType, SwitchedType):
+            self.__switch(lambda: self.update(data))
+        elif self.updateType == UpdateType.ALL:
             self.fit(data)
         else:
             self.fitLatents(data)
 
+    def updateWhen(self, updateType: UpdateType,
+                   update: Callable[[], None]) -> None:
+        """Calls `update` if the update type is `updateType`.
+
+        Used by the owners of a distribution that set its parameters
+        themselves, e. g. the noise of a likelihood. If `updateType` is a
+        `SwitchedType` the call is made in the matching branch of a
+        `tf.cond` only.
+
+        Arguments:
+            updateType: `UpdateType` for which `update` is called.
+            update: `Callable` that sets the parameters of the distribution.
+        """
+        if isinstance(self.updateType, SwitchedType):
+            self.__switch(lambda: self.updateWhen(updateType, update))
+        elif self.updateType == updateType:
+            update()
+
+    def __switch(self, update: Callable[[], None]) -> None:
+        """Performs `update` for both branches of the `SwitchedType`.
+
+        In each branch of a `tf.cond` the update type is set to the type
+        of the branch and `update` is called without assigning the
+        parameters to the variables. The parameters selected by the
+        `tf.cond` are then set and assigned once.
+
+        Arguments:
+            update: `Callable` that sets the parameters of the distribution.
+        """
+        updateType = self.updateType
+        parameterNames = self.parameterNames
+
+        def branch(branchUpdateType):
+            def updatedParameters():
+                parameters = self.get_parameters()
+                deferAssignments = self.__deferAssignments
+                self.__deferAssignments = True
+                self.__updateType = branchUpdateType
+                try:
+                    update()
+                    # a dict is never unpacked by `tf.cond`
+                    updated = {name: tf.identity(getattr(self, name))
+                               for name in parameterNames}
+                finally:
+                    self.set_parameters(parameters)
+                    self.__deferAssignments = deferAssignments
+                    self.__updateType = updateType
+                return(updated)
+            return(updatedParameters)
+
+        parameters = tf.cond(updateType.condition,
+                             branch(updateType.ifTrue),
+                             branch(updateType.ifFalse))
+        self.set_parameters(parameters)
+
     @abstractmethod
     def cond(self) -> "Distribution":
         """Conditions the distribution on its latent variables.
@@ -488,8 +608,37 @@ class Distribution(metaclass=ABCMeta):
         parameters = self.get_parameters()
         updatedParameters = self.algorithms.fit(parameters=parameters,
                                                 data=data)
+        iterations = updatedParameters.pop(FIT_ITERATIONS, None)
+        if iterations is not None and self.persistent:
+            recordIterations = self.__recordFitIterations(iterations)
+            with tf.control_dependencies([recordIterations]):
+                updatedParameters = {key: tf.identity(value) for key, value
+                                     in updatedParameters.items()}
         self.set_parameters(updatedParameters)
 
+    def __recordFitIterations(self, iterations: Tensor) -> Tensor:
+        """Stores the number of iterations of the last fit in a variable.
+
+        The variable is a local variable in the scope of the parameters
+        and in the collection `FIT_ITERATIONS` such that it can be
+        reported as a metric. It is created outside of any control flow
+        since `fit` is usually called within the branch of a `tf.cond`.
+
+        Arguments:
+            iterations: `Tensor`, number of iterations of the fit.
+
+        Returns:
+            The assignment of `iterations` to the variable.
+        """
+        collections = [tf.GraphKeys.LOCAL_VARIABLES, FIT_ITERATIONS]
+        with ops.init_scope(), tf.variable_scope(self.__variableScope,
+                                                 reuse=tf.AUTO_REUSE):
+            fitIterations = tf.get_variable(
+                FIT_ITERATIONS, shape=(), dtype=tf.int32,
+                initializer=tf.zeros_initializer(), trainable=False,
+                collections=collections)
+        return(tf.assign(fitIterations, tf.cast(iterations, tf.int32)))
+
     def fitLatents(self, data: Tensor) -> None:
         """Estimate the latent parameters of the distribution given `data`.
 
@@ -620,7 +769,7 @@ class parameterProperty(object):
     def __set__(self, obj, value):
         if self.fset is None:
             raise AttributeError("can't set attribute")
-        if obj.persistent:
+        if obj.assignsVariables:
             value = tf.assign(obj.vars(self.name), value)
         self.fset(obj, value)
 
@@ -4,7 +4,7 @@ import tensorflow as tf
 from tensorflow import Tensor
 
 from decompose.distributions.algorithms import Algorithms
-from decompose.distributions.chopin2011 import rtnorm
+from decompose.distributions.trnorm import rtnorm
 
 
 class JumpNormalAlgorithms(Algorithms):
@@ -1,9 +1,10 @@
-from typing import Dict
+from typing import Dict, Tuple
 import numpy as np
 import tensorflow as tf
 from tensorflow import Tensor
 
 from decompose.distributions.algorithms import Algorithms
+from decompose.distributions.newton import newtonMaximize
 
 
 class LomaxAlgorithms(Algorithms):
@@ -34,10 +35,23 @@ class LomaxAlgorithms(Algorithms):
         return(llh)
 
     @classmethod
-    def f(cls, y, beta, tn):
-        tal = tn/tf.reduce_sum(tf.log((beta+y)/beta), axis=-2, keepdims=True)
-        tfu = tn*(tf.log(tal)-tf.log(beta) - (1.+1./tal))
-        return(tfu)
+    def profileLlh(cls, t: Tensor, data: Tensor) -> Tuple[Tensor, Tensor,
+                                                          Tensor]:
+        """Mean llh at `beta = exp(t)` and the optimal `alpha`.
+
+        Returns:
+            The profile llh and its first and second derivative w.r.t. `t`,
+            computed from means over the data without expanding it.
+        """
+        beta = tf.exp(t)
+        S = tf.reduce_mean(tf.log1p(data/beta), axis=0)
+        w = data/(beta+data)
+        W1 = tf.reduce_mean(w, axis=0)
+        W2 = tf.reduce_mean(w*(2.-w), axis=0)
+        f = -tf.log(S) - t - 1. - S
+        g = W1/S + W1 - 1.
+        h = -W2/S + (W1/S)**2 - W2 + W1/S + W1
+        return(f, g, h)
 
     @classmethod
     def fit(cls, parameters: Dict[str, Tensor],
@@ -45,29 +59,17 @@ class LomaxAlgorithms(Algorithms):
         alphaOld, betaOld = parameters["alpha"], parameters["beta"]
 
         y = data
-        tn = data.get_shape()[0].value
-        alpha = alphaOld
-        beta = betaOld
-
-        for i in range(1):
-            swidths = tf.constant(np.array([0., 1e-8, 1e-7, 1e-6, 1e-4, 1e-3,
-                                            1e-2, 1e-1, 1e0, 1e1, 1e2,
-                                            1e3]), dtype=alpha.dtype)
-            grads = tf.gradients(cls.f(data, beta, tn), [beta])[0]
-            normedDirection = tf.sign(grads)
-            testBetas = beta+swidths[..., None, None]*normedDirection
-            testUtilities = cls.f(data, testBetas, tn)
-            argmax = tf.cast(tf.argmax(testUtilities, axis=0)[0],
-                             dtype=tf.int32)
-            maxWidths = tf.gather(swidths, argmax)
-            beta = beta+maxWidths*normedDirection
 
-            beta = tf.where(tf.greater(beta, 1e-9), beta,
-                            1e-9*tf.ones_like(beta))
-            beta = tf.where(tf.less(beta, 1e9), beta,
-                            1e9*tf.ones_like(beta))
+        # maximize the profile llh over log(beta)
+        t, _ = newtonMaximize(lambda t: cls.profileLlh(t, y),
+                              tf.log(betaOld), nIterations=10, maxStep=2.)
+        beta = tf.exp(t)
+        beta = tf.where(tf.greater(beta, 1e-9), beta,
+                        1e-9*tf.ones_like(beta))
+        beta = tf.where(tf.less(beta, 1e9), beta,
+                        1e9*tf.ones_like(beta))
 
-        alpha = tn/tf.reduce_sum(tf.log(beta+y) - tf.log(beta), axis=-2)
+        alpha = 1./tf.reduce_mean(tf.log1p(y/beta), axis=0)
         alpha = tf.where(tf.greater(alpha, 1e-9), alpha,
                          1e-9*tf.ones_like(alpha))
         alpha = tf.where(tf.less(alpha, 1e9), alpha,
@@ -0,0 +1,86 @@
+from typing import Callable, Tuple, Union
+import numpy as np
+import tensorflow as tf
+from tensorflow import Tensor
+
+
+ObjectiveWithDerivatives = Callable[[Tensor], Tuple[Tensor, Tensor, Tensor]]
+
+
+def derivatives(f: Callable[[Tensor], Tensor]) -> ObjectiveWithDerivatives:
+    """Adds the first and second derivative to a separable objective.
+
+    The objective `f` must map a `Tensor` of parameters to a `Tensor` of
+    the same shape whose elements only depend on the corresponding
+    parameter. The derivatives are then the gradients of its sum. This
+    is meant for objectives that are closed forms of sufficient
+    statistics and hence only as large as the parameters.
+    """
+    def fgh(x: Tensor) -> Tuple[Tensor, Tensor, Tensor]:
+        fx = f(x)
+        gx = tf.gradients(tf.reduce_sum(fx), [x])[0]
+        hx = tf.gradients(tf.reduce_sum(gx), [x])[0]
+        return(fx, gx, hx)
+    return(fgh)
+
+
+def newtonMaximize(fgh: ObjectiveWithDerivatives, x0: Tensor,
+                   nIterations: int = 20,
+                   maxStep: Union[float, Tensor] = 1.
+                   ) -> Tuple[Tensor, Tensor]:
+    """Maximizes a separable objective for each parameter independently.
+
+    Each iteration proposes a Newton step where the objective is concave
+    and a gradient step of length `maxStep` elsewhere. A proposal is
+    accepted for the parameters whose objective it increases, for the
+    other parameters the step length is halved. Each iteration thus
+    evaluates the objective and its derivatives exactly once, no matter
+    how many step lengths are tried, and never holds more than one
+    candidate per parameter. Non-finite values of the objective count as
+    `-inf`, i.e. proposals outside of the domain are rejected.
+
+    Arguments:
+        fgh: `Callable` that returns the objective and its first and
+            second derivative at the given parameters.
+        x0: `Tensor`, initial parameters with finite objective.
+        nIterations: `int`, number of iterations.
+        maxStep: `float` or `Tensor` broadcastable to `x0`, maximal
+            change of a parameter per iteration.
+
+    Returns:
+        `Tuple[Tensor, Tensor]` of the parameters and their objective.
+    """
+    def evaluate(x):
+        fx, gx, hx = fgh(x)
+        isFinite = tf.logical_and(tf.is_finite(fx),
+                                  tf.logical_and(tf.is_finite(gx),
+                                                 tf.is_finite(hx)))
+        fx = tf.where(isFinite, fx, -np.inf*tf.ones_like(fx))
+        gx = tf.where(isFinite, gx, tf.zeros_like(gx))
+        hx = tf.where(isFinite, hx, -tf.ones_like(hx))
+        return(fx, gx, hx)
+
+    def cond(i, x, fx, gx, hx, scale):
+        return(tf.less(i, nIterations))
+
+    def body(i, x, fx, gx, hx, scale):
+        isConcave = tf.less(hx, 0.)
+        step = tf.where(isConcave, -gx/tf.where(isConcave, hx,
+                                                -tf.ones_like(hx)),
+                        tf.sign(gx)*maxStep)
+        step = tf.clip_by_value(step, -maxStep, maxStep)
+        xNew = x + scale*step
+        fNew, gNew, hNew = evaluate(xNew)
+
+        improved = tf.greater(fNew, fx)
+        x = tf.where(improved, xNew, x)
+        fx = tf.where(improved, fNew, fx)
+        gx = tf.where(improved, gNew, gx)
+        hx = tf.where(improved, hNew, hx)
+        scale = tf.where(improved, tf.ones_like(scale), scale/2.)
+        return(i+1, x, fx, gx, hx, scale)
+
+    fx, gx, hx = evaluate(x0)
+    loop_vars = [tf.constant(0), x0, fx, gx, hx, tf.ones_like(x0)]
+    _, x, fx, _, _, _ = tf.while_loop(cond, body, loop_vars)
+    return(x, fx)
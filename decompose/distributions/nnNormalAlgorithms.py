@@ -4,7 +4,9 @@ import tensorflow as tf
 from tensorflow import Tensor
 
 from decompose.distributions.algorithms import Algorithms
-from decompose.distributions.chopin2011 import rtnorm
+from decompose.distributions.newton import newtonMaximize, derivatives
+from decompose.distributions.trnorm import rtnorm
+from decompose.numerics import assertAll
 
 
 class NnNormalAlgorithms(Algorithms):
@@ -54,32 +56,16 @@ class NnNormalAlgorithms(Algorithms):
         return(llh)
 
     @classmethod
-    def gradStep(cls, data, mu, tau, v, e):
-        swidths = tf.constant(np.array([0., 1e-9, 1e-8, 1e-7, 1e-6, 1e-4, 1e-3,
-                                        1e-2, 1e-1, 1e0, 1e1, 1e2,
-                                        1e3])[..., None, None],
-                              dtype=data.dtype)
-        for i in range(5):
-            llhs = cls.llh(parameters={"mu": mu,
-                                       "tau": 1./(v+e**2-e*mu)},
-                           data=data)
-            llhs = tf.reduce_mean(llhs, axis=0)
-            signGradMu = tf.sign(tf.gradients(llhs, [mu])[0])
-            mus = mu+signGradMu*swidths
-            taus = 1./(v+e**2-e*mus)
-            tauIsNonPositive = tf.less_equal(taus, 0.)
-            mus = tf.where(tauIsNonPositive, tf.zeros_like(mus), mus)
-            taus = tf.where(tauIsNonPositive, 1./tf.reduce_mean(data, axis=0)*tf.ones_like(taus), taus)
-            newLlhs = cls.llh(parameters={"mu": mus,
-                                          "tau": taus},
-                              data=data[None])
-            newLlhs = tf.reduce_mean(newLlhs, axis=-2, keepdims=True)
-            argmax = tf.cast(tf.argmax(newLlhs, axis=0)[0], dtype=tf.int32)
-            mu = tf.gather(mus[:, 0], argmax)
-            mu = tf.diag_part(mu)
-            tau = tf.gather(taus[:, 0], argmax)
-            tau = tf.diag_part(tau)
-        return(mu, tau)
+    def meanLlh(cls, mu: Tensor, tau: Tensor, e: Tensor,
+                m2: Tensor) -> Tensor:
+        """Mean llh of data with mean `e` and second moment `m2`."""
+        dtype = mu.dtype
+        norm = tf.distributions.Normal(loc=tf.constant(0., dtype=dtype),
+                                       scale=tf.constant(1., dtype=dtype))
+        llh = (0.5*tf.log(tau) - 0.5*np.log(2.*np.pi)
+               - 0.5*tau*(m2 - 2.*mu*e + mu**2)
+               - norm.log_cdf(value=(mu*tf.sqrt(tau))))
+        return(llh)
 
     @classmethod
     def fit(cls, parameters: Dict[str, Tensor],
@@ -90,25 +76,37 @@ class NnNormalAlgorithms(Algorithms):
         e = tf.reduce_mean(data, axis=0)
         v = tf.reduce_mean((data-e)**2, axis=0)
         s = tf.reduce_mean(((data-e)/tf.sqrt(v))**3, axis=0)
+        m2 = v + e**2
+
+        # the precision is determined by the location through the mean,
+        # hence only the location is optimized
+        def tauOf(mu):
+            return(1./(v+e**2-e*mu))
 
-        muOld, tauOld = cls.gradStep(data, muOld, tauOld, v, e)
+        def objective(mu):
+            return(cls.meanLlh(mu, tauOf(mu), e, m2))
 
-        mu = (s*v**1.5 + e*v - e**3)/(v-e**2)
-        tau = 1./(v+e**2-e*mu)
-        mu, tau = cls.gradStep(data, mu, tau, v, e)
+        def start(mu):
+            isValid = tf.logical_and(tf.is_finite(mu),
+                                     tf.greater(tauOf(mu), 0.))
+            return(tf.where(isValid, mu, tf.zeros_like(mu)))
 
-        llhOld = cls.llh(parameters={"mu": muOld, "tau": tauOld}, data=data)
-        llhOld = tf.reduce_mean(llhOld, axis=0)
+        fgh = derivatives(objective)
+        muMoments = (s*v**1.5 + e*v - e**3)/(v-e**2)
+        mu0, llh0 = newtonMaximize(fgh, start(muOld), maxStep=tf.sqrt(v))
+        mu1, llh1 = newtonMaximize(fgh, start(muMoments), maxStep=tf.sqrt(v))
+        mu = tf.where(tf.greater(llh0, llh1), mu0, mu1)
+        tau = tauOf(mu)
 
-        llh = cls.llh(parameters={"mu": mu, "tau": tau}, data=data)
-        llh = tf.reduce_mean(llh, axis=0)
+        llhOld = cls.meanLlh(muOld, tauOld, e, m2)
+        llh = cls.meanLlh(mu, tau, e, m2)
 
         mu = tf.where(tf.greater(llhOld, llh), muOld, mu)
         tau = tf.where(tf.greater(llhOld, llh), tauOld, tau)
 
-        assertTauIs0 = tf.Assert(tf.reduce_all(tf.logical_not(tf.equal(tau, 0.))), [tau], name='nnNormalAlgnorNnNortauIs0')
-        assertTauNotPos = tf.Assert(tf.reduce_all(tf.greater(tau, 0.)), [tau], name='nnNormalAlgnorNnNorCenNotPositive')
-        with tf.control_dependencies([assertTauIs0, assertTauNotPos]):
+        checks = (assertAll(tf.logical_not(tf.equal(tau, 0.)), [tau], name='nnNormalAlgnorNnNortauIs0')
+                  + assertAll(tf.greater(tau, 0.), [tau], name='nnNormalAlgnorNnNorCenNotPositive'))
+        with tf.control_dependencies(checks):
             tau = tau + 0.
 
         updatedParameters = {"mu": mu, "tau": tau}
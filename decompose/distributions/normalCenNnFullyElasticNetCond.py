@@ -23,26 +23,20 @@ class NormalCenNnFullyElasticNetCond(Product):
     def product(self, n0: Normal, n1: CenNnFullyElasticNetCond) -> NnNormal:
         otherParams = self.productParams(n0, n1)
 
-        lomax = Exponential(beta=n1.beta, **otherParams)
-        normalLomax = n0*lomax
-
-        exponential = Exponential(beta=n1.betaExponential, **otherParams)
+        # the Lomax and the exponential component both lead to the
+        # product with an exponential distribution, they differ only
+        # in its scale
+        b = n1.b
+        isNnNormal = tf.equal(b, 0.)
+        beta = tf.where(tf.equal(b, 1.), n1.betaExponential, n1.beta)
+        exponential = Exponential(beta=beta, **otherParams)
         normalExponential = n0*exponential
 
         nnNormal = NnNormal(mu=n1.mu, tau=n1.tau, **otherParams)
         normalNnNormal = n0*nnNormal
 
-        b = n1.b
-        mu = tf.where(tf.equal(b, 0.),
-                      normalNnNormal.mu,
-                      tf.where(tf.equal(b, 1.),
-                               normalExponential.mu,
-                               normalLomax.mu))
-        tau = tf.where(tf.equal(b, 0.),
-                       normalNnNormal.tau,
-                       tf.where(tf.equal(b, 1.),
-                                normalExponential.tau,
-                                normalLomax.tau))
+        mu = tf.where(isNnNormal, normalNnNormal.mu, normalExponential.mu)
+        tau = tf.where(isNnNormal, normalNnNormal.tau, normalExponential.tau)
 
         pd = NnNormal(mu=mu, tau=tau, **otherParams)
         return(pd)
@@ -5,6 +5,7 @@ from decompose.distributions.distribution import Distribution
 from decompose.distributions.normal import Normal
 from decompose.distributions.nnNormal import NnNormal
 from decompose.distributions.product import Product
+from decompose.numerics import assertAll
 
 
 class NormalNnNormal(Product):
@@ -36,8 +37,8 @@ class NormalNnNormal(Product):
         tauNnn = nnn.tau
         tau = tauN + tauNnn
 
-        assertTauIs0 = tf.Assert(tf.reduce_all(tf.logical_not(tf.equal(tau, 0.))), [tau], name='norNnNortauIs0')
-        assertTauNotPos = tf.Assert(tf.reduce_all(tf.greater(tau, 0.)), [tau], name='norNnNorCenNotPositive')
-        with tf.control_dependencies([assertTauIs0, assertTauNotPos]):
+        checks = (assertAll(tf.logical_not(tf.equal(tau, 0.)), [tau], name='norNnNortauIs0')
+                  + assertAll(tf.greater(tau, 0.), [tau], name='norNnNorCenNotPositive'))
+        with tf.control_dependencies(checks):
             tau = tau + 0.
         return(tau)
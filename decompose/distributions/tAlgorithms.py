@@ -1,9 +1,9 @@
-from typing import Dict
+from typing import Dict, Tuple
 import numpy as np
 import tensorflow as tf
 from tensorflow import Tensor
 
-from decompose.distributions.algorithms import Algorithms
+from decompose.distributions.algorithms import Algorithms, FIT_ITERATIONS
 
 
 class TAlgorithms(Algorithms):
@@ -36,7 +36,8 @@ class TAlgorithms(Algorithms):
 
     @classmethod
     def nuStep(cls, nu, n, delta, p=1.):
-        three = tf.constant(3., dtype=nu.dtype)
+        """Two Newton steps on `nu` given the squared distances `delta`."""
+        one = tf.constant(1., dtype=nu.dtype)
         for i in range(2):
             w = (nu+p)/(nu+delta)
             fp = (-tf.digamma(nu/2) + tf.log(nu/2)
@@ -44,40 +45,90 @@ class TAlgorithms(Algorithms):
                                        axis=0)
                   + 1
                   + tf.digamma((p+nu)/2) - tf.log((p+nu)/2))
-            fpp = (tf.polygamma(three, nu/2)/2. + 1./nu
-                   + tf.polygamma(three, (p+nu)/2)/2. - 1./(nu+p)
-                   + 1./n*tf.reduce_sum((delta-p)/(nu+delta)**2*(w-1),
+            fpp = (tf.polygamma(one, nu/2)/2. - 1./nu
+                   - tf.polygamma(one, (p+nu)/2)/2. + 1./(nu+p)
+                   - 1./n*tf.reduce_sum(1./(nu+p) - 1./(nu+delta)
+                                        - (delta-p)/(nu+delta)**2,
                                         axis=0))
             nu = nu + fp/fpp
         return(nu)
 
     @classmethod
-    def fit(cls, parameters: Dict[str, Tensor],
-            data: tf.Tensor) -> Dict[str, Tensor]:
-        mu, Psi, nu = parameters["mu"], parameters["Psi"], parameters["nu"]
+    def fitEm(cls, Y: Tensor, mu: Tensor, Psi: Tensor, nu: Tensor,
+              centered: bool = False, maxIterations: int = 5,
+              tol: float = 1e-3) -> Tuple[Tensor, Tensor, Tensor, Tensor]:
+        """EM updates of the parameters warm started at `mu`, `Psi` and `nu`.
+
+        The EM rounds run in a `tf.while_loop`. A component is converged
+        once a round changes none of its parameters by more than `tol`
+        relative to its scale, its parameters are kept fixed from then
+        on. The loop stops as soon as all components are converged or
+        after `maxIterations` rounds.
 
+        Arguments:
+            Y: `Tensor` of shape `(n, K)`, the data.
+            mu: `Tensor` of shape `(K,)`, the initial locations.
+            Psi: `Tensor` of shape `(K,)`, the initial scales.
+            nu: `Tensor` of shape `(K,)`, the initial degrees of freedom.
+            centered: `bool`, whether `mu` is fixed.
+            maxIterations: `int`, maximal number of EM rounds.
+            tol: `float`, relative tolerance of the convergence test.
+
+        Returns:
+            The updated `mu`, `Psi`, `nu` and the number of EM rounds.
+        """
         p = 1.
+        n = Y.get_shape()[0].value
+        ones = tf.ones_like(mu)*tf.ones_like(Psi)*tf.ones_like(nu)
+        mu, Psi, nu = mu*ones, Psi*ones, nu*ones
 
-        n = data.get_shape()[0].value
-        Y = data
-        for i in range(5):
+        def cond(i, mu, Psi, nu, converged):
+            return(tf.logical_and(tf.less(i, maxIterations),
+                                  tf.logical_not(tf.reduce_all(converged))))
+
+        def body(i, mu, Psi, nu, converged):
             delta = (Y - mu)**2/Psi
             w = (nu + p)/(nu + delta)
 
-            mu = tf.reduce_mean(w*Y, axis=0)
-            PsiNew = tf.reduce_mean(w*(Y-mu)**2, axis=0)
-            cond = tf.logical_and(tf.is_finite(PsiNew),
-                                  tf.greater(PsiNew, 1e-6))
-            Psi = tf.where(cond, PsiNew, Psi*tf.ones_like(PsiNew))
+            if centered:
+                muNew = mu
+            else:
+                muNew = tf.reduce_mean(w*Y, axis=0)
+            PsiNew = tf.reduce_mean(w*(Y-muNew)**2, axis=0)
+            isValid = tf.logical_and(tf.is_finite(PsiNew),
+                                     tf.greater(PsiNew, 1e-6))
+            PsiNew = tf.where(isValid, PsiNew, Psi)
 
-            delta = (Y - mu)**2/Psi
+            delta = (Y - muNew)**2/PsiNew
             nuNew = cls.nuStep(nu, n, delta)
-            cond = tf.logical_and(tf.is_finite(nuNew),
-                                  tf.greater(nuNew, 0.))
-            nu = tf.where(cond, nuNew, nu*tf.ones_like(nuNew))
+            isValid = tf.logical_and(tf.is_finite(nuNew),
+                                     tf.greater(nuNew, 0.))
+            nuNew = tf.where(isValid, nuNew, nu)
+
+            done = tf.logical_and(
+                tf.less_equal(tf.abs(muNew - mu), tol*tf.sqrt(PsiNew)),
+                tf.logical_and(
+                    tf.less_equal(tf.abs(PsiNew - Psi), tol*Psi),
+                    tf.less_equal(tf.abs(nuNew - nu), tol*nu)))
+            mu = tf.where(converged, mu, muNew)
+            Psi = tf.where(converged, Psi, PsiNew)
+            nu = tf.where(converged, nu, nuNew)
+            converged = tf.logical_or(converged, done)
+            return(i+1, mu, Psi, nu, converged)
 
-        tau = w
-        updatedParameters = {"mu": mu, "nu": nu, "Psi": Psi, "tau": tau}
+        converged = tf.zeros_like(mu, dtype=tf.bool)
+        loop_vars = [tf.constant(0), mu, Psi, nu, converged]
+        iterations, mu, Psi, nu, _ = tf.while_loop(cond, body, loop_vars)
+        return(mu, Psi, nu, iterations)
+
+    @classmethod
+    def fit(cls, parameters: Dict[str, Tensor],
+            data: tf.Tensor) -> Dict[str, Tensor]:
+        mu, Psi, nu = parameters["mu"], parameters["Psi"], parameters["nu"]
+        mu, Psi, nu, iterations = cls.fitEm(data, mu, Psi, nu)
+        tau = cls.fitLatents({"mu": mu, "Psi": Psi, "nu": nu}, data)["tau"]
+        updatedParameters = {"mu": mu, "nu": nu, "Psi": Psi, "tau": tau,
+                             FIT_ITERATIONS: iterations}
         return(updatedParameters)
 
     @classmethod
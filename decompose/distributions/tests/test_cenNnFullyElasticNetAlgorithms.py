@@ -5,6 +5,75 @@ import scipy.stats
 import tensorflow as tf
 
 from decompose.distributions.cenNnFullyElasticNetAlgorithms import CenNnFullyElasticNetAlgorithms
+from decompose.distributions.cenNnElasticNetAlgorithms import CenNnElasticNetAlgorithms
+from decompose.distributions.exponentialAlgorithms import ExponentialAlgorithms
+from decompose.distributions.lomaxAlgorithms import LomaxAlgorithms
+from decompose.tests.fixtures import device, dtype
+
+
+def getParameters(dtype, nSamples):
+    """Parameters with two elements per component in shuffled order."""
+    npdtype = dtype.as_numpy_dtype
+    parameters = {"b": np.array([2., 0., 1., 1., 2., 0.]),
+                  "mu": np.array([-1., 1., 1., 1., 1., 0.5]),
+                  "tau": np.array([1., 2., 1., 1., 1., 0.5]),
+                  "betaExponential": np.array([1., 1., 0.5, 2., 1., 1.]),
+                  "alpha": np.array([1.5, 1., 1., 1., 3., 1.]),
+                  "beta": np.array([2., 1., 1., 1., 0.5, 1.]),
+                  "tauLomax": np.ones((nSamples, 6))}
+    parameters = {key: tf.constant(value.astype(npdtype))
+                  for key, value in parameters.items()}
+    return(parameters)
+
+
+def test_cenNnFullyElasticNet_llh(device, dtype):
+    """Test that only the selected component is evaluated per element."""
+    npdtype = dtype.as_numpy_dtype
+    nSamples = 100
+    parameters = getParameters(dtype, nSamples)
+    data = tf.constant(np.random.exponential(size=(nSamples, 6))
+                       .astype(npdtype))
+
+    llh = CenNnFullyElasticNetAlgorithms.llh(parameters, data)
+    pdf = CenNnFullyElasticNetAlgorithms.pdf(parameters, data)
+    params = CenNnFullyElasticNetAlgorithms.getParameters(parameters)
+    b, cenNnElasticnetParams, exponentialParams, lomaxParams = params
+    llhs = [CenNnElasticNetAlgorithms.llh(cenNnElasticnetParams, data),
+            ExponentialAlgorithms.llh(exponentialParams, data),
+            LomaxAlgorithms.llh(lomaxParams, data)]
+    with tf.Session() as sess:
+        b, llh, pdf, llhs = sess.run([b, llh, pdf, llhs])
+
+    assert(llh.shape == (nSamples, 6))
+    llhTrue = np.where(b == 0., llhs[0], np.where(b == 1., llhs[1], llhs[2]))
+    assert(np.allclose(llh, llhTrue))
+    assert(np.allclose(pdf, np.exp(llhTrue)))
+    tf.reset_default_graph()
+
+
+def test_cenNnFullyElasticNet_sampleComponents(device, dtype):
+    """Test that each element is sampled from its selected component."""
+    nSamples = 10000
+    parameters = getParameters(dtype, nSamples)
+    tfSamples = CenNnFullyElasticNetAlgorithms.sample(parameters, nSamples)
+    assert(tfSamples.get_shape().as_list() == [nSamples, 6])
+    with tf.Session() as sess:
+        samples, parameters = sess.run([tfSamples, parameters])
+
+    for k, b in enumerate(parameters["b"]):
+        if b == 0.:
+            mu, sigma = parameters["mu"][k], 1./np.sqrt(parameters["tau"][k])
+            distribution = sp.stats.truncnorm(a=-mu/sigma, b=np.inf,
+                                              loc=mu, scale=sigma)
+        elif b == 1.:
+            distribution = sp.stats.expon(
+                scale=parameters["betaExponential"][k])
+        else:
+            distribution = sp.stats.lomax(c=parameters["alpha"][k],
+                                          scale=parameters["beta"][k])
+        assert(sp.stats.kstest(samples[:, k], distribution.cdf).pvalue
+               > 1e-4)
+    tf.reset_default_graph()
 
 
 @pytest.mark.slow
@@ -0,0 +1,27 @@
+import numpy as np
+import scipy as sp
+import scipy.stats
+import tensorflow as tf
+
+from decompose.distributions.cenNormalRankOneAlgorithms import \
+    CenNormalRankOneAlgorithms
+from decompose.tests.fixtures import device, dtype
+
+
+def test_fitGamma(device, dtype):
+    """Test that the gamma fit matches scipy and stops early."""
+    npdtype = dtype.as_numpy_dtype
+    alpha, beta = 2., 3.
+    tau = sp.stats.gamma(a=alpha, scale=1./beta).rvs(10000).astype(npdtype)
+
+    alphaHat, betaHat, iterations = CenNormalRankOneAlgorithms.fitGamma(
+        tf.constant(tau))
+    with tf.Session() as sess:
+        alphaHat, betaHat, iterations = sess.run([alphaHat, betaHat,
+                                                  iterations])
+
+    spAlpha, _, spScale = sp.stats.gamma.fit(tau, floc=0.)
+    assert(np.allclose(alphaHat, spAlpha, rtol=1e-3))
+    assert(np.allclose(betaHat, 1./spScale, rtol=1e-3))
+    assert(iterations < 20)
+    tf.reset_default_graph()
@@ -0,0 +1,39 @@
+import numpy as np
+import tensorflow as tf
+
+from decompose.distributions.chopin2011 import getConsts
+from decompose.distributions.trnorm import rtnorm
+from decompose.tests.fixtures import device, dtype
+
+
+def test_getConsts(dtype):
+    """Test that the tables are created once per graph and dtype."""
+    consts = getConsts(dtype)
+    assert(getConsts(dtype) is consts)
+    assert(getConsts(tf.float16) is not consts)
+    tf.reset_default_graph()
+    assert(getConsts(dtype) is not consts)
+    tf.reset_default_graph()
+
+
+def test_rtnorm_whileLoops(device, dtype):
+    """Test that samplers in different loops can share the tables."""
+    npdtype = dtype.as_numpy_dtype
+    mu = tf.constant(np.array([-3., 0., 2.], dtype=npdtype))
+    sigma = tf.ones_like(mu)
+    a = tf.zeros_like(mu)
+    b = tf.ones_like(a)*np.inf
+
+    def body(i, r):
+        r = r + rtnorm(a=a, b=b, mu=mu, sigma=sigma, nSamples=10)[0]
+        return(i+1, r)
+
+    rs = []
+    for loop in range(2):
+        _, r = tf.while_loop(lambda i, r: i < 3, body,
+                             [tf.constant(0), tf.zeros_like(mu)])
+        rs.append(r)
+    with tf.Session() as sess:
+        rs = sess.run(rs)
+    assert(np.all(np.array(rs) >= 0.))
+    tf.reset_default_graph()
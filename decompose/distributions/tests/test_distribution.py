@@ -0,0 +1,78 @@
+import numpy as np
+import tensorflow as tf
+
+from decompose.distributions.distribution import (DrawType, UpdateType,
+                                                  SwitchedType)
+from decompose.distributions.cenNormal import CenNormal
+from decompose.distributions.normal import Normal
+from decompose.tests.fixtures import device, dtype
+
+
+def test_switchedType_update(device, dtype):
+    """Test that the update type is selected at runtime."""
+    npdtype = dtype.as_numpy_dtype
+    K, nSamples = 3, 1000
+    data = np.random.normal(scale=[1., 2., 3.], size=(nSamples, K))
+    data = tf.constant(data.astype(npdtype))
+
+    isAll = tf.placeholder(dtype=tf.bool, shape=())
+    noise = CenNormal().random(shape=(K,), name="noise", dtype=dtype)
+    noise.updateType = SwitchedType(isAll, UpdateType.ALL,
+                                    UpdateType.ONLYLATENTS)
+    tauVar = noise.vars("tau")
+    noise.update(data)
+    tau = noise.tau
+    tauFit = 1./tf.reduce_mean(data**2, axis=0)
+
+    with tf.Session() as sess:
+        sess.run(tf.global_variables_initializer())
+        tauInit = sess.run(tauVar)
+        tauLatents = sess.run(tau, feed_dict={isAll: False})
+        assert(np.allclose(tauLatents, tauInit))
+        tauAll, tauFit = sess.run([tau, tauFit], feed_dict={isAll: True})
+        assert(np.allclose(tauAll, tauFit))
+        assert(np.allclose(sess.run(tauVar), tauFit))
+    tf.reset_default_graph()
+
+
+def test_switchedType_updateWhen(device, dtype):
+    """Test that owners of a distribution can update it for one type."""
+    npdtype = dtype.as_numpy_dtype
+    isAll = tf.placeholder(dtype=tf.bool, shape=())
+    noise = CenNormal().random(shape=(1,), name="noise", dtype=dtype)
+    noise.updateType = SwitchedType(isAll, UpdateType.ALL,
+                                    UpdateType.ONLYLATENTS)
+    tauVar = noise.vars("tau")
+
+    def update():
+        noise.tau = tf.constant([2.], dtype=dtype)
+    noise.updateWhen(UpdateType.ALL, update)
+    tau = noise.tau
+
+    with tf.Session() as sess:
+        sess.run(tf.global_variables_initializer())
+        tauInit = sess.run(tauVar)
+        assert(np.allclose(sess.run(tau, feed_dict={isAll: False}),
+                           tauInit))
+        assert(np.allclose(sess.run(tau, feed_dict={isAll: True}), 2.))
+        assert(np.allclose(sess.run(tauVar), np.array([2.], dtype=npdtype)))
+    tf.reset_default_graph()
+
+
+def test_switchedType_draw(device, dtype):
+    """Test that the draw type is selected at runtime."""
+    npdtype = dtype.as_numpy_dtype
+    isSample = tf.placeholder(dtype=tf.bool, shape=())
+    mu = np.array([-1., 0., 1.], dtype=npdtype)
+    normal = Normal().random(shape=(3,), name="normal", dtype=dtype,
+                             persistent=False)
+    normal.mu = tf.constant(mu)
+    normal.drawType = SwitchedType(isSample, DrawType.SAMPLE, DrawType.MODE)
+    r = normal.draw()
+
+    with tf.Session() as sess:
+        rMode = sess.run(r, feed_dict={isSample: False})
+        rSample = sess.run(r, feed_dict={isSample: True})
+    assert(np.allclose(rMode, mu))
+    assert(not np.allclose(rSample, mu))
+    tf.reset_default_graph()
@@ -0,0 +1,111 @@
+import time
+import pytest
+import numpy as np
+import scipy as sp
+import scipy.stats
+import tensorflow as tf
+
+from decompose.distributions.newton import newtonMaximize, derivatives
+from decompose.distributions.lomaxAlgorithms import LomaxAlgorithms
+from decompose.distributions.cenDoubleLomaxAlgorithms import \
+    CenDoubleLomaxAlgorithms
+from decompose.distributions.nnNormalAlgorithms import NnNormalAlgorithms
+from decompose.tests.fixtures import device, dtype
+
+
+def test_newtonMaximize(device, dtype):
+    """Test the maxima of concave and of non-concave objectives."""
+    npdtype = dtype.as_numpy_dtype
+    center = np.array([-3., 0., 5.], dtype=npdtype)
+
+    def concave(x):
+        return(-(x - center)**2)
+
+    def bimodal(x):
+        return(-(x**2 - 1.)**2)
+
+    x0 = tf.constant(np.array([1., 1., 1.], dtype=npdtype))
+    xConcave, fConcave = newtonMaximize(derivatives(concave), x0,
+                                        nIterations=10)
+    x0 = tf.constant(np.array([-0.5, 0.5, 3.], dtype=npdtype))
+    xBimodal, fBimodal = newtonMaximize(derivatives(bimodal), x0,
+                                        nIterations=50, maxStep=0.5)
+    with tf.Session() as sess:
+        xConcave, fConcave, xBimodal = sess.run([xConcave, fConcave,
+                                                 xBimodal])
+
+    assert(np.allclose(xConcave, center))
+    assert(np.allclose(fConcave, 0.))
+    assert(np.allclose(xBimodal, [-1., 1., 1.], atol=1e-3))
+    tf.reset_default_graph()
+
+
+def test_newtonMaximize_domain(device, dtype):
+    """Test that steps out of the domain of the objective are rejected."""
+    npdtype = dtype.as_numpy_dtype
+
+    def logBarrier(x):
+        return(tf.log(x) - x)
+
+    x0 = tf.constant(np.array([0.1, 3.], dtype=npdtype))
+    x, fx = newtonMaximize(derivatives(logBarrier), x0, nIterations=30,
+                           maxStep=10.)
+    with tf.Session() as sess:
+        x, fx = sess.run([x, fx])
+    assert(np.allclose(x, 1., atol=1e-3))
+    assert(np.all(np.isfinite(fx)))
+    tf.reset_default_graph()
+
+
+def maxNodeBytes(runMetadata):
+    """Largest memory allocated by a single node of a traced run."""
+    maxBytes = 0
+    for devStats in runMetadata.step_stats.dev_stats:
+        for nodeStats in devStats.node_stats:
+            nodeBytes = sum(memory.peak_bytes for memory in nodeStats.memory)
+            maxBytes = max(maxBytes, nodeBytes)
+    return(maxBytes)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("algorithms, parameters, distribution", [
+    (LomaxAlgorithms,
+     {"alpha": [1., 1.5, 2., 3.], "beta": [1., 2., 3., 0.5]},
+     lambda p: sp.stats.lomax(c=p["alpha"], scale=p["beta"])),
+    (CenDoubleLomaxAlgorithms,
+     {"alpha": [1., 1.5, 2., 3.], "beta": [1., 2., 3., 0.5]},
+     lambda p: sp.stats.lomax(c=p["alpha"], scale=p["beta"])),
+    (NnNormalAlgorithms,
+     {"mu": [-1., 0., 1., 2.], "tau": [0.5, 1., 2., 4.]},
+     lambda p: sp.stats.truncnorm(a=-p["mu"]*np.sqrt(p["tau"]), b=np.inf,
+                                  loc=p["mu"], scale=1./np.sqrt(p["tau"])))])
+def test_fit_timeAndMemory(device, algorithms, parameters, distribution):
+    """Benchmarks the fit time and the largest allocation of a fit."""
+    nSamples, nRuns = 1000000, 5
+    parameters = {key: np.array(value) for key, value in parameters.items()}
+    K = len(next(iter(parameters.values())))
+    data = distribution(parameters).rvs((nSamples, K)).astype(np.float32)
+
+    tfData = tf.placeholder(dtype=tf.float32, shape=data.shape)
+    initialParameters = {key: tf.ones(K) for key in parameters.keys()}
+    fittedParameters = algorithms.fit(parameters=initialParameters,
+                                      data=tfData)
+    fittedParameters = {key: fittedParameters[key]
+                        for key in parameters.keys()}
+
+    runOptions = tf.RunOptions(trace_level=tf.RunOptions.FULL_TRACE)
+    runMetadata = tf.RunMetadata()
+    with tf.Session() as sess:
+        sess.run(fittedParameters, feed_dict={tfData: data},
+                 options=runOptions, run_metadata=runMetadata)
+        t0 = time.perf_counter()
+        for run in range(nRuns):
+            sess.run(fittedParameters, feed_dict={tfData: data})
+        fitTime = (time.perf_counter() - t0)/nRuns
+    maxBytes = maxNodeBytes(runMetadata)
+
+    print(f"{algorithms.__name__}: fit {fitTime:.3f}s, largest "
+          f"allocation {maxBytes/data.nbytes:.2f} times the data")
+    # the data must never be expanded by the number of candidate steps
+    assert(maxBytes <= 2*data.nbytes)
+    tf.reset_default_graph()
@@ -5,6 +5,10 @@ import scipy.stats
 import tensorflow as tf
 
 from decompose.distributions.tAlgorithms import TAlgorithms
+from decompose.distributions.t import T
+from decompose.distributions.distribution import Properties
+from decompose.distributions.algorithms import FIT_ITERATIONS
+from decompose.tests.fixtures import device, dtype
 
 @pytest.mark.slow
 def test_t_sample():
@@ -181,3 +185,39 @@ def test_t_fit():
     assert(PsiHat.shape == Psi.shape)
     assert(np.allclose(PsiHat, Psi, atol=1e-1))
     tf.reset_default_graph()
+
+
+def test_t_fitIterations(device, dtype):
+    """Test that warm started fits stop early and record their rounds."""
+    npdtype = dtype.as_numpy_dtype
+    mu = np.array([-1, 0., 1.])
+    nu = np.array([2., 4., 8.])
+    Psi = np.array([0.5, 1., 2.])
+    nParameters = mu.shape[0]
+    nSamples = 10000
+    nFits = 20
+
+    data = sp.stats.t(df=nu, loc=mu, scale=np.sqrt(Psi)).rvs(
+        (nSamples, nParameters)).astype(npdtype)
+    ones = np.ones(nParameters, dtype=npdtype)
+    properties = Properties(name="prior", dtype=dtype, persistent=True)
+    t = T(mu=tf.constant(0.*ones), Psi=tf.constant(ones),
+          nu=tf.constant(ones),
+          tau=tf.constant(np.ones((nSamples, nParameters), dtype=npdtype)),
+          properties=properties)
+    t.fit(tf.constant(data))
+    parameterUpdate = t.get_parameters()
+    fitIterations = tf.get_collection(FIT_ITERATIONS)
+    assert(len(fitIterations) == 1)
+
+    iterations = []
+    with tf.Session() as sess:
+        sess.run(tf.global_variables_initializer())
+        sess.run(tf.local_variables_initializer())
+        for i in range(nFits):
+            sess.run(parameterUpdate)
+            iterations.append(sess.run(fitIterations[0]))
+
+    assert(iterations[0] == 5)
+    assert(iterations[-1] <= 2)
+    tf.reset_default_graph()
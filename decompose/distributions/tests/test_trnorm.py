@@ -0,0 +1,129 @@
+import time
+import pytest
+import numpy as np
+import scipy as sp
+import scipy.stats
+import tensorflow as tf
+
+from decompose.distributions.trnorm import rtnorm
+from decompose.tests.fixtures import device, dtype
+
+
+# (a, b, mu, sigma) covering all regions of the sampler
+cases = [(0., np.inf, -3., 1.),
+         (0., np.inf, 0., 1.),
+         (0., np.inf, 1., 2.),
+         (0., np.inf, -10., 1.),
+         (0., np.inf, -1.5, 0.5),
+         (-1., 1., 0., 1.),
+         (0.5, 0.6, 0., 1.),
+         (-0.05, 0.05, 0., 1.),
+         (-0.6, -0.5, 0., 1.),
+         (2., 3., 0., 1.),
+         (-4., np.inf, 0., 1.),
+         (-np.inf, -3., 0., 1.),
+         (-1., 2.5, 0.3, 0.7)]
+
+
+def parameters(npdtype):
+    a, b, mu, sigma = (np.array(p, dtype=npdtype) for p in zip(*cases))
+    return(a, b, mu, sigma)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("maxIterations", [100, 0])
+def test_rtnorm(device, dtype, maxIterations):
+    """Test whether the samples follow the truncated normal of scipy.
+
+    Without iterations all rejected elements fall back to the inverse CDF.
+    """
+    npdtype = dtype.as_numpy_dtype
+    a, b, mu, sigma = parameters(npdtype)
+    nSamples = 20000
+
+    r = rtnorm(a=tf.constant(a), b=tf.constant(b), mu=tf.constant(mu),
+               sigma=tf.constant(sigma), nSamples=nSamples,
+               maxIterations=maxIterations)
+    assert(r.dtype == dtype)
+    with tf.Session() as sess:
+        r = sess.run(r)
+    assert(r.shape == (nSamples, len(cases)))
+
+    for i, (ai, bi, mui, sigmai) in enumerate(cases):
+        norm = sp.stats.truncnorm(a=(ai-mui)/sigmai, b=(bi-mui)/sigmai,
+                                  loc=mui, scale=sigmai)
+        assert(np.all((r[:, i] >= ai) & (r[:, i] <= bi)))
+        assert(sp.stats.kstest(r[:, i], norm.cdf).pvalue > 1e-4)
+    tf.reset_default_graph()
+
+
+@pytest.mark.slow
+def test_rtnorm_samplesPerSecond(device, dtype):
+    """Benchmarks the sampler against `scipy.stats.truncnorm`."""
+    npdtype = dtype.as_numpy_dtype
+    a, b, mu, sigma = parameters(npdtype)
+    nSamples, nRuns = 100000, 5
+
+    r = rtnorm(a=tf.constant(a), b=tf.constant(b), mu=tf.constant(mu),
+               sigma=tf.constant(sigma), nSamples=nSamples)
+    with tf.Session() as sess:
+        sess.run(r)
+        t0 = time.perf_counter()
+        for run in range(nRuns):
+            sess.run(r)
+        tfRate = nRuns*r.get_shape().num_elements()/(time.perf_counter()-t0)
+
+    norm = sp.stats.truncnorm(a=(a-mu)/sigma, b=(b-mu)/sigma, loc=mu,
+                              scale=sigma)
+    t0 = time.perf_counter()
+    for run in range(nRuns):
+        spR = norm.rvs(size=(nSamples, len(cases)))
+    spRate = nRuns*spR.size/(time.perf_counter()-t0)
+
+    print(f"{dtype.name}: rtnorm {tfRate:.3g} samples/s, "
+          f"scipy {spRate:.3g} samples/s")
+    assert(tfRate > 0.)
+    tf.reset_default_graph()
+
+
+@pytest.mark.slow
+def test_rtnorm_tailLatency(device, dtype):
+    """Measures the latency of NnNormal draws with adversarial means.
+
+    Very negative means put the truncation point far into the right tail
+    of the standardized distribution, means close to the boundaries of
+    the regions of the sampler maximize its rejection rates.
+    """
+    npdtype = dtype.as_numpy_dtype
+    nParameters, nSamples, nRuns = 1000, 10, 200
+    sigma = np.logspace(-3, 1, nParameters).astype(npdtype)
+    xmax = 3.48672170399
+    adversarial = np.concatenate((-np.logspace(0, 6, nParameters//2),
+                                  np.linspace(-xmax-0.1, -xmax+0.1,
+                                              nParameters//4),
+                                  np.linspace(-2.1, -1.9,
+                                              nParameters//4)))
+    inputs = {"benign": np.ones(nParameters),
+              "adversarial": adversarial}
+
+    latencies = {}
+    for name, muStd in inputs.items():
+        mu = tf.constant((muStd*sigma).astype(npdtype))
+        a = tf.zeros_like(mu)
+        b = tf.ones_like(a)*np.inf
+        r = rtnorm(a=a, b=b, mu=mu, sigma=tf.constant(sigma),
+                   nSamples=nSamples)
+        times = []
+        with tf.Session() as sess:
+            sess.run(r)
+            for run in range(nRuns):
+                t0 = time.perf_counter()
+                rValue = sess.run(r)
+                times.append(time.perf_counter() - t0)
+        assert(np.all(np.isfinite(rValue)) and np.all(rValue >= 0.))
+        latencies[name] = np.percentile(times, [50, 99, 100])
+        print(f"{dtype.name} {name}: p50 {latencies[name][0]:.4f}s, "
+              f"p99 {latencies[name][1]:.4f}s, "
+              f"max {latencies[name][2]:.4f}s")
+        tf.reset_default_graph()
+    assert(latencies["adversarial"][1] < 20*latencies["benign"][1])
@@ -7,6 +7,7 @@ from decompose.distributions.distribution import Properties
 from decompose.distributions.distribution import DrawType, UpdateType
 from decompose.distributions.cenNormalRankOne import CenNormalRankOne
 from decompose.likelihoods.likelihood import Likelihood
+from decompose.likelihoods.stepCache import stepCached
 
 
 class AllSpecificNormal2dLikelihood(Likelihood):
@@ -38,6 +39,7 @@ class AllSpecificNormal2dLikelihood(Likelihood):
     def noiseDistribution(self) -> CenNormalRankOne:
         return(self.__noiseDistribution)
 
+    @stepCached
     def residuals(self, U: Tuple[Tensor, ...], X: Tensor) -> Tensor:
         assert(len(U) == 2)
         U0, U1 = U
@@ -55,9 +57,9 @@ class AllSpecificNormal2dLikelihood(Likelihood):
         return(loss)
 
     def update(self, U: Tuple[Tensor, ...], X: Tensor) -> None:
-        if self.noiseDistribution.updateType == UpdateType.ALL:
-            residuals = self.residuals(U, X)
-            self.noiseDistribution.update(residuals)
+        residuals = self.residuals(U, X)
+        self.noiseDistribution.updateWhen(
+            UpdateType.ALL, lambda: self.noiseDistribution.update(residuals))
 
     def prepVars(self, f: int, U: List[Tensor],
                  X: Tensor) -> Tuple[Tensor, Tensor, Tensor]:
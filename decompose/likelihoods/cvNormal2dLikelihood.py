@@ -6,19 +6,32 @@ from tensorflow import Tensor
 from decompose.distributions.distribution import DrawType, UpdateType
 from decompose.distributions.cenNormal import CenNormal
 from decompose.likelihoods.likelihood import Likelihood
+from decompose.likelihoods.stepCache import stepCached
 from decompose.distributions.distribution import Properties
 from decompose.cv.cv import CV
 
 
 class CVNormal2dLikelihood(Likelihood):
+    """Normal likelihood of a matrix with missing or held out entries.
+
+    If the matrix is fully observed and the test set of the cross
+    validation `cv` is a single block (see `CV.testSlices`) the masks are
+    not materialised. The residuals are then calculated on the slices of
+    the test and the training set and the statistics `A` and `B` of the
+    training set are those of the full matrix less those of the test
+    block.
+    """
 
     def __init__(self, M: Tuple[int, ...], K: int=1, tau: float = 1./1e10,
                  cv: CV = None,
                  drawType: DrawType = DrawType.SAMPLE,
                  updateType: UpdateType = UpdateType.ALL,
-                 dtype=tf.float32) -> None:
+                 dtype=tf.float32,
+                 isFullyObserved: bool = False) -> None:
         Likelihood.__init__(self, M, K)
         self.__cv = cv
+        self.__factored = (isFullyObserved and cv is not None
+                           and cv.isLowrank())
         self.__tauInit = tau
         self.__dtype = dtype
         self.__properties = Properties(name='likelihood',
@@ -33,33 +46,45 @@ class CVNormal2dLikelihood(Likelihood):
         noiseDistribution = CenNormal(tau=tf.constant([tau], dtype=dtype),
                                       properties=properties)
         self.__noiseDistribution = noiseDistribution
-        observedMask = tf.logical_not(tf.is_nan(data))
-        trainMask = tf.logical_not(self.cv.mask(X=data))
-        trainMask = tf.get_variable("trainMask",
-                                    dtype=trainMask.dtype,
-                                    initializer=trainMask)
-        trainMask = tf.logical_and(trainMask, observedMask)
-        testMask = tf.logical_and(observedMask,
-                                  tf.logical_not(trainMask))
-        self.__observedMask = observedMask
-        self.__trainMask = trainMask
-        self.__testMask = testMask
+        self.__data = data
+        self.__observedMask = tf.logical_not(tf.is_nan(data))
+        if self.factored:
+            self.__testSlices = self.cv.testSlices(self.M)
+            self.__trainSlices = self.cv.trainSlices(self.M)
 
     @property
     def cv(self) -> CV:
         return(self.__cv)
 
+    @property
+    def factored(self) -> bool:
+        """Whether the masks are given by slices of the data."""
+        return(self.__factored)
+
     @property
     def observedMask(self) -> Tensor:
         return(self.__observedMask)
 
+    @stepCached
+    def foldMask(self, data: Tensor) -> Tensor:
+        """Test mask of the cross validation.
+
+        The mask is not stored but regenerated by `cv` when it is needed.
+        """
+        return(self.cv.mask(X=data))
+
     @property
     def trainMask(self) -> Tensor:
-        return(self.__trainMask)
+        if self.cv is None:
+            return(self.observedMask)
+        trainMask = tf.logical_not(self.foldMask(self.__data))
+        return(tf.logical_and(trainMask, self.observedMask))
 
     @property
     def testMask(self) -> Tensor:
-        return(self.__testMask)
+        testMask = tf.logical_and(self.observedMask,
+                                  tf.logical_not(self.trainMask))
+        return(testMask)
 
     @property
     def noiseDistribution(self) -> CenNormal:
@@ -68,20 +93,39 @@ class CVNormal2dLikelihood(Likelihood):
     def residuals(self, U: Tuple[Tensor, ...], X: Tensor) -> Tensor:
         return(self.testResiduals(U, X))
 
-    def testResiduals(self, U: Tuple[Tensor, ...], X: Tensor) -> Tensor:
+    @stepCached
+    def reconstruction(self, U: Tuple[Tensor, ...]) -> Tensor:
         assert(len(U) == 2)
         U0, U1 = U
         Xhat = tf.matmul(tf.transpose(U0), U1)
+        return(Xhat)
+
+    def blockResiduals(self, U: Tuple[Tensor, ...], X: Tensor,
+                       slices: Tuple[slice, ...]) -> Tensor:
+        """Flattened residuals of the block of `X` selected by `slices`."""
+        U0, U1 = U
+        Xhat = tf.matmul(U0[:, slices[0]], U1[:, slices[1]], transpose_a=True)
+        residuals = tf.reshape(X[slices] - Xhat, (-1,))
+        return(residuals)
+
+    @stepCached
+    def testResiduals(self, U: Tuple[Tensor, ...], X: Tensor) -> Tensor:
+        if self.factored:
+            return(self.blockResiduals(U, X, self.__testSlices))
+        Xhat = self.reconstruction(U)
         residuals = tf.reshape(X-Xhat, (-1,))
         indices = tf.cast(tf.where(tf.reshape(self.testMask, (-1,))),
                           dtype=tf.int32)
         testResiduals = tf.gather_nd(residuals, indices)
         return(testResiduals)
 
+    @stepCached
     def trainResiduals(self, U: Tuple[Tensor, ...], X: Tensor) -> Tensor:
-        assert(len(U) == 2)
-        U0, U1 = U
-        Xhat = tf.matmul(tf.transpose(U0), U1)
+        if self.factored:
+            residuals = [self.blockResiduals(U, X, slices)
+                         for slices in self.__trainSlices]
+            return(tf.concat(residuals, axis=0))
+        Xhat = self.reconstruction(U)
         residuals = tf.reshape(X-Xhat, (-1,))
         indices = tf.cast(tf.where(tf.reshape(self.trainMask, (-1,))),
                           dtype=tf.int32)
@@ -98,14 +142,17 @@ class CVNormal2dLikelihood(Likelihood):
         return(loss)
 
     def update(self, U: Tuple[Tensor, ...], X: Tensor) -> None:
-        if self.noiseDistribution.updateType == UpdateType.ALL:
-            residuals = self.trainResiduals(U, X)
-            flattenedResiduals = residuals[..., None]
-            self.noiseDistribution.update(flattenedResiduals)
+        residuals = self.trainResiduals(U, X)
+        flattenedResiduals = residuals[..., None]
+        self.noiseDistribution.updateWhen(
+            UpdateType.ALL,
+            lambda: self.noiseDistribution.update(flattenedResiduals))
 
     def prepVars(self, f: int, U: List[Tensor],
                  X: Tensor) -> Tuple[Tensor, Tensor, Tensor]:
-        trainMask = tf.cast(self.__trainMask, dtype=U[0].dtype)
+        if self.factored:
+            return(self.factoredPrepVars(f, U, X))
+        trainMask = tf.cast(self.trainMask, dtype=U[0].dtype)
         if f == 0:
             U1 = U[1]
         else:
@@ -115,6 +162,73 @@ class CVNormal2dLikelihood(Likelihood):
         U1T = tf.transpose(U1)
 
         A = tf.matmul(X*trainMask, U1T)
-        B = tf.einsum("mn,in,jn->mij", trainMask, U1, U1)
+
+        # the Gram matrices of the rows are calculated in `gramColumns`
+        # only for the components that are updated
+        B = (trainMask, U1)
         alpha = self.noiseDistribution.tau
         return(A, B, alpha)
+
+    def gramColumns(self, VVT: Tuple[Tensor, Tensor], start: Tensor,
+                    stop: Tensor) -> Tuple[Tensor, Tensor]:
+        """Columns `start` to `stop` of the Gram matrices of the rows.
+
+        The Gram matrix of the `m`-th row is `sum_n mask[m, n] v_n v_n^T`
+        where `v_n` are the filters of the `n`-th column. The largest
+        temporary has `stop - start` times the size of the mask instead
+        of `K^2` times.
+        """
+        if self.factored:
+            return(self.factoredGramColumns(VVT, start, stop))
+        trainMask, U1 = VVT
+        U1Block = U1[start:stop]
+        maskedU1Block = trainMask[:, None]*U1Block[None]
+        VvT = tf.transpose(tf.tensordot(maskedU1Block, U1, axes=[[2], [1]]),
+                           (0, 2, 1))
+        vvT = tf.matmul(trainMask, U1Block**2, transpose_b=True)
+        return(VvT, vvT)
+
+    def factoredPrepVars(self, f: int, U: List[Tensor],
+                         X: Tensor) -> Tuple[Tensor, Tensor, Tensor]:
+        """`prepVars` of the training set if the test set is a block.
+
+        The statistics of the test block are subtracted from those of the
+        full matrix. `B` holds the Gram matrix of the other filter bank,
+        the Gram matrix of its columns in the test block and the indicator
+        of the rows of the test block.
+        """
+        slices = self.__testSlices
+        if f == 0:
+            U1 = U[1]
+        else:
+            U1 = U[0]
+            X = tf.transpose(X)
+            slices = slices[::-1]
+        XTest = X[slices]
+        rows, cols = slices
+        U1T = tf.transpose(U1)
+        U1Test = U1[:, cols]
+
+        Mf = self.M[f]
+        padding = [[rows.start, Mf - rows.stop], [0, 0]]
+        A = (tf.matmul(X, U1T)
+             - tf.pad(tf.matmul(XTest, U1Test, transpose_b=True), padding))
+
+        testRows = tf.pad(tf.ones((rows.stop - rows.start,), dtype=X.dtype),
+                          padding[:1])
+        B = (tf.matmul(U1, U1T), tf.matmul(U1Test, U1Test, transpose_b=True),
+             testRows)
+        alpha = self.noiseDistribution.tau
+        return(A, B, alpha)
+
+    def factoredGramColumns(self, VVT: Tuple[Tensor, Tensor, Tensor],
+                            start: Tensor, stop: Tensor
+                            ) -> Tuple[Tensor, Tensor]:
+        """`gramColumns` of the statistics of `factoredPrepVars`."""
+        G, GTest, testRows = VVT
+        VvT = (G[None, :, start:stop]
+               - testRows[:, None, None]*GTest[None, :, start:stop])
+        diagG = tf.matrix_diag_part(G)[start:stop]
+        diagGTest = tf.matrix_diag_part(GTest)[start:stop]
+        vvT = diagG[None] - testRows[:, None]*diagGTest[None]
+        return(VvT, vvT)
@@ -7,19 +7,32 @@ import string
 from decompose.distributions.distribution import DrawType, UpdateType
 from decompose.distributions.cenNormal import CenNormal
 from decompose.likelihoods.likelihood import Likelihood
+from decompose.likelihoods.stepCache import stepCached
 from decompose.distributions.distribution import Properties
 from decompose.cv.cv import CV
 
 
 class CVNormalNdLikelihood(Likelihood):
+    """Normal likelihood of a tensor with missing or held out entries.
+
+    If the tensor is fully observed and the test set of the cross
+    validation `cv` is a single block (see `CV.testSlices`) the masks are
+    not materialised. The residuals are then calculated on the slices of
+    the test and the training set and the statistics `A` and `B` of the
+    training set are those of the full tensor less those of the test
+    block.
+    """
 
     def __init__(self, M: Tuple[int, ...], K: int=1, tau: float = 1./1e10,
                  cv: CV = None,
                  drawType: DrawType = DrawType.SAMPLE,
                  updateType: UpdateType = UpdateType.ALL,
-                 dtype=tf.float32) -> None:
+                 dtype=tf.float32,
+                 isFullyObserved: bool = False) -> None:
         Likelihood.__init__(self, M, K)
         self.__cv = cv
+        self.__factored = (isFullyObserved and cv is not None
+                           and cv.isLowrank())
         self.__tauInit = tau
         self.__dtype = dtype
         self.__properties = Properties(name='likelihood',
@@ -34,33 +47,45 @@ class CVNormalNdLikelihood(Likelihood):
         noiseDistribution = CenNormal(tau=tf.constant([tau], dtype=dtype),
                                       properties=properties)
         self.__noiseDistribution = noiseDistribution
-        observedMask = tf.logical_not(tf.is_nan(data))
-        trainMask = tf.logical_not(self.cv.mask(X=data))
-        trainMask = tf.get_variable("trainMask",
-                                    dtype=trainMask.dtype,
-                                    initializer=trainMask)
-        trainMask = tf.logical_and(trainMask, observedMask)
-        testMask = tf.logical_and(observedMask,
-                                  tf.logical_not(trainMask))
-        self.__observedMask = observedMask
-        self.__trainMask = trainMask
-        self.__testMask = testMask
+        self.__data = data
+        self.__observedMask = tf.logical_not(tf.is_nan(data))
+        if self.factored:
+            self.__testSlices = self.cv.testSlices(self.M)
+            self.__trainSlices = self.cv.trainSlices(self.M)
 
     @property
     def cv(self) -> CV:
         return(self.__cv)
 
+    @property
+    def factored(self) -> bool:
+        """Whether the masks are given by slices of the data."""
+        return(self.__factored)
+
     @property
     def observedMask(self) -> Tensor:
         return(self.__observedMask)
 
+    @stepCached
+    def foldMask(self, data: Tensor) -> Tensor:
+        """Test mask of the cross validation.
+
+        The mask is not stored but regenerated by `cv` when it is needed.
+        """
+        return(self.cv.mask(X=data))
+
     @property
     def trainMask(self) -> Tensor:
-        return(self.__trainMask)
+        if self.cv is None:
+            return(self.observedMask)
+        trainMask = tf.logical_not(self.foldMask(self.__data))
+        return(tf.logical_and(trainMask, self.observedMask))
 
     @property
     def testMask(self) -> Tensor:
-        return(self.__testMask)
+        testMask = tf.logical_and(self.observedMask,
+                                  tf.logical_not(self.trainMask))
+        return(testMask)
 
     @property
     def noiseDistribution(self) -> CenNormal:
@@ -69,22 +94,43 @@ class CVNormalNdLikelihood(Likelihood):
     def residuals(self, U: Tuple[Tensor, ...], X: Tensor) -> Tensor:
         return(self.testResiduals(U, X))
 
-    def testResiduals(self, U: Tuple[Tensor, ...], X: Tensor) -> Tensor:
+    @stepCached
+    def reconstruction(self, U: Tuple[Tensor, ...]) -> Tensor:
         F = len(U)
         axisIds = string.ascii_lowercase[:F]
         subscripts = f'k{",k".join(axisIds)}->{axisIds}'
         Xhat = tf.einsum(subscripts, *U)
+        return(Xhat)
+
+    def blockResiduals(self, U: Tuple[Tensor, ...], X: Tensor,
+                       slices: Tuple[slice, ...]) -> Tensor:
+        """Flattened residuals of the block of `X` selected by `slices`."""
+        F = len(U)
+        axisIds = string.ascii_lowercase[:F]
+        subscripts = f'k{",k".join(axisIds)}->{axisIds}'
+        UBlock = [Uf[:, s] for Uf, s in zip(U, slices)]
+        Xhat = tf.einsum(subscripts, *UBlock)
+        residuals = tf.reshape(X[slices] - Xhat, (-1,))
+        return(residuals)
+
+    @stepCached
+    def testResiduals(self, U: Tuple[Tensor, ...], X: Tensor) -> Tensor:
+        if self.factored:
+            return(self.blockResiduals(U, X, self.__testSlices))
+        Xhat = self.reconstruction(U)
         residuals = tf.reshape(X-Xhat, (-1,))
         indices = tf.cast(tf.where(tf.reshape(self.testMask, (-1,))),
                           dtype=tf.int32)
         testResiduals = tf.gather_nd(residuals, indices)
         return(testResiduals)
 
+    @stepCached
     def trainResiduals(self, U: Tuple[Tensor, ...], X: Tensor) -> Tensor:
-        F = len(U)
-        axisIds = string.ascii_lowercase[:F]
-        subscripts = f'k{",k".join(axisIds)}->{axisIds}'
-        Xhat = tf.einsum(subscripts, *U)
+        if self.factored:
+            residuals = [self.blockResiduals(U, X, slices)
+                         for slices in self.__trainSlices]
+            return(tf.concat(residuals, axis=0))
+        Xhat = self.reconstruction(U)
         residuals = tf.reshape(X-Xhat, (-1,))
         indices = tf.cast(tf.where(tf.reshape(self.trainMask, (-1,))),
                           dtype=tf.int32)
@@ -101,43 +147,90 @@ class CVNormalNdLikelihood(Likelihood):
         return(loss)
 
     def update(self, U: Tuple[Tensor, ...], X: Tensor) -> None:
-        if self.noiseDistribution.updateType == UpdateType.ALL:
-            residuals = self.trainResiduals(U, X)
-            flattenedResiduals = residuals[..., None]
-            self.noiseDistribution.update(flattenedResiduals)
-
-    def outterTensorProduct(self, Us):
-        F = len(Us)
-        axisIds = string.ascii_lowercase[:F]
-        subscripts = f'k{",k".join(axisIds)}->{axisIds}k'
-        Xhat = tf.einsum(subscripts, *Us)
-        return(Xhat)
-
-    def calcB(self, mask, UmfOutter, f, F):
-        axisIds0 = (string.ascii_lowercase[:f]
-                    + "x"
-                    + string.ascii_lowercase[f:F-1])
-        axisIds1 = string.ascii_lowercase[:F-1] + "y"
-        axisIds2 = string.ascii_lowercase[:F-1] + "z"
-        subscripts = (axisIds0 + ","
-                      + axisIds1 + ","
-                      + axisIds2 + "->"
-                      + "xyz")
-        B = tf.einsum(subscripts, mask, UmfOutter, UmfOutter)
-        return(B)
+        residuals = self.trainResiduals(U, X)
+        flattenedResiduals = residuals[..., None]
+        self.noiseDistribution.updateWhen(
+            UpdateType.ALL,
+            lambda: self.noiseDistribution.update(flattenedResiduals))
 
     def prepVars(self, f: int, U: List[Tensor],
                  X: Tensor) -> Tuple[Tensor, Tensor, Tensor]:
+        if self.factored:
+            return(self.factoredPrepVars(f, U, X))
         mask = tf.cast(self.trainMask, dtype=U[0].dtype)
-        F = self.F
-
-        Umf = [U[g] for g in range(F) if g != f]
-        UmfOutter = self.outterTensorProduct(Umf)
+        A = self.mttkrp(X*mask, U, f)
 
-        rangeFm1 = list(range(F-1))
-        A = tf.tensordot(X*mask, UmfOutter,
-                         axes=([g for g in range(F) if g != f], rangeFm1))
+        # the Gram matrices are calculated in `gramColumns` only for the
+        # components that are updated
+        B = (mask, U, f)
+        alpha = self.noiseDistribution.tau
+        return(A, B, alpha)
 
-        B = self.calcB(mask, UmfOutter, f, F)
+    def gramColumns(self, VVT: Tuple[Tensor, List[Tensor], int],
+                    start: Tensor, stop: Tensor) -> Tuple[Tensor, Tensor]:
+        """Columns `start` to `stop` of the Gram matrices along axis `f`.
+
+        The largest temporary has `stop - start` times the size of the
+        mask instead of the outer product of all other filter banks.
+        """
+        if self.factored:
+            return(self.factoredGramColumns(VVT, start, stop))
+        mask, U, f = VVT
+        F, M = self.F, self.M
+        maskedUBlock = mask[..., None]
+        maskedUBlock2 = mask[..., None]
+        for g in range(F):
+            if g == f:
+                continue
+            shape = [1]*F + [-1]
+            shape[g] = M[g]
+            UgBlock = tf.reshape(tf.transpose(U[g][start:stop]), shape)
+            maskedUBlock = maskedUBlock*UgBlock
+            maskedUBlock2 = maskedUBlock2*UgBlock**2
+        VvT = self.mttkrp(maskedUBlock, U, f, extra="z")
+        VvT = tf.transpose(VvT, (0, 2, 1))
+        vvT = tf.reduce_sum(maskedUBlock2,
+                            axis=[g for g in range(F) if g != f])
+        return(VvT, vvT)
+
+    def factoredPrepVars(self, f: int, U: List[Tensor],
+                         X: Tensor) -> Tuple[Tensor, Tensor, Tensor]:
+        """`prepVars` of the training set if the test set is a block.
+
+        The statistics of the test block are subtracted from those of the
+        full tensor. `B` holds the Hadamard product of the Gram matrices
+        of the other filter banks, the same product restricted to the
+        test block and the indicator of the test block along axis `f`.
+        """
+        slices = self.__testSlices
+        UTest = [Ug[:, s] for Ug, s in zip(U, slices)]
+        rows = slices[f]
+
+        Mf = self.M[f]
+        padding = [[rows.start, Mf - rows.stop], [0, 0]]
+        A = (self.mttkrp(X, U, f)
+             - tf.pad(self.mttkrp(X[slices], UTest, f), padding))
+
+        G, GTest = 1., 1.
+        for g in range(self.F):
+            if g == f:
+                continue
+            G = G*tf.matmul(U[g], U[g], transpose_b=True)
+            GTest = GTest*tf.matmul(UTest[g], UTest[g], transpose_b=True)
+        testRows = tf.pad(tf.ones((rows.stop - rows.start,), dtype=X.dtype),
+                          padding[:1])
+        B = (G, GTest, testRows)
         alpha = self.noiseDistribution.tau
         return(A, B, alpha)
+
+    def factoredGramColumns(self, VVT: Tuple[Tensor, Tensor, Tensor],
+                            start: Tensor, stop: Tensor
+                            ) -> Tuple[Tensor, Tensor]:
+        """`gramColumns` of the statistics of `factoredPrepVars`."""
+        G, GTest, testRows = VVT
+        VvT = (G[None, :, start:stop]
+               - testRows[:, None, None]*GTest[None, :, start:stop])
+        diagG = tf.matrix_diag_part(G)[start:stop]
+        diagGTest = tf.matrix_diag_part(GTest)[start:stop]
+        vvT = diagG[None] - testRows[:, None]*diagGTest[None]
+        return(VvT, vvT)
@@ -0,0 +1,87 @@
+from abc import abstractmethod
+from typing import Tuple
+import numpy as np
+import tensorflow as tf
+from tensorflow import Tensor
+
+from decompose.likelihoods.likelihood import Likelihood
+from decompose.likelihoods.stepCache import stepCached
+
+
+class HomogeneousNormalLikelihood(Likelihood):
+    """Likelihood with the same Gaussian noise for all entries of the data.
+
+    The sum of the squared residuals is calculated as
+    `||X||^2 - 2<X, Xhat> + <Xhat, Xhat>` where the inner product of the
+    reconstruction `Xhat` with itself is the sum of the element-wise
+    product of the Gram matrices `U[f] U[f]^T` of the filter banks. This
+    avoids to materialise `Xhat` and the residuals. `||X||^2` is
+    calculated only once per dataset and stored in the variable
+    `likelihood/normX2`. The terms are added up in double precision to
+    limit cancellation if the residuals are small.
+    """
+
+    def initNormX2(self) -> None:
+        """Creates the variable that stores `||X||^2` of the data."""
+        with tf.variable_scope("likelihood"):
+            self.__normX2Var = tf.get_variable(
+                "normX2", dtype=tf.float64,
+                initializer=tf.constant(-1., dtype=tf.float64))
+
+    def normX2(self, X: Tensor) -> Tensor:
+        """Squared norm of the data `X` in double precision.
+
+        The norm is calculated when it is requested for the first time.
+        Subclasses that serve changing data must override this method.
+        """
+        normX2Var = self.__normX2Var
+        storedNormX2 = normX2Var.read_value()
+
+        def calcNormX2():
+            normX2 = tf.reduce_sum(tf.square(tf.cast(X, tf.float64)))
+            return(tf.assign(normX2Var, normX2))
+
+        normX2 = tf.cond(tf.less(storedNormX2, 0.), calcNormX2,
+                         lambda: tf.identity(storedNormX2))
+        return(normX2)
+
+    @abstractmethod
+    def innerProduct(self, U: Tuple[Tensor, ...], X: Tensor) -> Tensor:
+        """Inner product `<X, Xhat>` of the data and its reconstruction."""
+        ...
+
+    def gramProduct(self, U: Tuple[Tensor, ...]) -> Tensor:
+        """Inner product `<Xhat, Xhat>` of the reconstruction with itself."""
+        UUT = 1.
+        for Uf in U:
+            UUT = UUT*tf.cast(tf.matmul(Uf, Uf, transpose_b=True), tf.float64)
+        return(tf.reduce_sum(UUT))
+
+    @property
+    def nResiduals(self) -> int:
+        return(int(np.prod(self.M)))
+
+    @stepCached
+    def sumSquaredResiduals(self, U: Tuple[Tensor, ...], X: Tensor) -> Tensor:
+        XXhat = tf.cast(self.innerProduct(U, X), tf.float64)
+        ssr = self.normX2(X) - 2.*XXhat + self.gramProduct(U)
+        ssr = tf.maximum(ssr, tf.constant(0., dtype=tf.float64))
+        return(tf.cast(ssr, U[0].dtype))
+
+    def llh(self, U: Tuple[Tensor, ...], X: Tensor) -> Tensor:
+        ssr = self.sumSquaredResiduals(U, X)
+        tau = self.noiseDistribution.tau[0]
+        llh = (0.5*self.nResiduals*(tf.log(tau) - np.log(2.*np.pi))
+               - 0.5*tau*ssr)
+        return(llh)
+
+    def loss(self, U: Tuple[Tensor, ...], X: Tensor) -> Tensor:
+        loss = self.sumSquaredResiduals(U, X)
+        return(loss)
+
+    def updateNoise(self, U: Tuple[Tensor, ...], X: Tensor) -> None:
+        """Fits the precision of the noise to the squared residuals."""
+        ssr = self.sumSquaredResiduals(U, X)
+        tiny = tf.constant(np.finfo(np.float32).tiny, dtype=ssr.dtype)
+        tau = self.nResiduals/tf.maximum(ssr, tiny)
+        self.noiseDistribution.tau = tf.reshape(tau, (1,))
@@ -1,10 +1,12 @@
 from abc import ABCMeta, abstractmethod
 from typing import Tuple, List
+import string
 import tensorflow as tf
 from tensorflow import Tensor
 
 from decompose.distributions.normal import Normal
 from decompose.distributions.distribution import Distribution, Properties
+from decompose.likelihoods.stepCache import StepCache
 
 
 class Likelihood(metaclass=ABCMeta):
@@ -14,17 +16,37 @@ class Likelihood(metaclass=ABCMeta):
         self.__M = M
         self.__F = len(M)
 
+        # the residuals are shared by the llh, the loss and the update
+        # of the noise within a step (see `TensorFactorisation.startStep`)
+        self.stepCache = StepCache()
+
     @abstractmethod
     def prepVars(self, f: int, U: List[Tensor],
                  X: Tensor) -> Tuple[Tensor, Tensor, Tensor]:
         ...
 
+    def gramColumns(self, VVT: Tensor, start: Tensor,
+                    stop: Tensor) -> Tuple[Tensor, Tensor]:
+        """Columns `start` to `stop` of `VVT` and their diagonal entries.
+
+        `VVT` is the second element returned by `prepVars`. Likelihoods
+        that do not materialise the full Gram matrices in `prepVars`
+        override this method to calculate only the requested columns.
+
+        Returns:
+            `Tuple[Tensor, Tensor]` of shapes `(..., K, stop - start)` and
+            `(..., stop - start)`.
+        """
+        VvT = VVT[..., start:stop]
+        vvT = tf.matrix_diag_part(VVT)[..., start:stop]
+        return(VvT, vvT)
+
     def lhUfk(self, Uf: Tensor, prepVars: Tuple[Tensor, ...],
               f: int, k: Tensor) -> Distribution:
         XVT, VVT, alpha = prepVars
         XvT = XVT[:, k]
-        VvT = VVT[..., k]
-        vvT = VVT[..., k, k]
+        VvT, vvT = self.gramColumns(VVT, k, k+1)
+        VvT, vvT = VvT[..., 0], vvT[..., 0]
         Ufk = Uf[k]
 
         UVvT = tf.reduce_sum(tf.transpose(Uf)*VvT, axis=-1)
@@ -41,6 +63,72 @@ class Likelihood(metaclass=ABCMeta):
         lhUfk = Normal(mu=mu, tau=tau, properties=properties)
         return(lhUfk)
 
+    def lhUfBlock(self, Uf: Tensor, prepVars: Tuple[Tensor, ...],
+                  f: int, start: int, stop: int) -> Distribution:
+        """Likelihood of the components `start` to `stop` of the `f`-th factor.
+
+        Same as `lhUfk` but for a block of components at once. The
+        likelihood of each component in the block is conditioned on the
+        current state of all other components including those in the
+        block.
+
+        Returns:
+            `Normal` of shape `(M[f], stop - start)`.
+        """
+        XVT, VVT, alpha = prepVars
+        XvT = XVT[:, start:stop]
+        VvT, vvT = self.gramColumns(VVT, start, stop)
+        UfT = tf.transpose(Uf)
+
+        if len(VvT.get_shape()) == 2:
+            UVvT = tf.matmul(UfT, VvT)
+        else:
+            UVvT = tf.reduce_sum(UfT[..., None]*VvT, axis=-2)
+        uvvT = UfT[:, start:stop]*vvT
+        Xtildev = XvT - UVvT + uvvT
+
+        mu = Xtildev/vvT
+        tau = vvT*alpha[..., None]
+
+        properties = Properties(name=f"lhU{f}k",
+                                drawType=self.noiseDistribution.drawType,
+                                updateType=self.noiseDistribution.updateType,
+                                persistent=False)
+        lhUfBlock = Normal(mu=mu, tau=tau, properties=properties)
+        return(lhUfBlock)
+
+    def mttkrp(self, T: Tensor, U: List[Tensor], f: int,
+               extra: str = "") -> Tensor:
+        """Matricised tensor times Khatri-Rao product of the filter banks.
+
+        Contracts all axes of `T` but the `f`-th with the corresponding
+        filter banks. The axes are contracted one after the other which
+        avoids to materialise the outer product of the filter banks.
+
+        Arguments:
+            T: `Tensor` of shape `(M[0], ..., M[F-1])` followed by the
+                axes named in `extra`.
+            U: `List[Tensor]`, the filter banks.
+            f: `int`, the axis that is not contracted.
+            extra: `str`, names of the trailing axes of `T`.
+
+        Returns:
+            `Tensor` of shape `(M[f], ..., K)` where the trailing axes of
+            `T` are placed in between.
+        """
+        F = self.F
+        axisIds = string.ascii_lowercase[:F]
+        ids, k = axisIds, ""
+        for g in reversed(range(F)):
+            if g == f:
+                continue
+            contractedIds = ids.replace(axisIds[g], "")
+            subscripts = (f"{ids}{extra}{k},y{axisIds[g]}->"
+                          f"{contractedIds}{extra}y")
+            T = tf.einsum(subscripts, T, U[g])
+            ids, k = contractedIds, "y"
+        return(T)
+
     @abstractmethod
     def update(self, U: Tuple[Tensor, ...], X: Tensor) -> None:
         ...
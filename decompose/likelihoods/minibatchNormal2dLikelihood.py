@@ -0,0 +1,198 @@
+from typing import Tuple, List
+import tensorflow as tf
+from tensorflow import Tensor, DType
+
+from decompose.distributions.distribution import DrawType, UpdateType
+from decompose.likelihoods.normal2dLikelihood import Normal2dLikelihood
+
+
+class MinibatchNormal2dLikelihood(Normal2dLikelihood):
+    """Normal likelihood for matrices that are served in minibatches of rows.
+
+    The likelihood keeps running averages of the sufficient statistics
+    `X^T U0^T`, `U0 U0^T` and of the sum of the squared residuals over
+    all `nRows` rows of the data. Each minibatch contributes its
+    statistics rescaled by `nRows/batchSize` with the Robbins-Monro
+    step size `(t + delay)^(-forgettingRate)`, where `t` is the number
+    of minibatches seen so far. The second factor and the noise are
+    updated from these running statistics while the first factor is
+    only updated for the rows in the current minibatch.
+
+    If `incremental` is `True` the contribution of the previous state of
+    the rows in the minibatch is replaced by the contribution of their
+    updated state instead. The statistics then equal the statistics of
+    the full data as soon as every row has been served once, which
+    allows to fit data that is streamed in blocks from disk exactly.
+    The sum of the squared residuals is then calculated from the
+    statistics and the squared norm of the data.
+
+    Arguments:
+        M: `Tuple[int, int]`, shape of a minibatch.
+        K: `int`, number of components.
+        nRows: `int`, number of rows of the full data.
+        tau: `float`, initial precision of the noise.
+        forgettingRate: `float` in (0.5, 1], decay of the step size.
+        delay: `float` >= 1, down weights early minibatches.
+        rows: `Tensor`, indices of the rows in the current minibatch.
+        incremental: `bool`, whether to update the statistics incrementally.
+        drawType: `DrawType`, draw type of the noise distribution.
+        updateType: `UpdateType`, update type of the noise distribution.
+        dtype: `DType`, type of the data.
+    """
+
+    def __init__(self, M: Tuple[int, ...], K: int=1, nRows: int = None,
+                 tau: float = 1./1e10, forgettingRate: float = 0.7,
+                 delay: float = 1.,
+                 rows: Tensor = None,
+                 incremental: bool = False,
+                 drawType: DrawType = DrawType.SAMPLE,
+                 updateType: UpdateType = UpdateType.ALL,
+                 dtype: DType = tf.float32) -> None:
+        Normal2dLikelihood.__init__(self, M=M, K=K, tau=tau,
+                                    drawType=drawType, updateType=updateType,
+                                    dtype=dtype)
+        if nRows is None:
+            nRows = M[0]
+        self.__nRows = nRows
+        self.__forgettingRate = forgettingRate
+        self.__delay = delay
+        self.__rows = rows
+        self.__incremental = incremental
+        self.__dtype = dtype
+
+    def init(self, data: Tensor) -> None:
+        Normal2dLikelihood.init(self, data=data)
+        K, M1, dtype = self.K, self.M[1], self.__dtype
+        with tf.variable_scope("minibatch"):
+            self.__t = tf.get_variable(
+                "t", dtype=dtype, initializer=tf.constant(0., dtype=dtype))
+            self.__XTU0TVar = tf.get_variable(
+                "XTU0T", dtype=dtype, initializer=tf.zeros((M1, K), dtype))
+            self.__U0U0TVar = tf.get_variable(
+                "U0U0T", dtype=dtype, initializer=tf.zeros((K, K), dtype))
+            self.__ssrVar = tf.get_variable(
+                "ssr", dtype=dtype, initializer=tf.constant(0., dtype=dtype))
+            if self.incremental:
+                self.__seenVar = tf.get_variable(
+                    "seen", dtype=tf.bool,
+                    initializer=tf.zeros((self.nRows,), dtype=tf.bool))
+                self.__normX2Var = tf.get_variable(
+                    "normX2", dtype=dtype,
+                    initializer=tf.constant(0., dtype=dtype))
+        self.__XTU0T = self.__XTU0TVar
+        self.__U0U0T = self.__U0U0TVar
+        self.__ssr = self.__ssrVar
+        self.__nResiduals = self.nRows*M1
+
+    @property
+    def nRows(self) -> int:
+        return(self.__nRows)
+
+    @property
+    def incremental(self) -> bool:
+        return(self.__incremental)
+
+    @property
+    def rowScale(self) -> float:
+        """Factor that scales the statistics of a minibatch to all rows."""
+        return(self.__nRows/self.M[0])
+
+    def normX2(self, X: Tensor) -> Tensor:
+        """Squared norm of the current minibatch `X`."""
+        normX2 = tf.reduce_sum(tf.square(tf.cast(X, tf.float64)))
+        return(normX2)
+
+    def stepSize(self) -> Tensor:
+        """Increments the minibatch counter and returns the step size."""
+        t = tf.assign_add(self.__t, tf.constant(1., dtype=self.__dtype))
+        rho = (t - 1. + self.__delay)**(-self.__forgettingRate)
+        return(rho)
+
+    def update(self, U: Tuple[Tensor, ...], X: Tensor,
+               U0Prev: Tensor = None) -> None:
+        """Updates the running statistics and the noise distribution.
+
+        Arguments:
+            U: `Tuple[Tensor, Tensor]`, the rows of the first factor
+                of the current minibatch and the second factor.
+            X: `Tensor`, the current minibatch.
+            U0Prev: `Tensor`, the rows of the first factor of the current
+                minibatch before their update. Required if `incremental`.
+        """
+        assert(len(U) == 2)
+        if self.incremental:
+            self.__updateIncremental(U=U, X=X, U0Prev=U0Prev)
+        else:
+            self.__updateRunningAverage(U=U, X=X)
+
+        # fit the precision of the noise to the statistics
+        tau = self.__nResiduals/self.__ssr
+
+        def updateNoise():
+            self.noiseDistribution.tau = tf.reshape(tau, (1,))
+        self.noiseDistribution.updateWhen(UpdateType.ALL, updateNoise)
+
+    def __updateIncremental(self, U: Tuple[Tensor, ...], X: Tensor,
+                            U0Prev: Tensor) -> None:
+        U0, U1 = U
+        dtype = self.__dtype
+
+        # rows that are served for the first time did not contribute yet
+        seen = tf.gather(self.__seenVar, self.__rows)
+        seenMask = tf.cast(seen, dtype)
+        U0Prev = U0Prev*seenMask[None]
+        newX = X*(1. - seenMask)[..., None]
+
+        # replace the contribution of the previous state of the rows
+        XTU0T = tf.assign_add(self.__XTU0TVar,
+                              tf.matmul(X, U0 - U0Prev, transpose_a=True,
+                                        transpose_b=True))
+        U0U0T = tf.assign_add(self.__U0U0TVar,
+                              tf.matmul(U0, U0, transpose_b=True)
+                              - tf.matmul(U0Prev, U0Prev, transpose_b=True))
+        normX2 = tf.assign_add(self.__normX2Var, tf.reduce_sum(newX**2))
+        with tf.control_dependencies([XTU0T, U0U0T, normX2]):
+            seenUpdated = tf.scatter_update(
+                self.__seenVar, self.__rows,
+                tf.ones_like(self.__rows, dtype=tf.bool))
+        with tf.control_dependencies([seenUpdated]):
+            self.__XTU0T = tf.identity(XTU0T)
+            self.__U0U0T = tf.identity(U0U0T)
+            nSeen = tf.reduce_sum(tf.cast(seenUpdated, dtype))
+
+        # sum of the squared residuals of all rows served so far
+        U1U1T = tf.matmul(U1, U1, transpose_b=True)
+        ssr = (normX2
+               - 2.*tf.reduce_sum(XTU0T*tf.transpose(U1))
+               + tf.reduce_sum(U0U0T*U1U1T))
+        self.__ssr = tf.maximum(ssr, tf.constant(1e-30, dtype=dtype))
+        self.__nResiduals = nSeen*self.M[1]
+
+    def __updateRunningAverage(self, U: Tuple[Tensor, ...],
+                               X: Tensor) -> None:
+        U0 = U[0]
+        rho = self.stepSize()
+        scale = self.rowScale
+
+        # statistics of the current minibatch
+        XTU0T = tf.matmul(X, U0, transpose_a=True, transpose_b=True)
+        U0U0T = tf.matmul(U0, U0, transpose_b=True)
+        ssr = self.sumSquaredResiduals(U, X)
+
+        # update the running averages
+        self.__XTU0T = tf.assign(self.__XTU0TVar,
+                                 (1.-rho)*self.__XTU0TVar + rho*scale*XTU0T)
+        self.__U0U0T = tf.assign(self.__U0U0TVar,
+                                 (1.-rho)*self.__U0U0TVar + rho*scale*U0U0T)
+        self.__ssr = tf.assign(self.__ssrVar,
+                               (1.-rho)*self.__ssrVar + rho*scale*ssr)
+
+    def prepVars(self, f: int, U: List[Tensor],
+                 X: Tensor) -> Tuple[Tensor, Tensor, Tensor]:
+        if f == 0:
+            return(Normal2dLikelihood.prepVars(self, f=f, U=U, X=X))
+
+        A = self.__XTU0T
+        B = self.__U0U0T
+        alpha = self.noiseDistribution.tau
+        return(A, B, alpha)
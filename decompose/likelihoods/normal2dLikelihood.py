@@ -6,9 +6,11 @@ from decompose.distributions.distribution import Properties
 from decompose.distributions.distribution import DrawType, UpdateType
 from decompose.distributions.cenNormal import CenNormal
 from decompose.likelihoods.likelihood import Likelihood
+from decompose.likelihoods.homogeneousNormalLikelihood import HomogeneousNormalLikelihood
+from decompose.likelihoods.stepCache import stepCached
 
 
-class Normal2dLikelihood(Likelihood):
+class Normal2dLikelihood(HomogeneousNormalLikelihood):
 
     def __init__(self, M: Tuple[int, ...], K: int=1, tau: float = 1./1e10,
                  drawType: DrawType = DrawType.SAMPLE,
@@ -30,11 +32,13 @@ class Normal2dLikelihood(Likelihood):
         noiseDistribution = CenNormal(tau=tf.constant([tau], dtype=dtype),
                                       properties=properties)
         self.__noiseDistribution = noiseDistribution
+        self.initNormX2()
 
     @property
     def noiseDistribution(self) -> CenNormal:
         return(self.__noiseDistribution)
 
+    @stepCached
     def residuals(self, U: Tuple[Tensor, ...], X: Tensor) -> Tensor:
         assert(len(U) == 2)
         U0, U1 = U
@@ -42,20 +46,19 @@ class Normal2dLikelihood(Likelihood):
         residuals = tf.reshape(X-Xhat, (-1,))
         return(residuals)
 
-    def llh(self, U: Tuple[Tensor, ...], X: Tensor) -> Tensor:
-        r = self.residuals(U, X)
-        llh = tf.reduce_sum(self.noiseDistribution.llh(r))
-        return(llh)
-
-    def loss(self, U: Tuple[Tensor, ...], X: Tensor) -> Tensor:
-        loss = tf.reduce_sum(self.residuals(U, X)**2)
-        return(loss)
+    def innerProduct(self, U: Tuple[Tensor, ...], X: Tensor) -> Tensor:
+        assert(len(U) == 2)
+        U0, U1 = U
+        XU1T = tf.matmul(X, U1, transpose_b=True)
+        XXhat = tf.reduce_sum(XU1T*tf.transpose(U0))
+        return(XXhat)
 
     def update(self, U: Tuple[Tensor, ...], X: Tensor) -> None:
-        if self.noiseDistribution.updateType == UpdateType.ALL:
-            residuals = self.residuals(U, X)
-            flattenedResiduals = tf.reshape(residuals, (-1,))[..., None]
-            self.noiseDistribution.update(flattenedResiduals)
+        # shared with the loss and the llh of the step, which is not
+        # possible once it is cached within a branch of the update
+        self.sumSquaredResiduals(U, X)
+        self.noiseDistribution.updateWhen(
+            UpdateType.ALL, lambda: self.updateNoise(U, X))
 
     def prepVars(self, f: int, U: List[Tensor],
                  X: Tensor) -> Tuple[Tensor, Tensor, Tensor]:
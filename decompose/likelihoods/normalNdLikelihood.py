@@ -7,10 +7,12 @@ import string
 from decompose.distributions.distribution import DrawType, UpdateType
 from decompose.distributions.cenNormal import CenNormal
 from decompose.likelihoods.likelihood import Likelihood
+from decompose.likelihoods.homogeneousNormalLikelihood import HomogeneousNormalLikelihood
+from decompose.likelihoods.stepCache import stepCached
 from decompose.distributions.distribution import Properties
 
 
-class NormalNdLikelihood(Likelihood):
+class NormalNdLikelihood(HomogeneousNormalLikelihood):
 
     def __init__(self, M: Tuple[int, ...], K: int=1, tau: float = 1./1e10,
                  drawType: DrawType = DrawType.SAMPLE,
@@ -31,11 +33,13 @@ class NormalNdLikelihood(Likelihood):
         noiseDistribution = CenNormal(tau=tf.constant([tau], dtype=dtype),
                                       properties=properties)
         self.__noiseDistribution = noiseDistribution
+        self.initNormX2()
 
     @property
     def noiseDistribution(self) -> CenNormal:
         return(self.__noiseDistribution)
 
+    @stepCached
     def residuals(self, U: Tuple[Tensor, ...], X: Tensor) -> Tensor:
         F = len(U)
         axisIds = string.ascii_lowercase[:F]
@@ -44,38 +48,27 @@ class NormalNdLikelihood(Likelihood):
         residuals = X-Xhat
         return(residuals)
 
-    def llh(self, U: Tuple[Tensor, ...], X: Tensor) -> Tensor:
-        r = self.residuals(U, X)
-        llh = tf.reduce_sum(self.noiseDistribution.llh(r))
-        return(llh)
-
-    def loss(self, U: Tuple[Tensor, ...], X: Tensor) -> Tensor:
-        loss = tf.reduce_sum(self.residuals(U, X)**2)
-        return(loss)
+    def innerProduct(self, U: Tuple[Tensor, ...], X: Tensor) -> Tensor:
+        XU = self.mttkrp(X, U, 0)
+        XXhat = tf.reduce_sum(XU*tf.transpose(U[0]))
+        return(XXhat)
 
     def update(self, U: Tuple[Tensor, ...], X: Tensor) -> None:
-        if self.noiseDistribution.updateType == UpdateType.ALL:
-            residuals = self.residuals(U, X)
-            flattenedResiduals = tf.reshape(residuals, (-1,))[..., None]
-            self.noiseDistribution.update(flattenedResiduals)
-
-    def outterTensorProduct(self, Us):
-        F = len(Us)
-        axisIds = string.ascii_lowercase[:F]
-        subscripts = f'k{",k".join(axisIds)}->{axisIds}k'
-        Xhat = tf.einsum(subscripts, *Us)
-        return(Xhat)
+        # shared with the loss and the llh of the step, which is not
+        # possible once it is cached within a branch of the update
+        self.sumSquaredResiduals(U, X)
+        self.noiseDistribution.updateWhen(
+            UpdateType.ALL, lambda: self.updateNoise(U, X))
 
     def prepVars(self, f: int, U: List[Tensor],
                  X: Tensor) -> Tuple[Tensor, Tensor, Tensor]:
+        # the Gram matrix of the Khatri-Rao product of the other filter
+        # banks is the element-wise product of their Gram matrices
         F = self.F
-        Umf = [U[g] for g in range(F) if g != f]
-        UmfOutter = self.outterTensorProduct(Umf)
-
-        rangeFm1 = list(range(F-1))
-        A = tf.tensordot(X, UmfOutter,
-                         axes=([g for g in range(F) if g != f], rangeFm1))
-        B = tf.tensordot(UmfOutter, UmfOutter,
-                         axes=(rangeFm1, rangeFm1))
+        A = self.mttkrp(X, U, f)
+        B = 1.
+        for g in range(F):
+            if g != f:
+                B = B*tf.matmul(U[g], U[g], transpose_b=True)
         alpha = self.noiseDistribution.tau
         return(A, B, alpha)
@@ -0,0 +1,101 @@
+from typing import Tuple, List
+import tensorflow as tf
+from tensorflow import Tensor, DType
+
+from decompose.distributions.distribution import DrawType, UpdateType
+from decompose.distributions.cenNormal import CenNormal
+from decompose.likelihoods.likelihood import Likelihood
+from decompose.likelihoods.stepCache import stepCached
+from decompose.distributions.distribution import Properties
+
+
+class SparseNormal2dLikelihood(Likelihood):
+    """Normal likelihood of a matrix of which only a few entries are observed.
+
+    The data is a `tf.SparseTensor` that contains only the observed
+    entries of the matrix. The residuals and the sufficient statistics
+    `A` and `B` are calculated from the observed entries only. `B` holds
+    the Gram matrix of the observed entries of each row such that the
+    costs are proportional to `nnz*K^2` and do not depend on the number
+    of missing entries.
+
+    Arguments:
+        M: `Tuple[int, int]`, shape of the matrix.
+        K: `int`, number of components.
+        tau: `float`, initial precision of the noise.
+        drawType: `DrawType`, draw type of the noise distribution.
+        updateType: `UpdateType`, update type of the noise distribution.
+        dtype: `DType`, type of the data.
+    """
+
+    def __init__(self, M: Tuple[int, ...], K: int=1, tau: float = 1./1e10,
+                 drawType: DrawType = DrawType.SAMPLE,
+                 updateType: UpdateType = UpdateType.ALL,
+                 dtype: DType = tf.float32) -> None:
+        Likelihood.__init__(self, M, K)
+        self.__tauInit = tau
+        self.__dtype = dtype
+        self.__properties = Properties(name='likelihood',
+                                       drawType=drawType,
+                                       dtype=dtype,
+                                       updateType=updateType,
+                                       persistent=True)
+
+    def init(self, data: tf.SparseTensor) -> None:
+        tau = self.__tauInit
+        dtype = self.__dtype
+        properties = self.__properties
+        noiseDistribution = CenNormal(tau=tf.constant([tau], dtype=dtype),
+                                      properties=properties)
+        self.__noiseDistribution = noiseDistribution
+
+    @property
+    def noiseDistribution(self) -> CenNormal:
+        return(self.__noiseDistribution)
+
+    @stepCached
+    def residuals(self, U: Tuple[Tensor, ...],
+                  X: tf.SparseTensor) -> Tensor:
+        assert(len(U) == 2)
+        U0, U1 = U
+        U0T = tf.gather(tf.transpose(U0), X.indices[:, 0])
+        U1T = tf.gather(tf.transpose(U1), X.indices[:, 1])
+        Xhat = tf.reduce_sum(U0T*U1T, axis=-1)
+        residuals = X.values - Xhat
+        return(residuals)
+
+    def llh(self, U: Tuple[Tensor, ...], X: tf.SparseTensor) -> Tensor:
+        r = self.residuals(U, X)
+        llh = tf.reduce_sum(self.noiseDistribution.llh(r))
+        return(llh)
+
+    def loss(self, U: Tuple[Tensor, ...], X: tf.SparseTensor) -> Tensor:
+        loss = tf.reduce_sum(self.residuals(U, X)**2)
+        return(loss)
+
+    def update(self, U: Tuple[Tensor, ...], X: tf.SparseTensor) -> None:
+        residuals = self.residuals(U, X)
+        flattenedResiduals = residuals[..., None]
+        self.noiseDistribution.updateWhen(
+            UpdateType.ALL,
+            lambda: self.noiseDistribution.update(flattenedResiduals))
+
+    def prepVars(self, f: int, U: List[Tensor],
+                 X: tf.SparseTensor) -> Tuple[Tensor, Tensor, Tensor]:
+        if f == 0:
+            U1 = U[1]
+            rows, cols = X.indices[:, 0], X.indices[:, 1]
+        else:
+            U1 = U[0]
+            rows, cols = X.indices[:, 1], X.indices[:, 0]
+
+        # filters of the other factor for each observed entry
+        U1T = tf.gather(tf.transpose(U1), cols)
+
+        # sum over the observed entries of each row
+        Mf = self.M[f]
+        A = tf.unsorted_segment_sum(X.values[..., None]*U1T, rows, Mf)
+        B = tf.unsorted_segment_sum(U1T[..., None]*U1T[..., None, :],
+                                    rows, Mf)
+        alpha = self.noiseDistribution.tau
+        return(A, B, alpha)
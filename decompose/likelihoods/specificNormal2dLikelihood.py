@@ -7,6 +7,7 @@ from decompose.distributions.distribution import Properties
 from decompose.distributions.distribution import DrawType, UpdateType
 from decompose.distributions.cenNormal import CenNormal
 from decompose.likelihoods.likelihood import Likelihood
+from decompose.likelihoods.stepCache import stepCached
 
 
 class SpecificNormal2dLikelihood(Likelihood):
@@ -36,6 +37,7 @@ class SpecificNormal2dLikelihood(Likelihood):
     def noiseDistribution(self) -> CenNormal:
         return(self.__noiseDistribution)
 
+    @stepCached
     def residuals(self, U: Tuple[Tensor, ...], X: Tensor) -> Tensor:
         assert(len(U) == 2)
         U0, U1 = U
@@ -53,9 +55,9 @@ class SpecificNormal2dLikelihood(Likelihood):
         return(loss)
 
     def update(self, U: Tuple[Tensor, ...], X: Tensor) -> None:
-        if self.noiseDistribution.updateType == UpdateType.ALL:
-            residuals = self.residuals(U, X)
-            self.noiseDistribution.update(residuals)
+        residuals = self.residuals(U, X)
+        self.noiseDistribution.updateWhen(
+            UpdateType.ALL, lambda: self.noiseDistribution.update(residuals))
 
     def prepVars(self, f: int, U: List[Tensor],
                  X: Tensor) -> Tuple[Tensor, Tensor, Tensor]:
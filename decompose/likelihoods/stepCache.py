@@ -0,0 +1,72 @@
+from typing import Any, Callable, Tuple
+import functools
+import inspect
+from tensorflow import Tensor
+
+
+class StepCache(object):
+    """Shares tensors that are computed from the same inputs within a step.
+
+    Between `start` and `end` the result of `get` is computed only once
+    for each name and each combination of input tensors. Outside of a
+    step the results are always computed again. Steps must not span
+    several branches of a `tf.cond` since tensors can not be shared
+    between them.
+    """
+
+    def __init__(self) -> None:
+        self.__entries = None  # type: dict
+
+    @property
+    def active(self) -> bool:
+        return(self.__entries is not None)
+
+    def start(self) -> None:
+        self.__entries = {}
+
+    def end(self) -> None:
+        self.__entries = None
+
+    def get(self, name: str, inputs: Tuple[Tensor, ...],
+            compute: Callable[[], Any]) -> Any:
+        """Returns the cached result of `compute` for `name` and `inputs`.
+
+        Arguments:
+            name: `str`, name of the cached result.
+            inputs: `Tuple[Tensor, ...]`, tensors the result depends on.
+            compute: `Callable`, computes the result if it is not cached.
+        """
+        if self.__entries is None:
+            return(compute())
+        key = (name,) + tuple(id(tensor) for tensor in inputs)
+        if key not in self.__entries:
+            # the inputs are stored along with the result to keep their
+            # ids from being reused during the step
+            self.__entries[key] = (compute(), tuple(inputs))
+        return(self.__entries[key][0])
+
+
+def flatten(args: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    flat = []
+    for arg in args:
+        if isinstance(arg, (tuple, list)):
+            flat.extend(arg)
+        else:
+            flat.append(arg)
+    return(tuple(flat))
+
+
+def stepCached(method: Callable) -> Callable:
+    """Caches the results of `method` in the `stepCache` of its object.
+
+    The arguments of `method` must be tensors or sequences of tensors.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def cachedMethod(self, *args, **kwargs):
+        arguments = signature.bind(self, *args, **kwargs).arguments
+        inputs = flatten(tuple(arguments.values())[1:])
+        return(self.stepCache.get(method.__qualname__, inputs,
+                                  lambda: method(self, *args, **kwargs)))
+    return(cachedMethod)
@@ -0,0 +1,123 @@
+import multiprocessing
+import resource
+import pytest
+import numpy as np
+import tensorflow as tf
+
+from decompose.likelihoods.cvNormal2dLikelihood import CVNormal2dLikelihood
+from decompose.cv.cv import Block
+from decompose.tests.fixtures import device, dtype
+
+
+@pytest.fixture(scope="module",
+                params=[0, 1])
+def f(request):
+    f = request.param
+    return(f)
+
+
+def test_gramColumns(device, f, dtype):
+    npdtype = dtype.as_numpy_dtype
+    M, K = (20, 30), 4
+    npU = (np.random.normal(size=(K, M[0])).astype(npdtype),
+           np.random.normal(size=(K, M[1])).astype(npdtype))
+    U = [tf.constant(npU[0]), tf.constant(npU[1])]
+    npdata = np.random.normal(size=M).astype(npdtype)
+    data = tf.constant(npdata)
+
+    lh = CVNormal2dLikelihood(M=M, K=K, dtype=dtype,
+                              cv=Block(nFolds=(2, 3), foldNumber=1))
+    lh.init(data=data)
+    A, B, alpha = lh.prepVars(f, U, data)
+    VvT, vvT = lh.gramColumns(B, 1, 3)
+    Vkv, vkv = lh.gramColumns(B, tf.constant(2), tf.constant(3))
+
+    with tf.Session() as sess:
+        sess.run(tf.global_variables_initializer())
+        npA, npVvT, npvvT, npVkv, npvkv, mask = sess.run(
+            [A, VvT, vvT, Vkv, vkv, lh.trainMask])
+
+    mask = mask.astype(npdtype)
+    if f == 0:
+        U1 = npU[1]
+    else:
+        U1 = npU[0]
+        mask = mask.T
+        npdata = npdata.T
+    Agt = np.dot(npdata*mask, U1.T)
+    Bgt = np.einsum("mn,in,jn->mij", mask, U1, U1)
+    diagBgt = np.einsum("mkk->mk", Bgt)
+    assert(np.allclose(Agt, npA, atol=1e-4, rtol=1e-4))
+    assert(np.allclose(Bgt[..., 1:3], npVvT, atol=1e-4, rtol=1e-4))
+    assert(np.allclose(diagBgt[..., 1:3], npvvT, atol=1e-4, rtol=1e-4))
+    assert(np.allclose(Bgt[..., 2:3], npVkv, atol=1e-4, rtol=1e-4))
+    assert(np.allclose(diagBgt[..., 2:3], npvkv, atol=1e-4, rtol=1e-4))
+    tf.reset_default_graph()
+
+
+def test_factored(device, f, dtype):
+    npdtype = dtype.as_numpy_dtype
+    M, K = (20, 30), 4
+    U = [tf.constant(np.random.normal(size=(K, Mf)).astype(npdtype))
+         for Mf in M]
+    data = tf.constant(np.random.normal(size=M).astype(npdtype))
+    cv = Block(nFolds=(2, 3), foldNumber=4)
+
+    results = []
+    for isFullyObserved in [False, True]:
+        with tf.variable_scope(f"lh{isFullyObserved}"):
+            lh = CVNormal2dLikelihood(M=M, K=K, dtype=dtype, cv=cv,
+                                      isFullyObserved=isFullyObserved)
+            lh.init(data=data)
+        assert(lh.factored == isFullyObserved)
+        A, B, alpha = lh.prepVars(f, U, data)
+        VvT, vvT = lh.gramColumns(B, 1, 3)
+        test = tf.reduce_sum(lh.testResiduals(U, data)**2)
+        train = tf.reduce_sum(lh.trainResiduals(U, data)**2)
+        results.append([A, VvT, vvT, test, train])
+
+    with tf.Session() as sess:
+        sess.run(tf.global_variables_initializer())
+        dense, factored = sess.run(results)
+
+    for d, fa in zip(dense, factored):
+        assert(np.allclose(d, fa, atol=1e-4, rtol=1e-4))
+    tf.reset_default_graph()
+
+
+def peakMemory(lazy: bool, M, K) -> float:
+    """Peak RSS in MB of calculating all columns of the Gram matrices."""
+    U = [tf.random_normal((K, M[0])), tf.random_normal((K, M[1]))]
+    data = tf.random_normal(M)
+    lh = CVNormal2dLikelihood(M=M, K=K, cv=Block(nFolds=(2, 2),
+                                                 foldNumber=0))
+    lh.init(data=data)
+    A, B, alpha = lh.prepVars(0, U, data)
+    if lazy:
+        # only one column is needed at a time
+        def body(k, s):
+            VvT, vvT = lh.gramColumns(B, k, k+1)
+            return(k+1, s + tf.reduce_sum(VvT) + tf.reduce_sum(vvT))
+        _, s = tf.while_loop(lambda k, s: k < K, body,
+                             [tf.constant(0), tf.constant(0.)])
+    else:
+        trainMask, U1 = B
+        VVT = tf.einsum("mn,in,jn->mij", trainMask, U1, U1)
+        s = tf.reduce_sum(VVT) + tf.reduce_sum(tf.matrix_diag_part(VVT))
+    with tf.Session() as sess:
+        sess.run(tf.global_variables_initializer())
+        sess.run(s)
+    return(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss/1024.)
+
+
+@pytest.mark.slow
+def test_gramColumnsMemory():
+    """Benchmarks the peak memory of the dense and the lazy Gram matrices."""
+    M, K = (5000, 200), 100
+    ctx = multiprocessing.get_context("spawn")
+    peaks = {}
+    for lazy in [False, True]:
+        with ctx.Pool(1) as pool:
+            peaks[lazy] = pool.apply(peakMemory, (lazy, M, K))
+    print(f"peak RSS dense {peaks[False]:.0f}MB, lazy {peaks[True]:.0f}MB")
+    assert(peaks[True] < peaks[False])
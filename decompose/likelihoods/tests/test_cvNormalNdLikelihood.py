@@ -0,0 +1,44 @@
+import pytest
+import numpy as np
+import tensorflow as tf
+
+from decompose.likelihoods.cvNormalNdLikelihood import CVNormalNdLikelihood
+from decompose.cv.cv import Block
+from decompose.tests.fixtures import device, dtype
+
+
+@pytest.fixture(scope="module",
+                params=[0, 1, 2])
+def f(request):
+    f = request.param
+    return(f)
+
+
+def test_factored(device, f, dtype):
+    npdtype = dtype.as_numpy_dtype
+    M, K = (8, 9, 10), 3
+    U = [tf.constant(np.random.normal(size=(K, Mf)).astype(npdtype))
+         for Mf in M]
+    data = tf.constant(np.random.normal(size=M).astype(npdtype))
+    cv = Block(nFolds=(2, 3, 2), foldNumber=7)
+
+    results = []
+    for isFullyObserved in [False, True]:
+        with tf.variable_scope(f"lh{isFullyObserved}"):
+            lh = CVNormalNdLikelihood(M=M, K=K, dtype=dtype, cv=cv,
+                                      isFullyObserved=isFullyObserved)
+            lh.init(data=data)
+        assert(lh.factored == isFullyObserved)
+        A, B, alpha = lh.prepVars(f, U, data)
+        VvT, vvT = lh.gramColumns(B, 0, 2)
+        test = tf.reduce_sum(lh.testResiduals(U, data)**2)
+        train = tf.reduce_sum(lh.trainResiduals(U, data)**2)
+        results.append([A, VvT, vvT, test, train])
+
+    with tf.Session() as sess:
+        sess.run(tf.global_variables_initializer())
+        dense, factored = sess.run(results)
+
+    for d, fa in zip(dense, factored):
+        assert(np.allclose(d, fa, atol=1e-4, rtol=1e-4))
+    tf.reset_default_graph()
@@ -0,0 +1,70 @@
+import numpy as np
+import tensorflow as tf
+
+from decompose.likelihoods.minibatchNormal2dLikelihood import MinibatchNormal2dLikelihood
+from decompose.tests.fixtures import device, dtype
+
+
+def test_update(device, dtype):
+    npdtype = dtype.as_numpy_dtype
+    M, K, tau, nRows = (20, 30), 3, 0.1, 100
+    npU = (np.random.normal(size=(K, M[0])).astype(npdtype),
+           np.random.normal(size=(K, M[1])).astype(npdtype))
+    U = (tf.constant(npU[0]), tf.constant(npU[1]))
+    npnoise = np.random.normal(size=M).astype(npdtype)
+    npdata = np.dot(npU[0].T, npU[1]) + npnoise
+    data = tf.constant(npdata, dtype=dtype)
+
+    lh = MinibatchNormal2dLikelihood(M=M, K=K, nRows=nRows, tau=tau,
+                                     dtype=dtype)
+    lh.init(data=data)
+    lh.update(U, data)
+    A, B, alpha = lh.prepVars(1, U, data)
+
+    with tf.Session() as sess:
+        sess.run(tf.global_variables_initializer())
+        npA, npB, npalpha = sess.run([A, B, alpha])
+
+    # the first minibatch replaces the initial statistics
+    scale = nRows/M[0]
+    Agt = scale*np.dot(npdata.T, npU[0].T)
+    Bgt = scale*np.dot(npU[0], npU[0].T)
+    alphagt = M[0]*M[1]/np.sum(npnoise**2)
+    assert(np.allclose(Agt, npA, atol=1e-4, rtol=1e-4))
+    assert(np.allclose(Bgt, npB, atol=1e-4, rtol=1e-4))
+    assert(np.allclose(alphagt, npalpha, atol=1e-4, rtol=1e-4))
+    tf.reset_default_graph()
+
+
+def test_updateIncremental(device, dtype):
+    npdtype = dtype.as_numpy_dtype
+    M, K, tau, nRows = (10, 30), 3, 0.1, 20
+    npU0 = np.random.normal(size=(K, nRows)).astype(npdtype)
+    npU1 = np.random.normal(size=(K, M[1])).astype(npdtype)
+    npdata = np.random.normal(size=(nRows, M[1])).astype(npdtype)
+
+    rows = tf.placeholder(tf.int64, shape=(M[0],))
+    U0 = tf.constant(npU0)
+    U = (tf.gather(U0, rows, axis=1), tf.constant(npU1))
+    data = tf.gather(tf.constant(npdata), rows)
+
+    lh = MinibatchNormal2dLikelihood(M=M, K=K, nRows=nRows, tau=tau,
+                                     rows=rows, incremental=True,
+                                     dtype=dtype)
+    lh.init(data=data)
+    lh.update(U, data, U0Prev=U[0])
+    A, B, alpha = lh.prepVars(1, U, data)
+
+    # after serving all rows the statistics equal those of the full data
+    with tf.Session() as sess:
+        sess.run(tf.global_variables_initializer())
+        for b in [0, 1, 0]:
+            feed = {rows: np.arange(b*M[0], (b+1)*M[0])}
+            npA, npB, npalpha = sess.run([A, B, alpha], feed_dict=feed)
+
+    npresiduals = npdata - np.dot(npU0.T, npU1)
+    assert(np.allclose(np.dot(npdata.T, npU0.T), npA, atol=1e-4, rtol=1e-4))
+    assert(np.allclose(np.dot(npU0, npU0.T), npB, atol=1e-4, rtol=1e-4))
+    assert(np.allclose(nRows*M[1]/np.sum(npresiduals**2), npalpha,
+                       atol=1e-3, rtol=1e-3))
+    tf.reset_default_graph()
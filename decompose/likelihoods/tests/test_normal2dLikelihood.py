@@ -143,18 +143,51 @@ def test_update(device, f, updateType, dtype):
     npdata = np.dot(npU[0].T, npU[1]) + npnoise
     data = tf.constant(npdata, dtype=dtype)
 
-    lh = Normal2dLikelihood(M=M, K=K, tau=tau, updateType=updateType)
+    lh = Normal2dLikelihood(M=M, K=K, tau=tau, updateType=updateType,
+                            dtype=dtype)
     lh.init(data=data)
-    lh.noiseDistribution.update = MagicMock()
-    residuals = tf.ones_like(data)
-    lh.residuals = MagicMock(return_value=residuals)
+    lh.residuals = MagicMock()
+    lh.sumSquaredResiduals = MagicMock(
+        return_value=tf.constant(np.sum(npnoise**2), dtype=dtype))
 
     lh.update(U, data)
 
+    # the residuals are not materialised
+    lh.residuals.assert_not_called()
     if updateType == UpdateType.ALL:
-        lh.residuals.assert_called_once()
-        lh.noiseDistribution.update.assert_called_once()
+        lh.sumSquaredResiduals.assert_called_once()
+        with tf.Session() as sess:
+            sess.run(tf.global_variables_initializer())
+            nptau = sess.run(lh.noiseDistribution.tau)
+        taugt = np.prod(M)/np.sum(npnoise**2)
+        assert(np.allclose(taugt, nptau, atol=1e-5, rtol=1e-5))
     else:
-        lh.residuals.assert_not_called()
-        lh.noiseDistribution.update.assert_not_called()
+        lh.sumSquaredResiduals.assert_not_called()
+    tf.reset_default_graph()
+
+
+def test_sumSquaredResiduals(device, dtype):
+    npdtype = dtype.as_numpy_dtype
+    M, K = (20, 30), 3
+    npU = (np.random.normal(size=(K, M[0])).astype(npdtype),
+           np.random.normal(size=(K, M[1])).astype(npdtype))
+    U = (tf.constant(npU[0]), tf.constant(npU[1]))
+    npnoise = np.random.normal(size=M).astype(npdtype)
+    npdata = np.dot(npU[0].T, npU[1]) + npnoise
+    data = tf.constant(npdata, dtype=dtype)
+
+    lh = Normal2dLikelihood(M=M, K=K, dtype=dtype)
+    lh.init(data=data)
+
+    ssr = lh.sumSquaredResiduals(U, data)
+    assert(ssr.dtype == dtype)
+
+    with tf.Session() as sess:
+        sess.run(tf.global_variables_initializer())
+        npssr = sess.run(ssr)
+        # the squared norm of the data is calculated only once
+        npnormX2 = sess.run(lh.normX2(tf.zeros_like(data)))
+
+    assert(np.allclose(np.sum(npnoise**2), npssr, atol=1e-4, rtol=1e-4))
+    assert(np.allclose(np.sum(npdata.astype(np.float64)**2), npnormX2))
     tf.reset_default_graph()
@@ -0,0 +1,69 @@
+import pytest
+import numpy as np
+import tensorflow as tf
+
+from decompose.likelihoods.normalNdLikelihood import NormalNdLikelihood
+from decompose.tests.fixtures import device, dtype
+
+
+@pytest.fixture(scope="module",
+                params=[0, 1, 2])
+def f(request):
+    f = request.param
+    return(f)
+
+
+def test_prepVars(device, f, dtype):
+    npdtype = dtype.as_numpy_dtype
+    M, K, tau = (8, 9, 10), 3, 0.1
+    npU = [np.random.normal(size=(K, Mf)).astype(npdtype) for Mf in M]
+    U = [tf.constant(npUf) for npUf in npU]
+    npdata = np.random.normal(size=M).astype(npdtype)
+    data = tf.constant(npdata)
+
+    lh = NormalNdLikelihood(M=M, K=K, tau=tau, dtype=dtype)
+    lh.init(data=data)
+
+    A, B, alpha = lh.prepVars(f, U, data)
+
+    assert(A.dtype == dtype)
+    assert(B.dtype == dtype)
+
+    with tf.Session() as sess:
+        sess.run(tf.global_variables_initializer())
+        npA, npB, npalpha = sess.run([A, B, alpha])
+
+    # Khatri-Rao product of the other filter banks
+    Umf = [npU[g] for g in range(len(M)) if g != f]
+    UmfOutter = np.einsum("ka,kb->abk", *Umf)
+    axes = [g for g in range(len(M)) if g != f]
+    Agt = np.tensordot(npdata, UmfOutter, axes=(axes, [0, 1]))
+    Bgt = np.tensordot(UmfOutter, UmfOutter, axes=([0, 1], [0, 1]))
+    assert(npA.shape == (M[f], K))
+    assert(npB.shape == (K, K))
+    assert(np.allclose(Agt, npA, atol=1e-4, rtol=1e-4))
+    assert(np.allclose(Bgt, npB, atol=1e-4, rtol=1e-4))
+    assert(np.allclose(tau, npalpha, atol=1e-5, rtol=1e-5))
+    tf.reset_default_graph()
+
+
+def test_sumSquaredResiduals(device, dtype):
+    npdtype = dtype.as_numpy_dtype
+    M, K = (8, 9, 10), 3
+    npU = [np.random.normal(size=(K, Mf)).astype(npdtype) for Mf in M]
+    U = [tf.constant(npUf) for npUf in npU]
+    npnoise = np.random.normal(size=M).astype(npdtype)
+    npdata = np.einsum("ka,kb,kc->abc", *npU) + npnoise
+    data = tf.constant(npdata)
+
+    lh = NormalNdLikelihood(M=M, K=K, dtype=dtype)
+    lh.init(data=data)
+
+    ssr = lh.sumSquaredResiduals(U, data)
+
+    with tf.Session() as sess:
+        sess.run(tf.global_variables_initializer())
+        npssr = sess.run(ssr)
+
+    assert(np.allclose(np.sum(npnoise**2), npssr, atol=1e-3, rtol=1e-3))
+    tf.reset_default_graph()
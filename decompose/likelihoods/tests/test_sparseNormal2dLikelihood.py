@@ -0,0 +1,89 @@
+import pytest
+import numpy as np
+import scipy as sp
+import scipy.stats
+import tensorflow as tf
+
+from decompose.likelihoods.sparseNormal2dLikelihood import SparseNormal2dLikelihood
+from decompose.tests.fixtures import device, dtype
+
+
+@pytest.fixture(scope="module",
+                params=[0, 1])
+def f(request):
+    f = request.param
+    return(f)
+
+
+def sparseData(M, K, npdtype, density=0.3):
+    npU = (np.random.normal(size=(K, M[0])).astype(npdtype),
+           np.random.normal(size=(K, M[1])).astype(npdtype))
+    npnoise = np.random.normal(size=M).astype(npdtype)
+    npdata = np.dot(npU[0].T, npU[1]) + npnoise
+    observed = np.random.random(size=M) < density
+    indices = np.stack(np.nonzero(observed), axis=-1).astype(np.int64)
+    data = tf.SparseTensor(indices=indices, values=npdata[observed],
+                           dense_shape=M)
+    U = (tf.constant(npU[0]), tf.constant(npU[1]))
+    return(npU, npdata, npnoise, observed, U, data)
+
+
+def test_residuals(device, dtype):
+    npdtype = dtype.as_numpy_dtype
+    M, K, tau = (20, 30), 3, 0.1
+    npU, npdata, npnoise, observed, U, data = sparseData(M, K, npdtype)
+
+    lh = SparseNormal2dLikelihood(M=M, K=K, tau=tau, dtype=dtype)
+    lh.init(data=data)
+
+    r = lh.residuals(U, data)
+    loss = lh.loss(U, data)
+    llh = lh.llh(U, data)
+
+    assert(r.dtype == dtype)
+    assert(loss.dtype == dtype)
+    assert(llh.dtype == dtype)
+
+    with tf.Session() as sess:
+        sess.run(tf.global_variables_initializer())
+        npr, nploss, npllh = sess.run([r, loss, llh])
+
+    noise = npnoise[observed]
+    llhgt = np.sum(sp.stats.norm(loc=0., scale=1./np.sqrt(tau)).logpdf(noise))
+    assert(np.allclose(noise, npr, atol=1e-5, rtol=1e-5))
+    assert(np.allclose(np.sum(noise**2), nploss, atol=1e-4, rtol=1e-4))
+    assert(np.allclose(llhgt, npllh, atol=1e-4, rtol=1e-4))
+    tf.reset_default_graph()
+
+
+def test_prepVars(device, f, dtype):
+    npdtype = dtype.as_numpy_dtype
+    M, K, tau = (20, 30), 3, 0.1
+    npU, npdata, npnoise, observed, U, data = sparseData(M, K, npdtype)
+
+    lh = SparseNormal2dLikelihood(M=M, K=K, tau=tau, dtype=dtype)
+    lh.init(data=data)
+
+    A, B, alpha = lh.prepVars(f, U, data)
+
+    assert(A.dtype == dtype)
+    assert(B.dtype == dtype)
+    assert(alpha.dtype.base_dtype == dtype)
+
+    with tf.Session() as sess:
+        sess.run(tf.global_variables_initializer())
+        npA, npB, npalpha = sess.run([A, B, alpha])
+
+    mask = observed.astype(npdtype)
+    if f == 0:
+        U1 = npU[1]
+    else:
+        U1 = npU[0]
+        mask = mask.T
+        npdata = npdata.T
+    Agt = np.dot(npdata*mask, U1.T)
+    Bgt = np.einsum("mn,in,jn->mij", mask, U1, U1)
+    assert(np.allclose(Agt, npA, atol=1e-4, rtol=1e-4))
+    assert(np.allclose(Bgt, npB, atol=1e-4, rtol=1e-4))
+    assert(np.allclose(tau, npalpha, atol=1e-5, rtol=1e-5))
+    tf.reset_default_graph()
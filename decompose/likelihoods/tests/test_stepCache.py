@@ -0,0 +1,94 @@
+import time
+import pytest
+import numpy as np
+import tensorflow as tf
+
+from decompose.likelihoods.stepCache import StepCache
+from decompose.likelihoods.normal2dLikelihood import Normal2dLikelihood
+from decompose.models.tensorFactorisation import TensorFactorisation, Phase
+from decompose.distributions.cenNormal import CenNormal
+from decompose.stopCriterions.llhStall import LlhStall
+from decompose.tests.fixtures import device, dtype
+
+
+def test_stepCache():
+    cache = StepCache()
+    x, y = object(), object()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return(len(calls))
+
+    # nothing is cached outside of a step
+    assert(cache.get("a", (x,), compute) == 1)
+    assert(cache.get("a", (x,), compute) == 2)
+
+    cache.start()
+    assert(cache.get("a", (x,), compute) == 3)
+    assert(cache.get("a", (x,), compute) == 3)
+    assert(cache.get("a", (y,), compute) == 4)
+    assert(cache.get("b", (x,), compute) == 5)
+    cache.end()
+    assert(cache.get("a", (x,), compute) == 6)
+
+
+def test_residuals(device, dtype):
+    tf.reset_default_graph()
+    npdtype = dtype.as_numpy_dtype
+    M, K = (20, 30), 3
+    U = (tf.constant(np.random.normal(size=(K, M[0])).astype(npdtype)),
+         tf.constant(np.random.normal(size=(K, M[1])).astype(npdtype)))
+    data = tf.constant(np.random.normal(size=M).astype(npdtype))
+
+    lh = Normal2dLikelihood(M=M, K=K, dtype=dtype)
+    lh.init(data=data)
+
+    assert(lh.residuals(U, data) is not lh.residuals(U, data))
+    lh.stepCache.start()
+    r = lh.residuals(U, data)
+    assert(lh.residuals(list(U), X=data) is r)
+    assert(lh.residuals(U[::-1], data) is not r)
+    lh.stepCache.end()
+    assert(lh.residuals(U, data) is not r)
+
+
+def stepOp(M, K, dtype, share):
+    data = tf.constant(np.random.normal(size=M), dtype=dtype)
+    lh = Normal2dLikelihood(M=M, K=K, dtype=dtype)
+    lh.init(data=data)
+    priors = [CenNormal().random(shape=(K,), latentShape=(M[f],),
+                                 name=f"prior{f}", dtype=dtype)
+              for f in range(2)]
+    stopCriterion = LlhStall(10)
+    stopCriterion.init(ns="stopCriterion")
+    tefa = TensorFactorisation.random(priorU=priors, likelihood=lh, M=M, K=K,
+                                      dtype=dtype, phase=Phase.EM,
+                                      stopCriterion=stopCriterion)
+    if share:
+        tefa.startStep()
+    loss = tefa.loss(X=data)
+    llh = tefa.llh(X=data)
+    U = tefa.update(X=data)
+    tefa.endStep()
+    return((*U, loss, llh))
+
+
+@pytest.mark.slow
+def test_stepTime():
+    """Benchmarks a step with and without sharing the residuals."""
+    M, K, nSteps = (2000, 2000), 10, 20
+    times = {}
+    for share in [False, True]:
+        tf.reset_default_graph()
+        op = stepOp(M, K, tf.float32, share)
+        with tf.Session() as sess:
+            sess.run(tf.global_variables_initializer())
+            sess.run(op)
+            t0 = time.time()
+            for i in range(nSteps):
+                sess.run(op)
+            times[share] = (time.time() - t0)/nSteps
+    print(f"step time without sharing {times[False]:.4f}s, "
+          f"with sharing {times[True]:.4f}s")
+    assert(times[True] < times[False])
@@ -0,0 +1,173 @@
+from typing import Tuple, Dict
+import numpy as np
+from numpy import ndarray
+
+from decompose.distributions.distribution import Distribution
+from decompose.distributions.cenNormal import CenNormal
+from decompose.distributions.normal import Normal
+from decompose.distributions.nnNormal import NnNormal
+from decompose.distributions.cenNnNormal import CenNnNormal
+from decompose.distributions.uniform import Uniform
+from decompose.distributions.nnUniform import NnUniform
+
+
+class ClosedFormTransform(object):
+    """Estimates the first filter bank of new data given a fitted model.
+
+    With the other filter banks, the precision of the noise and the
+    parameters of the prior fixed, the BCD fixed point of the filters
+    `u` of a new row `x` minimizes the quadratic
+
+        `tau/2 ||x - V^T u||^2 + sum_k tauPrior[k]/2 (u[k] - mu[k])^2`
+
+    where `V` is the Khatri-Rao product of the other filter banks. Its
+    Hessian `tau V V^T + diag(tauPrior)` is the same for all rows and is
+    factorised once. If the prior is non-negative the quadratic is
+    minimized over the non-negative orthant by coordinate descent on all
+    rows at once, starting from the clipped unconstrained minimum.
+
+    Only homogeneous noise and the priors `Uniform`, `NnUniform`,
+    `Normal`, `CenNormal`, `NnNormal` and `CenNnNormal` are supported (see
+    `supports`).
+
+    Arguments:
+        U: `Tuple[ndarray, ...]`, the filter banks `U[1]`, ..., `U[F-1]`.
+        tau: `float`, precision of the noise.
+        mu: `ndarray` of shape `(K,)`, location of the prior.
+        tauPrior: `ndarray` of shape `(K,)`, precision of the prior.
+        nonNegative: `bool`, whether the prior is non-negative.
+        maxIterations: `int`, maximal number of sweeps of the
+            coordinate descent.
+        tol: `float`, relative change of the filters at which the
+            coordinate descent stops.
+    """
+    def __init__(self, U: Tuple[ndarray, ...], tau: float,
+                 mu: ndarray, tauPrior: ndarray, nonNegative: bool,
+                 maxIterations: int = 1000, tol: float = 1e-10) -> None:
+        self.__U = tuple(np.asarray(Uf, dtype=np.float64) for Uf in U)
+        self.__nonNegative = nonNegative
+        self.__maxIterations = maxIterations
+        self.__tol = tol
+
+        # the Gram matrix of the Khatri-Rao product is the element-wise
+        # product of the Gram matrices of the filter banks
+        G = 1.
+        for Uf in self.__U:
+            G = G*np.dot(Uf, Uf.T)
+        self.__H = tau*G + np.diag(tauPrior)
+        self.__Hinv = np.linalg.inv(self.__H)
+        self.__tau = tau
+        self.__priorTerm = tauPrior*mu
+
+    @staticmethod
+    def supports(prior: Distribution) -> bool:
+        """Whether the transform supports filters with the `prior`.
+
+        The types are matched exactly since subclasses of the supported
+        priors, e.g. `CenNormalRankOne`, have different parameters.
+        """
+        return(type(prior) in (Uniform, NnUniform, Normal, CenNormal,
+                               NnNormal, CenNnNormal))
+
+    @staticmethod
+    def __priorName(prior: Distribution) -> str:
+        return(f"prior0/{type(prior).__name__}")
+
+    @classmethod
+    def parameterNames(cls, prior: Distribution,
+                       F: int) -> Tuple[str, ...]:
+        """Names of the variables required by `fromParameters`.
+
+        Arguments:
+            prior: `Distribution`, prior of the first filter bank.
+            F: `int`, number of factors.
+        """
+        names = tuple(f"U/{f}" for f in range(1, F))
+        names = names + ("likelihood/CenNormal/tau",)
+        name = cls.__priorName(prior)
+        if type(prior) in (CenNormal, CenNnNormal):
+            names = names + (f"{name}/tau",)
+        elif type(prior) in (Normal, NnNormal):
+            names = names + (f"{name}/mu", f"{name}/tau")
+        return(names)
+
+    @classmethod
+    def fromParameters(cls, parameters: Dict[str, ndarray],
+                       prior: Distribution, F: int,
+                       **kwargs) -> "ClosedFormTransform":
+        """Creates the transform from the variables of a fitted model.
+
+        Arguments:
+            parameters: `Dict[str, ndarray]`, variables of the model as
+                returned by `DECOMPOSE.parameters`.
+            prior: `Distribution`, prior of the first filter bank.
+            F: `int`, number of factors.
+            kwargs: further arguments of `ClosedFormTransform`.
+        """
+        if not cls.supports(prior):
+            raise NotImplementedError(f"{type(prior).__name__} is not "
+                                      f"supported by the closed form "
+                                      f"transform")
+        U = tuple(parameters[f"U/{f}"] for f in range(1, F))
+        K = U[0].shape[0]
+        tau = float(np.asarray(parameters["likelihood/CenNormal/tau"])[0])
+        name = cls.__priorName(prior)
+        if type(prior) in (Uniform, NnUniform):
+            mu, tauPrior = np.zeros(K), np.zeros(K)
+        elif type(prior) in (CenNormal, CenNnNormal):
+            mu, tauPrior = np.zeros(K), parameters[f"{name}/tau"]
+        else:
+            mu, tauPrior = parameters[f"{name}/mu"], parameters[f"{name}/tau"]
+        nonNegative = type(prior) in (NnUniform, NnNormal, CenNnNormal)
+        transform = cls(U=U, tau=tau, mu=np.asarray(mu, dtype=np.float64),
+                        tauPrior=np.asarray(tauPrior, dtype=np.float64),
+                        nonNegative=nonNegative, **kwargs)
+        return(transform)
+
+    def transform(self, X: ndarray) -> ndarray:
+        """Estimates the filters of the rows of `X`.
+
+        Arguments:
+            X: `ndarray` of shape `(N, M[1], ..., M[F-1])`.
+
+        Returns:
+            `ndarray` of shape `(K, N)`.
+        """
+        U = self.__U
+        X = np.nan_to_num(np.asarray(X, dtype=np.float64))
+
+        # contract the data with the filter banks one after the other
+        A = np.tensordot(X, U[-1], axes=([-1], [1]))
+        for Uf in reversed(U[:-1]):
+            A = np.einsum("...mk,km->...k", A, Uf)
+        b = self.__tau*A + self.__priorTerm
+
+        U0T = np.dot(b, self.__Hinv)
+        if self.__nonNegative:
+            U0T = self.projectedSolve(b, np.maximum(U0T, 0.))
+        return(U0T.T)
+
+    def projectedSolve(self, b: ndarray, U0T: ndarray) -> ndarray:
+        """Minimizes `u^T H u/2 - b^T u` subject to `u >= 0` for all rows.
+
+        Arguments:
+            b: `ndarray` of shape `(N, K)`.
+            U0T: `ndarray` of shape `(N, K)`, non-negative initial filters.
+
+        Returns:
+            `ndarray` of shape `(N, K)`.
+        """
+        H = self.__H
+        K = H.shape[0]
+        U0T = U0T.copy()
+        for i in range(self.__maxIterations):
+            change, scale = 0., np.max(np.abs(U0T)) + np.finfo(float).tiny
+            for k in range(K):
+                Ufk = U0T[:, k]
+                UfkNew = np.maximum(
+                    Ufk + (b[:, k] - np.dot(U0T, H[:, k]))/H[k, k], 0.)
+                change = max(change, np.max(np.abs(UfkNew - Ufk)))
+                U0T[:, k] = UfkNew
+            if change <= self.__tol*scale:
+                break
+        return(U0T)
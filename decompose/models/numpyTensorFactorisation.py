@@ -0,0 +1,372 @@
+from typing import Tuple, List, Dict
+import numpy as np
+from numpy import ndarray
+import scipy as sp
+import scipy.stats
+import scipy.special
+
+from decompose.distributions.distribution import Distribution
+from decompose.distributions.cenNormal import CenNormal
+from decompose.distributions.normal import Normal
+from decompose.distributions.nnNormal import NnNormal
+from decompose.distributions.uniform import Uniform
+from decompose.distributions.nnUniform import NnUniform
+from decompose.models.tensorFactorisation import Phase
+
+
+class GaussianPrior(object):
+    """Prior of the filters of one factor evaluated with NumPy.
+
+    All supported priors are (possibly non-negative) normal distributions
+    where a precision of zero represents a uniform distribution. Their
+    product with the normal likelihood of a component is again a
+    (possibly non-negative) normal distribution.
+
+    Arguments:
+        prior: `Distribution`, one of `Uniform`, `NnUniform`, `Normal`,
+            `CenNormal` or `NnNormal`.
+        K: `int`, number of components.
+        dtype: `type`, type of the parameters.
+    """
+    def __init__(self, prior: Distribution, K: int, dtype: type) -> None:
+        # the types are matched exactly since subclasses of the supported
+        # priors, e.g. `CenNnNormal`, define different models
+        priorType = type(prior)
+        if priorType in (Uniform, NnUniform):
+            tau = np.zeros(K, dtype=dtype)
+        elif priorType in (Normal, CenNormal, NnNormal):
+            tau = np.random.exponential(size=K).astype(dtype)
+        else:
+            raise NotImplementedError(f"{priorType.__name__} is not "
+                                      f"supported by the numpy backend")
+        self.name = priorType.__name__
+        self.nonNegative = priorType in (NnUniform, NnNormal)
+        self.isUniform = priorType in (Uniform, NnUniform)
+        self.isCentered = priorType == CenNormal
+        if self.isCentered or self.isUniform:
+            self.mu = np.zeros(K, dtype=dtype)
+        else:
+            self.mu = np.random.normal(size=K).astype(dtype)
+        self.tau = tau
+
+    @property
+    def parameters(self) -> Dict[str, ndarray]:
+        if self.isUniform:
+            return({})
+        if self.isCentered:
+            return({"tau": self.tau})
+        return({"mu": self.mu, "tau": self.tau})
+
+    def fit(self, data: ndarray) -> None:
+        """Fits the parameters to `data` of shape `(M, K)`."""
+        if self.isUniform:
+            return
+        if self.nonNegative:
+            self.mu, self.tau = fitNnNormal(self.mu, self.tau, data)
+        elif self.isCentered:
+            self.tau = 1./np.mean(data**2, axis=0)
+        else:
+            self.mu = np.mean(data, axis=0)
+            self.tau = 1./np.mean((data-self.mu)**2, axis=0)
+
+    def llh(self, data: ndarray) -> ndarray:
+        """Log likelihood of `data` of shape `(M, K)`."""
+        if self.isUniform:
+            llh = np.zeros_like(data)
+        elif self.nonNegative:
+            llh = nnNormalLlh(self.mu, self.tau, data)
+        else:
+            llh = normalLlh(self.mu, self.tau, data)
+        if self.nonNegative:
+            llh = np.where(data < 0., -np.inf, llh)
+        return(llh)
+
+    def posterior(self, mu: ndarray, tau: ndarray,
+                  k: int) -> Tuple[ndarray, ndarray]:
+        """Product of a normal likelihood with the prior of component `k`."""
+        tauPost = tau + self.tau[k]
+        muPost = (mu*tau + self.mu[k]*self.tau[k])/tauPost
+        return(muPost, tauPost)
+
+    def draw(self, mu: ndarray, tau: ndarray, sample: bool) -> ndarray:
+        """Draws a sample or the mode of the posterior."""
+        sigma = 1./np.sqrt(tau)
+        if not sample:
+            if self.nonNegative:
+                return(np.maximum(mu, 0.))
+            return(mu)
+        if self.nonNegative:
+            a = -mu/sigma
+            r = sp.stats.truncnorm.rvs(a=a, b=np.inf, loc=mu, scale=sigma)
+            return(np.asarray(r))
+        return(np.random.normal(loc=mu, scale=sigma))
+
+
+def normalLlh(mu: ndarray, tau: ndarray, data: ndarray) -> ndarray:
+    llh = 0.5*(np.log(tau) - np.log(2.*np.pi) - tau*(data-mu)**2)
+    return(llh)
+
+
+def nnNormalLlh(mu: ndarray, tau: ndarray, data: ndarray) -> ndarray:
+    llh = (normalLlh(mu, tau, data)
+           - sp.special.log_ndtr(mu*np.sqrt(tau)))
+    return(llh)
+
+
+def nnNormalGradStep(data: ndarray, mu: ndarray, tau: ndarray,
+                     v: ndarray, e: ndarray) -> Tuple[ndarray, ndarray]:
+    """Line search of `mu` along the sign of the gradient of the llh.
+
+    The precision is tied to `mu` such that the variance of the
+    distribution matches the variance of the data.
+    """
+    swidths = np.array([0., 1e-9, 1e-8, 1e-7, 1e-6, 1e-4, 1e-3,
+                        1e-2, 1e-1, 1e0, 1e1, 1e2, 1e3])
+
+    def meanLlh(mu, tau):
+        llh = np.mean(nnNormalLlh(mu, tau, data), axis=0)
+        return(np.where(tau > 0., llh, -np.inf))
+
+    def tiedTau(mu):
+        with np.errstate(divide="ignore"):
+            return(1./(v+e**2-e*mu))
+
+    for i in range(5):
+        eps = 1e-6*np.maximum(np.abs(mu), 1.)
+        with np.errstate(invalid="ignore"):
+            signGradMu = np.sign(meanLlh(mu+eps, tiedTau(mu+eps))
+                                 - meanLlh(mu-eps, tiedTau(mu-eps)))
+        signGradMu = np.nan_to_num(signGradMu)
+        bestLlh, bestMu, bestTau = meanLlh(mu, tau), mu, tau
+        for swidth in swidths[1:]:
+            mus = mu + signGradMu*swidth
+            taus = tiedTau(mus)
+            tauIsNonPositive = taus <= 0.
+            mus = np.where(tauIsNonPositive, 0., mus)
+            taus = np.where(tauIsNonPositive, 1./e, taus)
+            with np.errstate(invalid="ignore"):
+                llh = meanLlh(mus, taus)
+                isBetter = llh > bestLlh
+            bestLlh = np.where(isBetter, llh, bestLlh)
+            bestMu = np.where(isBetter, mus, bestMu)
+            bestTau = np.where(isBetter, taus, bestTau)
+        mu, tau = bestMu, bestTau
+    return(mu, tau)
+
+
+def fitNnNormal(muOld: ndarray, tauOld: ndarray,
+                data: ndarray) -> Tuple[ndarray, ndarray]:
+    """Fits a non-negative normal distribution to each column of `data`."""
+    e = np.mean(data, axis=0)
+    v = np.mean((data-e)**2, axis=0)
+    s = np.mean(((data-e)/np.sqrt(v))**3, axis=0)
+    muOld, tauOld = nnNormalGradStep(data, muOld, tauOld, v, e)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mu = (s*v**1.5 + e*v - e**3)/(v-e**2)
+        tau = 1./(v+e**2-e*mu)
+    mu, tau = nnNormalGradStep(data, mu, tau, v, e)
+    with np.errstate(invalid="ignore"):
+        llhOld = np.mean(nnNormalLlh(muOld, tauOld, data), axis=0)
+        llh = np.mean(nnNormalLlh(mu, tau, data), axis=0)
+        useOld = np.logical_or(llhOld > llh, np.logical_not(tau > 0.))
+    mu = np.where(useOld, muOld, mu)
+    tau = np.where(useOld, tauOld, tau)
+    return(mu, tau)
+
+
+class NumpyTensorFactorisation(object):
+    """Matrix factorisation with homogeneous normal noise using NumPy.
+
+    Runs the same INIT, EM and BCD schedule as `TensorFactorisation`
+    without building a tensorflow graph. Only fully observed matrices
+    and the priors supported by `GaussianPrior` are supported.
+
+    Arguments:
+        priors: `Tuple[Distribution, Distribution]`, priors of the factors.
+        K: `int`, number of components.
+        dtype: `type`, type of the data and the parameters.
+        stopCriterionInit: `StopCriterion` of the INIT phase.
+        stopCriterionEM: `StopCriterion` of the EM phase.
+        stopCriterionBCD: `StopCriterion` of the BCD phase.
+        maxIterations: `int`, maximal number of iterations of all phases.
+        tau: `float`, initial precision of the noise.
+    """
+    def __init__(self, priors: Tuple[Distribution, ...], K: int,
+                 dtype: type, stopCriterionInit, stopCriterionEM,
+                 stopCriterionBCD, maxIterations: int = 100000,
+                 tau: float = 1./1e10) -> None:
+        if len(priors) != 2:
+            raise NotImplementedError("the numpy backend only supports "
+                                      "matrices")
+        self.__K = K
+        self.__dtype = dtype
+        self.__maxIterations = maxIterations
+        self.__stopCriterions = {Phase.INIT: stopCriterionInit,
+                                 Phase.EM: stopCriterionEM,
+                                 Phase.BCD: stopCriterionBCD}
+
+        # the INIT phase uses uniform priors with the same support
+        initPriors = [NnUniform() if prior.nonNegative else Uniform()
+                      for prior in priors]
+        self.__priors = {
+            Phase.INIT: [GaussianPrior(prior, K, dtype)
+                         for prior in initPriors],
+            Phase.EM: [GaussianPrior(prior, K, dtype) for prior in priors]}
+        self.__priors[Phase.BCD] = self.__priors[Phase.EM]
+
+        # the INIT phase has its own noise distribution
+        self.__tau = {Phase.INIT: np.array([tau], dtype=dtype),
+                      Phase.EM: np.array([tau], dtype=dtype)}
+
+        self.U = None  # type: List[ndarray]
+        self.llh = None  # type: float
+        self.loss = None  # type: float
+        self.nIterations = 0
+
+    def __noisePhase(self, phase: Phase) -> Phase:
+        if phase == Phase.INIT:
+            return(Phase.INIT)
+        return(Phase.EM)
+
+    def randomU(self, M: Tuple[int, ...],
+                priors: List[GaussianPrior]) -> List[ndarray]:
+        U = []
+        for f, Mf in enumerate(M):
+            Uf = np.random.normal(size=(self.__K, Mf))
+            if priors[f].nonNegative:
+                Uf = np.abs(Uf)
+            U.append(Uf.astype(self.__dtype))
+        return(U)
+
+    @staticmethod
+    def rescale(U: List[ndarray], fNonUnit: int) -> List[ndarray]:
+        """Puts all variance in the factor `fNonUnit`-th factor."""
+        U = list(U)
+        norms = [np.linalg.norm(Uf, axis=-1) for Uf in U]
+        scaleOfSources = np.prod(norms, axis=0)
+        for f, Uf in enumerate(U):
+            if f == fNonUnit:
+                rescaleConstant = scaleOfSources/norms[f]
+            else:
+                rescaleConstant = 1./norms[f]
+            U[f] = Uf*rescaleConstant[..., None]
+        return(U)
+
+    @staticmethod
+    def residuals(U: List[ndarray], X: ndarray) -> ndarray:
+        return(X - np.dot(U[0].T, U[1]))
+
+    def lossU(self, U: List[ndarray], X: ndarray) -> float:
+        return(float(np.sum(self.residuals(U, X)**2)))
+
+    def llhU(self, U: List[ndarray], X: ndarray, phase: Phase) -> float:
+        tau = self.__tau[self.__noisePhase(phase)]
+        ssr = np.sum(self.residuals(U, X)**2)
+        llh = 0.5*(X.size*(np.log(tau[0]) - np.log(2.*np.pi)) - tau[0]*ssr)
+        for f, prior in enumerate(self.__priors[phase]):
+            U = self.rescale(U, fNonUnit=f)
+            llh = llh + np.sum(prior.llh(U[f].T))
+        return(float(llh))
+
+    def updateUf(self, U: List[ndarray], X: ndarray, f: int,
+                 prior: GaussianPrior, tau: ndarray,
+                 sample: bool) -> ndarray:
+        """Updates the filters of the `f`-th factor one after the other."""
+        if f == 0:
+            V, Xf = U[1], X
+        else:
+            V, Xf = U[0], X.T
+        Uf = U[f].copy()
+        A = np.dot(Xf, V.T)
+        B = np.dot(V, V.T)
+        for k in range(self.__K):
+            vvT = B[k, k]
+            Xtildev = A[:, k] - np.dot(Uf.T, B[:, k]) + Uf[k]*vvT
+            mu, tauk = prior.posterior(Xtildev/vvT, vvT*tau, k)
+            Ufk = prior.draw(mu, tauk, sample=sample)
+            normUfk = np.linalg.norm(Ufk)
+            if np.isfinite(normUfk) and normUfk > 0.:
+                Uf[k] = Ufk
+        return(Uf)
+
+    def step(self, U: List[ndarray], X: ndarray, phase: Phase,
+             transform: bool = False) -> List[ndarray]:
+        """Performs one update of the filter banks in the given `phase`."""
+        priors = self.__priors[phase]
+        noisePhase = self.__noisePhase(phase)
+        sample = phase != Phase.BCD
+        fitAll = phase != Phase.BCD
+        U = list(U)
+
+        if transform:
+            # only the first factor is updated for new data
+            U[0] = self.updateUf(U, X, 0, priors[0], self.__tau[noisePhase],
+                                 sample=sample)
+            return(U)
+
+        # update the precision of the noise
+        if fitAll:
+            r = self.residuals(U, X)
+            self.__tau[noisePhase] = (
+                1./np.mean(r**2)*np.ones(1)).astype(self.__dtype)
+
+        # update the filters in reversed order
+        for f in reversed(range(len(U))):
+            U = self.rescale(U, fNonUnit=f)
+            if fitAll:
+                priors[f].fit(U[f].T)
+            U[f] = self.updateUf(U, X, f, priors[f], self.__tau[noisePhase],
+                                 sample=sample)
+        return(U)
+
+    def run(self, U: List[ndarray], X: ndarray,
+            transform: bool = False) -> List[ndarray]:
+        """Runs the INIT, EM and BCD phases until each one stops."""
+        nIterations = 0
+        for phase in [Phase.INIT, Phase.EM, Phase.BCD]:
+            stopCriterion = self.__stopCriterions[phase]
+            stopCriterion.npInit()
+            stop = False
+            while not stop and nIterations < self.__maxIterations:
+                stop = stopCriterion.npUpdate(self.llhU(U, X, phase))
+                U = self.step(U, X, phase, transform=transform)
+                nIterations += 1
+        self.nIterations = nIterations
+        return(U)
+
+    def fit(self, X: ndarray) -> "NumpyTensorFactorisation":
+        X = np.nan_to_num(np.asarray(X, dtype=self.__dtype))
+        U = self.randomU(X.shape, self.__priors[Phase.EM])
+        U = self.run(U, X)
+        self.U = U
+        self.llh = self.llhU(U, X, Phase.BCD)
+        self.loss = self.lossU(U, X)
+        return(self)
+
+    def transform(self, X: ndarray) -> ndarray:
+        """Estimates the first filter bank for new data `X`."""
+        X = np.nan_to_num(np.asarray(X, dtype=self.__dtype))
+        U = self.randomU(X.shape, self.__priors[Phase.EM])
+        U[1] = self.U[1]
+        U = self.run(U, X, transform=True)
+        return(U[0])
+
+    @property
+    def parameters(self) -> Dict[str, ndarray]:
+        """The parameters named like the variables of `TensorFactorisation`.
+        """
+        parameters = {}
+        for f, Uf in enumerate(self.U):
+            parameters[f"U/{f}"] = Uf
+        for scope, phase in [("init", Phase.INIT), ("", Phase.EM)]:
+            for f, prior in enumerate(self.__priors[phase]):
+                for name, value in prior.parameters.items():
+                    key = f"prior{scope}{f}/{prior.name}/{name}"
+                    parameters[key] = value
+            key = "likelihood/CenNormal/tau"
+            if scope:
+                key = f"{scope}/{key}"
+            parameters[key] = self.__tau[phase]
+        parameters["llh/llh"] = np.float64(self.llh)
+        parameters["loss/loss"] = np.float64(self.loss)
+        return(parameters)
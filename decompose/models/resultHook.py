@@ -0,0 +1,21 @@
+from typing import Tuple
+import tensorflow as tf
+
+
+class ResultHook(tf.train.SessionRunHook):
+    """Fetches the values of variables from the session at the end of training.
+
+    Arguments:
+        names: `Tuple[str, ...]`, names of the variables to fetch.
+    """
+    def __init__(self, names: Tuple[str, ...]) -> None:
+        self.__names = tuple(names)
+        self.results = {}  # type: dict
+
+    def begin(self):
+        graph = tf.get_default_graph()
+        self.__tensors = {name: graph.get_tensor_by_name(f"{name}:0")
+                          for name in self.__names}
+
+    def end(self, session):
+        self.results = session.run(self.__tensors)
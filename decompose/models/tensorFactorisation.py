@@ -1,4 +1,4 @@
-from typing import Tuple, List, Dict, Any
+from typing import Tuple, List, Dict, Any, Union
 from enum import Enum
 import numpy as np
 import tensorflow as tf
@@ -6,20 +6,28 @@ from tensorflow.python import pywrap_tensorflow
 from tensorflow import Tensor
 from copy import copy
 
-from decompose.distributions.distribution import DrawType, UpdateType
+from decompose.distributions.distribution import (DrawType, UpdateType,
+                                                  SwitchedType)
 from decompose.distributions.distribution import Distribution
+from decompose.distributions.algorithms import FIT_ITERATIONS
+from decompose.numerics import Numerics, CHECKED, numericsPolicy
 from decompose.distributions.uniform import Uniform
 from decompose.distributions.nnUniform import NnUniform
 from decompose.likelihoods.likelihood import Likelihood
 from decompose.likelihoods.specificNormal2dLikelihood import SpecificNormal2dLikelihood
 from decompose.likelihoods.allSpecificNormal2dLikelihood import AllSpecificNormal2dLikelihood
 from decompose.likelihoods.normal2dLikelihood import Normal2dLikelihood
+from decompose.likelihoods.minibatchNormal2dLikelihood import MinibatchNormal2dLikelihood
 from decompose.likelihoods.normalNdLikelihood import NormalNdLikelihood
 from decompose.likelihoods.cvNormal2dLikelihood import CVNormal2dLikelihood
 from decompose.likelihoods.cvNormalNdLikelihood import CVNormalNdLikelihood
+from decompose.likelihoods.sparseNormal2dLikelihood import SparseNormal2dLikelihood
+from decompose.likelihoods.stepCache import StepCache, stepCached
 from decompose.postU.postU import PostU
 from decompose.stopCriterions.llhImprovementThreshold import LlhImprovementThreshold
 from decompose.stopCriterions.llhStall import LlhStall
+from decompose.stopCriterions.stopCriterion import SwitchedStopCriterion
+from decompose.stopCriterions.stopCriterion import STOP
 from decompose.cv.cv import CV
 
 
@@ -115,17 +123,23 @@ class TensorFactorisation(object):
                  stopCriterion,
                  phase: Phase,
                  noiseUniformity: NoiseUniformity,
-                 transform: bool = False) -> None:
+                 transform: bool = False,
+                 rows: Tensor = None,
+                 componentBlockSize: int = 1,
+                 isEm: Tensor = None) -> None:
 
         # setup the model
         self.dtype = dtype
         self.__transform = transform
+        self.__rows = rows
         self.__noiseUniformity = noiseUniformity
         self.likelihood = likelihood
         self.stopCriterion = stopCriterion
+        self.stepCache = StepCache()
         self.postU = []  # type: List[PostU]
         for f, priorUf in enumerate(priorU):
-            postUf = PostU(likelihood, priorUf, f)
+            postUf = PostU(likelihood, priorUf, f,
+                           blockSize=componentBlockSize)
             self.postU.append(postUf)
 
         # create or reuse the variables for the filter banks
@@ -138,9 +152,11 @@ class TensorFactorisation(object):
                 UfVar = tf.get_variable(paramName,
                                         dtype=dtype,
                                         initializer=Uf)
-            U[f] = UfVar
+            U[f] = UfVar.read_value()
         self.__U = tuple(U)
-        if phase == Phase.EM or phase == Phase.INIT:
+        if isEm is not None:
+            self.__setSwitched(isEm)
+        elif phase == Phase.EM or phase == Phase.INIT:
             self.__setEm()
         elif phase == Phase.BCD:
             self.__setBcd()
@@ -157,7 +173,10 @@ class TensorFactorisation(object):
                phase: Phase,
                stopCriterion,
                noiseUniformity: NoiseUniformity = HOMOGENEOUS,
-               transform: bool = False) -> "TensorFactorisation":
+               transform: bool = False,
+               rows: Tensor = None,
+               componentBlockSize: int = 1,
+               isEm: Tensor = None) -> "TensorFactorisation":
 
         # initialize U
         dtype = tf.as_dtype(dtype)
@@ -181,7 +200,10 @@ class TensorFactorisation(object):
                                    phase=phase,
                                    transform=transform,
                                    noiseUniformity=noiseUniformity,
-                                   stopCriterion=stopCriterion)
+                                   stopCriterion=stopCriterion,
+                                   rows=rows,
+                                   componentBlockSize=componentBlockSize,
+                                   isEm=isEm)
         return(tefa)
 
     @property
@@ -192,6 +214,50 @@ class TensorFactorisation(object):
     def noiseUniformity(self) -> NoiseUniformity:
         return(self.__noiseUniformity)
 
+    @property
+    def rows(self) -> Tensor:
+        """Indices of the rows in the current minibatch or `None`."""
+        return(self.__rows)
+
+    @property
+    def isMinibatch(self) -> bool:
+        return(self.__rows is not None)
+
+    def batchU(self) -> List[Tensor]:
+        """The filter banks restricted to the rows of the current minibatch.
+
+        If the model is not trained with minibatches the filter banks
+        are returned unchanged.
+
+        Returns:
+            `List[Tensor]` of filter banks.
+        """
+        U = list(self.U)
+        if self.isMinibatch:
+            U[0] = self.__gatherRows(U[0], self.rows)
+        return(U)
+
+    @stepCached
+    def __gatherRows(self, U0: Tensor, rows: Tensor) -> Tensor:
+        return(tf.gather(U0, rows, axis=1))
+
+    def startStep(self) -> None:
+        """Starts sharing intermediate results until `endStep` is called.
+
+        In between the reconstruction of the data, the residuals and the
+        log likelihoods of the factors are computed only once for each
+        state of the filter banks. They are then shared by the stop
+        criterion, the update of the noise, the loss and the summaries.
+        All calls in between must be in the same branch of a `tf.cond`.
+        """
+        self.stepCache.start()
+        self.likelihood.stepCache.start()
+
+    def endStep(self) -> None:
+        """Stops sharing intermediate results (see `startStep`)."""
+        self.stepCache.end()
+        self.likelihood.stepCache.end()
+
     @parameterProperty
     def U(self) -> Tuple[tf.Tensor, ...]:
         return(self.__U)
@@ -208,6 +274,8 @@ class TensorFactorisation(object):
         with tf.control_dependencies(stopCritDeps):
             if self.transform:
                 self.updateTransform(X)
+            elif self.isMinibatch:
+                self.updateMinibatch(X)
             else:
                 self.updateTrain(X)
 
@@ -229,6 +297,38 @@ class TensorFactorisation(object):
         # update the filter banks
         self.U = tuple(U)
 
+    def updateMinibatch(self, X: Tensor) -> None:
+        """Updates the model given the minibatch `X`.
+
+        Only the rows of the first filter bank that belong to the
+        minibatch are updated. The second filter bank and the noise are
+        updated from the running statistics of the likelihood.
+        """
+        # store the filterbanks of the minibatch in a list
+        U = self.batchU()  # type: List[Tensor]
+        U0Prev = U[0]
+
+        # update the rows of the first filter bank
+        U[0] = self.postU[0].update(U=U, X=X, transform=False)
+
+        # update the running statistics and the noise
+        self.likelihood.update(U=U, X=X, U0Prev=U0Prev)
+
+        # update the second filter bank
+        U[1] = self.postU[1].update(U=U, X=X, transform=False)
+
+        # write the updated rows back into the filter bank variables
+        K = self.likelihood.K
+        rows = tf.cast(self.rows, tf.int64)
+        indices = tf.stack(tf.meshgrid(tf.range(K, dtype=tf.int64), rows,
+                                       indexing="ij"), axis=-1)
+        with tf.variable_scope("U", reuse=tf.AUTO_REUSE):
+            U0Var = tf.get_variable("0", dtype=self.dtype)
+            U1Var = tf.get_variable("1", dtype=self.dtype)
+        U0 = tf.scatter_nd_update(U0Var, indices, U[0])
+        U1 = tf.assign(U1Var, U[1])
+        self.__U = (U0, U1)
+
     def updateTransform(self, X: Tensor) -> None:
         # store filterbanks in a list
         U = list(self.U)  # type: List[Tensor]
@@ -283,44 +383,55 @@ class TensorFactorisation(object):
         self.likelihood.noiseDistribution.drawType = DrawType.MODE
         self.likelihood.noiseDistribution.updateType = UpdateType.ONLYLATENTS
 
+    def __setSwitched(self, isEm: Tensor) -> None:
+        """Set prior and noise distributions to perform EM updates if
+        `isEm` is true at runtime and BCD updates otherwise."""
+        drawType = SwitchedType(isEm, DrawType.SAMPLE, DrawType.MODE)
+        updateType = SwitchedType(isEm, UpdateType.ALL,
+                                  UpdateType.ONLYLATENTS)
+        for postUf in self.postU:
+            postUf.prior.drawType = drawType
+            postUf.prior.updateType = updateType
+        self.likelihood.noiseDistribution.drawType = drawType
+        self.likelihood.noiseDistribution.updateType = updateType
+
+    def rowScale(self, f: int) -> float:
+        """Scales terms of the `f`-th factor of a minibatch to all rows."""
+        if self.isMinibatch and (f == 0):
+            return(self.likelihood.rowScale)
+        return(1.)
+
     def loss(self, X: Tensor) -> Tensor:
         """Loss of the data `X` given the parameters."""
-        loss = self.likelihood.loss(self.U, X)
+        loss = self.likelihood.loss(self.batchU(), X)*self.rowScale(0)
         loss = tf.cast(loss, tf.float64)
         return(loss)
 
     def llh(self, X: Tensor) -> Tensor:
         """Log likelihood of the parameters given data `X`."""
-
-        # log likelihood of the noise
-        llh = self.likelihood.llh(self.U, X)
-
-        # log likelihood of the factors
-        U = list(self.U)
-        for f, postUf in enumerate(self.postU):
-            U = self.rescale(U=U, fNonUnit=f)
-            UfT = tf.transpose(U[f])
-            llhUf = tf.reduce_sum(postUf.prior.llh(UfT))
-            llh = llh + llhUf
-        llh = tf.cast(llh, tf.float64)
+        llh, llhRes, llhU, llhUfk = self.llhIndividual(X)
         return(llh)
 
     def llhIndividual(self, X: Tensor) -> Tensor:
         """Log likelihood of the parameters given data `X`."""
+        return(self.__llhIndividual(self.batchU(), X))
 
+    @stepCached
+    def __llhIndividual(self, U: List[Tensor], X: Tensor) -> Tensor:
         # log likelihood of the noise
-        llhRes = self.likelihood.llh(self.U, X)
+        llhRes = self.likelihood.llh(U, X)*self.rowScale(0)
         llh = llhRes
 
         # log likelihood of the factors
         llhU = []
         llhUfk = []
-        U = list(self.U)
         for f, postUf in enumerate(self.postU):
-            U = self.rescale(U=U, fNonUnit=f)
+            if not self.isMinibatch:
+                U = self.rescale(U=U, fNonUnit=f)
             UfT = tf.transpose(U[f])
-            llhUfk.append(tf.reduce_sum(postUf.prior.llh(UfT), axis=0))
-            llhUf = tf.reduce_sum(postUf.prior.llh(UfT))
+            scale = self.rowScale(f)
+            llhUfk.append(tf.reduce_sum(postUf.prior.llh(UfT), axis=0)*scale)
+            llhUf = tf.reduce_sum(llhUfk[-1])
             llh = llh + llhUf
             llhU.append(llhUf)
         llh = tf.cast(llh, tf.float64)
@@ -347,12 +458,16 @@ class TensorFactorisation(object):
                 cv: CV = None,
                 transform: bool = False,
                 noiseUniformity: NoiseUniformity = HOMOGENEOUS,
-                suffix: str = "") -> "TensorFactorisation":
-        varscope = "stopCriterion" + phase.name
-        stopCriterion.init(ns=varscope)
+                suffix: str = "",
+                rows: Tensor = None,
+                nRows: int = None,
+                incremental: bool = False,
+                componentBlockSize: int = 1,
+                isEm: Tensor = None) -> "TensorFactorisation":
         F = len(priorTypes)
 
         # selecting the apropriate likelihood
+        useSparseNormal2dLikelihood = isinstance(data, tf.SparseTensor)
         useNormal2dLikelihood = (
             F == 2
             and cv is None
@@ -371,6 +486,9 @@ class TensorFactorisation(object):
             and isFullyObserved
             and noiseUniformity == LAST_FACTOR_HETEROGENOUS
             and phase != Phase.INIT)
+        useMinibatchNormal2dLikelihood = (
+            useNormal2dLikelihood
+            and rows is not None)
         useCVNormal2dLikelihood = (
             F == 2
             and (cv is not None
@@ -387,9 +505,30 @@ class TensorFactorisation(object):
                  or not isFullyObserved)
             and noiseUniformity == HOMOGENEOUS)
 
+        # sparse data is only supported for homogeneous noise on matrices
+        if useSparseNormal2dLikelihood and (F != 2 or cv is not None
+                                            or noiseUniformity != HOMOGENEOUS
+                                            or rows is not None):
+            raise NotImplementedError("sparse data is only supported for "
+                                      "matrices with homogeneous noise and "
+                                      "without cv or minibatches")
+
+        # minibatches are only supported for homogeneous noise on matrices
+        if rows is not None and not useMinibatchNormal2dLikelihood:
+            raise NotImplementedError("minibatch training is only supported "
+                                      "for fully observed matrices with "
+                                      "homogeneous noise and without cv")
+
         # instantiate the likelihood
         with tf.variable_scope(f"{suffix}", reuse=reuse):
-            if useNormal2dLikelihood:
+            if useSparseNormal2dLikelihood:
+                likelihood = SparseNormal2dLikelihood(
+                    M=M, K=K, dtype=dtype)  # type: Likelihood
+            elif useMinibatchNormal2dLikelihood:
+                likelihood = MinibatchNormal2dLikelihood(
+                    M=M, K=K, nRows=nRows, rows=rows,
+                    incremental=incremental, dtype=dtype)  # type: Likelihood
+            elif useNormal2dLikelihood:
                 likelihood = Normal2dLikelihood(
                     M=M, K=K, dtype=dtype)  # type: Likelihood
             elif useAllSpecificNormal2dLikelihood:
@@ -400,13 +539,15 @@ class TensorFactorisation(object):
                     M=M, K=K, dtype=dtype)
             elif useCVNormal2dLikelihood:
                 likelihood = CVNormal2dLikelihood(
-                    M=M, K=K, dtype=dtype, cv=cv)
+                    M=M, K=K, dtype=dtype, cv=cv,
+                    isFullyObserved=isFullyObserved)
             elif useNormalNdLikelihood:
                 likelihood = NormalNdLikelihood(
                     M=M, K=K, dtype=dtype)
             elif useCVNormalNdLikelihood:
                 likelihood = CVNormalNdLikelihood(
-                    M=M, K=K, dtype=dtype, cv=cv)
+                    M=M, K=K, dtype=dtype, cv=cv,
+                    isFullyObserved=isFullyObserved)
             else:
                 raise NotImplementedError()
             likelihood.init(data)
@@ -419,10 +560,14 @@ class TensorFactorisation(object):
                 priors.append(prior)
 
         # instantiate the model
+        if rows is not None:
+            M = (nRows, *M[1:])
         tefa = cls.random(priorU=priors, likelihood=likelihood, M=M, K=K,
                           phase=phase, stopCriterion=stopCriterion,
                           dtype=dtype, noiseUniformity=noiseUniformity,
-                          transform=transform)
+                          transform=transform, rows=rows,
+                          componentBlockSize=componentBlockSize,
+                          isEm=isEm)
         return(tefa)
 
     @classmethod
@@ -433,22 +578,36 @@ class TensorFactorisation(object):
                         stopCriterionBCD,
                         cv: CV, path: str,
                         noiseUniformity: NoiseUniformity,
-                        transform: bool, dtype: tf.DType) -> EstimatorSpec:
+                        transform: bool, dtype: tf.DType,
+                        nRows: int = None,
+                        incremental: bool = False,
+                        componentBlockSize: int = 1,
+                        summarySteps: int = 1,
+                        sparseShape: Tuple[int, ...] = None,
+                        numerics: Numerics = CHECKED,
+                        iterationsPerRun: int = 1) -> EstimatorSpec:
         # PREDICT and EVAL are not supported
         if mode != tf.estimator.ModeKeys.TRAIN:
             raise ValueError
 
         # TRAIN
-        with tf.device(device):
+        with tf.device(device), numericsPolicy(numerics):
             # check the input data
-            labels = list(features.keys())
-            assert len(labels) == 1
-            data = features[labels[0]]
-            dataShape = tuple(data.get_shape().as_list())
-            assert len(dataShape) == len(priors)
-
-            # shape of the data
-            M = data.get_shape().as_list()
+            rows = features.get("rows", None)
+            assert (rows is None) == (nRows is None)
+            if sparseShape is None:
+                labels = [label for label in features.keys()
+                          if label not in ("rows", "scrubbed")]
+                assert len(labels) == 1
+                data = features[labels[0]]
+                M = data.get_shape().as_list()
+            else:
+                # the observed entries of sparse data in COO format
+                data = tf.SparseTensor(indices=features["indices"],
+                                       values=features["values"],
+                                       dense_shape=sparseShape)
+                M = list(sparseShape)
+            assert len(M) == len(priors)
 
             # create llh variable
             inf = np.float64(np.inf)
@@ -466,99 +625,187 @@ class TensorFactorisation(object):
                 stopVar = tf.get_variable("stop", dtype=tf.bool,
                                           initializer=False)
 
-            # INIT model
+            # create the variables of the stop criterions
+            stopCriterionInit.init(ns="stopCriterion" + Phase.INIT.name)
+            stopCriterionEM.init(ns="stopCriterion" + Phase.EM.name)
+            stopCriterionBCD.init(ns="stopCriterion" + Phase.BCD.name)
+
             initPriors = []  # type: List[Distribution]
             for prior in priors:
                 if prior.nonNegative:
                     initPriors.append(NnUniform())
                 else:
                     initPriors.append(Uniform())
-            tefaInit = cls.__model(data=data, priorTypes=initPriors, K=K, M=M,
+
+            def models():
+                # INIT model
+                tefaInit = cls.__model(data=data, priorTypes=initPriors,
+                                       K=K, M=M,
+                                       isFullyObserved=isFullyObserved,
+                                       stopCriterion=stopCriterionInit,
+                                       dtype=dtype, reuse=tf.AUTO_REUSE,
+                                       transform=transform, cv=cv,
+                                       phase=Phase.INIT,
+                                       noiseUniformity=noiseUniformity,
+                                       suffix="init", rows=rows, nRows=nRows,
+                                       incremental=incremental,
+                                       componentBlockSize=componentBlockSize)
+
+                # EM and BCD share a single model whose phase is switched
+                # at runtime by the stop variable of the EM phase
+                isEm = tf.logical_not(stopCriterionEM.stopVar.read_value())
+                stopCriterion = SwitchedStopCriterion(isEm, stopCriterionEM,
+                                                      stopCriterionBCD)
+                tefa = cls.__model(data=data, priorTypes=priors, K=K, M=M,
                                    isFullyObserved=isFullyObserved,
-                                   stopCriterion=stopCriterionInit,
-                                   dtype=dtype, reuse=False,
+                                   stopCriterion=stopCriterion,
+                                   dtype=dtype, phase=Phase.EM,
                                    transform=transform, cv=cv,
-                                   phase=Phase.INIT,
                                    noiseUniformity=noiseUniformity,
-                                   suffix="init")
-
-            # EM model
-            tefaEM = cls.__model(data=data, priorTypes=priors, K=K, M=M,
-                                 isFullyObserved=isFullyObserved,
-                                 stopCriterion=stopCriterionEM,
-                                 dtype=dtype, phase=Phase.EM,
-                                 transform=transform, cv=cv,
-                                 noiseUniformity=noiseUniformity,
-                                 reuse=tf.AUTO_REUSE)
-
-            # BCD model
-            tefaBCD = cls.__model(data=data, priorTypes=priors, K=K, M=M,
-                                  isFullyObserved=isFullyObserved,
-                                  stopCriterion=stopCriterionBCD,
-                                  dtype=dtype, phase=Phase.BCD,
-                                  transform=transform, cv=cv,
-                                  noiseUniformity=noiseUniformity,
-                                  reuse=tf.AUTO_REUSE)
-
-            # replace nan with zeros
-            data = tf.where(tf.is_nan(data), tf.zeros_like(data), data)
-
-            # conduct an update depending on the current phase
-            stopVarInit = tefaInit.stopCriterion.stopVar
-            stopVarEm = tefaEM.stopCriterion.stopVar
-            loss = tf.cond(tf.logical_not(stopVarInit),
-                           lambda: tefaInit.loss(X=data),
-                           lambda: tf.cond(tf.logical_not(stopVarEm),
-                                           lambda: tefaEM.loss(X=data),
-                                           lambda: tefaBCD.loss(X=data)))
-
-            # conduct an update depending on the current phase
-            deps = tf.cond(tf.logical_not(stopVarInit),
-                           lambda: tefaInit.update(X=data),
-                           lambda: tf.cond(tf.logical_not(stopVarEm),
-                                           lambda: tefaEM.update(X=data),
-                                           lambda: tefaBCD.update(X=data)))
-
-            # update the global stop variable
-            stopVarBcd = tefaBCD.stopCriterion.stopVar
-            stop = tf.logical_and(stopVarInit,
-                                  tf.logical_and(stopVarEm,
-                                                 stopVarBcd))
-            with tf.control_dependencies(deps):
-                updatedStopVar = tf.assign(stopVar, stop)
-
-            # if stopping criterion is reached store the llh
-            updates = tf.cond(stop,
-                              lambda: (tf.assign(llhVar, tefaBCD.llh(data)),
-                                       tf.assign(lossVar, tefaBCD.loss(data))),
-                              lambda: (llhVar, lossVar))
-
-            # increment global step variable
-            with tf.control_dependencies([updatedStopVar, *updates]):
+                                   reuse=tf.AUTO_REUSE, rows=rows,
+                                   nRows=nRows, incremental=incremental,
+                                   componentBlockSize=componentBlockSize,
+                                   isEm=isEm)
+                return(tefaInit, tefa)
+
+            # the variables are created along with the models
+            tefaInit, tefa = models()
+
+            # replace nan with zeros unless it was done when the data
+            # was loaded (see `ResidentData`)
+            X = data
+            if sparseShape is None:
+                scrubbed = features.get("scrubbed", None)
+                if scrubbed is None:
+                    X = tf.where(tf.is_nan(data), tf.zeros_like(data), data)
+                else:
+                    X = scrubbed
+
+            # conduct an update depending on the current phase, the
+            # residuals are computed only once for the loss, the llh and
+            # the update within each phase
+            def phaseUpdate(model):
+                model.startStep()
+                results = (model.loss(X=X),)
+                if summarySteps is not None:
+                    # shared with the stop criterion
+                    results = results + (model.llh(X=X),)
+                U = model.update(X=X)
+                model.endStep()
+                return((*U, *results))
+
+            def iteration(tefaInit, tefa):
+                stopVarInit = stopCriterionInit.stopVar.read_value()
+                deps = tf.cond(tf.logical_not(stopVarInit),
+                               lambda: phaseUpdate(tefaInit),
+                               lambda: phaseUpdate(tefa))
+
+                llh = None
+                if summarySteps is not None:
+                    deps, llh = deps[:-1], deps[-1]
+                deps, loss = deps[:-1], deps[-1]
+
+                # update the global stop variable
+                stopVarEm = stopCriterionEM.stopVar.read_value()
+                stopVarBcd = stopCriterionBCD.stopVar.read_value()
+                stop = tf.logical_and(stopVarInit,
+                                      tf.logical_and(stopVarEm,
+                                                     stopVarBcd))
+                with tf.control_dependencies(deps):
+                    updatedStopVar = tf.assign(stopVar, stop)
+
+                # the value instead of the reference to the variable
+                # can be passed on as a loop variable
+                return(tf.identity(updatedStopVar), loss, llh)
+
+            def storeResults(tefa, stop):
+                # if stopping criterion is reached store the llh
+                def store():
+                    return(tf.group(tf.assign(llhVar, tefa.llh(X)),
+                                    tf.assign(lossVar, tefa.loss(X))))
+                return(tf.cond(stop, store, tf.no_op))
+
+            if iterationsPerRun == 1:
+                stop, loss, llh = iteration(tefaInit, tefa)
+                stored = storeResults(tefa, stop)
+                nIterations = tf.constant(1, dtype=tf.int64)
+            else:
+                # several iterations in one run, the update ops are built
+                # only in the body where the models are created again such
+                # that the parameters are read in every iteration, the
+                # models above only create the variables since their
+                # initializers must not be created within the loop
+                def cond(i, stop, loss, llh):
+                    return(tf.logical_and(tf.less(i, iterationsPerRun),
+                                          tf.logical_not(stop)))
+
+                def body(i, stop, loss, llh):
+                    tefaInit, tefa = models()
+                    stopNew, lossNew, llhNew = iteration(tefaInit, tefa)
+                    if llhNew is None:
+                        llhNew = llh
+                    with tf.control_dependencies([storeResults(tefa,
+                                                               stopNew)]):
+                        i = i + 1
+                    return(i, stopNew, lossNew, llhNew)
+
+                loopVars = [tf.constant(0, dtype=tf.int64),
+                            stopVar.read_value(), lossVar.read_value(),
+                            llhVar.read_value()]
+                nIterations, stop, loss, llh = tf.while_loop(
+                    cond, body, loopVars, parallel_iterations=1)
+                stored = nIterations
+
+            # increment global step variable by the number of iterations
+            with tf.control_dependencies([stop, stored]):
                 step = tf.train.get_or_create_global_step()
-                trainOp = tf.assign(step, step + 1)
-
-            # log summaries
-            tf.summary.scalar("loss", loss)
-            llh = tf.cond(tf.logical_not(stopVarInit),
-                          lambda: tefaInit.llhIndividual(X=data),
-                          lambda: tf.cond(tf.logical_not(stopVarEm),
-                                          lambda: tefaEM.llhIndividual(X=data),
-                                          lambda: tefaBCD.llhIndividual(X=data)))
-            llh, llhRes, llhU, llhUfk = llh
-            tf.summary.scalar("llh", llh)
-            tf.summary.scalar("llhResiduals", llhRes)
-            for f, (llhUf, llhUfk) in enumerate(zip(llhU, llhUfk)):
-                tf.summary.scalar(f"llhU{f}", llhUf)
-
-            SAVE_EVERY_N_STEPS = 1  # TODO: make configurable
-            summary_hook = tf.train.SummarySaverHook(
-                SAVE_EVERY_N_STEPS,
-                output_dir=path,
-                summary_op=tf.summary.merge_all())
-
-        return EstimatorSpec(mode, loss=loss, train_op=trainOp,
-                             training_hooks=[summary_hook])
+                trainOp = tf.assign_add(step, nIterations)
+
+            # the stop flag is fetched by `StopHook` along with `trainOp`
+            with tf.control_dependencies([trainOp]):
+                tf.add_to_collection(STOP, stopVar.read_value())
+
+            # log summaries, they are written by the estimator as
+            # configured in `runConfig`
+            if summarySteps is not None:
+                tf.summary.scalar("loss", loss)
+                tf.summary.scalar("llh", llh)
+
+                # iterations of the last fit of each prior in this step
+                with tf.control_dependencies([trainOp]):
+                    for fitIterations in tf.get_collection(FIT_ITERATIONS):
+                        tf.summary.scalar(fitIterations.op.name,
+                                          fitIterations.read_value())
+
+        return EstimatorSpec(mode, loss=loss, train_op=trainOp)
+
+    @staticmethod
+    def runConfig(checkpoints: Union[str, int],
+                  summarySteps: int = 1) -> tf.estimator.RunConfig:
+        """Configures how often checkpoints and summaries are written.
+
+        Arguments:
+            checkpoints: `str` or `int`, either `"off"` to not write any
+                checkpoints, `"final"` to write only a checkpoint at the end
+                of the training or the number of steps between checkpoints.
+            summarySteps: `int`, number of steps between the summaries of
+                the estimator or `None` to not write any summaries.
+
+        Returns:
+            `RunConfig` of the estimator.
+        """
+        if checkpoints == "off":
+            steps = None
+        elif checkpoints == "final":
+            steps = np.iinfo(np.int64).max
+        elif isinstance(checkpoints, int) and checkpoints > 0:
+            steps = checkpoints
+        else:
+            raise ValueError(f"invalid checkpoints {checkpoints}")
+        config = tf.estimator.RunConfig(save_checkpoints_steps=steps,
+                                        save_checkpoints_secs=None,
+                                        save_summary_steps=summarySteps)
+        return(config)
 
     @classmethod
     def getEstimator(cls, priors: Tuple[Distribution, ...], K: int,
@@ -569,7 +816,52 @@ class TensorFactorisation(object):
                      stopCriterionEM=LlhStall(100),
                      stopCriterionBCD=LlhImprovementThreshold(1e-2),
                      path: str = "/tmp", device: str = "/cpu:0",
-                     cv: CV = None):
+                     cv: CV = None, nRows: int = None,
+                     incremental: bool = False,
+                     componentBlockSize: int = 1,
+                     checkpoints: Union[str, int] = "final",
+                     summarySteps: int = 1,
+                     sparseShape: Tuple[int, ...] = None,
+                     numerics: Numerics = CHECKED,
+                     iterationsPerRun: int = 1):
+        """Creates an estimator that learns the filter banks.
+
+        If `nRows` is given the estimator expects minibatches of rows of a
+        matrix with `nRows` rows. Besides the data the features must then
+        contain the indices of the rows in the minibatch under the key
+        `rows`. If `incremental` is `True` the statistics of the full data
+        are accumulated exactly from the minibatches, which requires that
+        every row is served once per epoch (see `decompose.data.RowBlocks`).
+        If `componentBlockSize` is larger than 1 blocks of components are
+        updated jointly (see `PostU`). How often checkpoints are written is
+        set by `checkpoints` (see `runConfig`). Summaries of the loss and of
+        the log likelihood are written every `summarySteps` steps or not at
+        all if `summarySteps` is `None`.
+
+        If `sparseShape` is given the estimator expects only the observed
+        entries of a matrix of that shape. The features must then contain
+        the indices of the entries under the key `indices` and their values
+        under the key `values` (see `SparseNormal2dLikelihood`).
+
+        If the features contain the data with its missing values replaced
+        by zeros under the key `scrubbed` the replacement is not repeated
+        in every step (see `decompose.data.ResidentData`).
+
+        With the `numerics` policy `FAST` the graph contains no `tf.Assert`
+        ops and invalid updates of components are discarded without
+        branching (see `decompose.numerics`).
+
+        If `iterationsPerRun` is larger than 1 each run of the train op
+        performs up to that many iterations in a `tf.while_loop` that
+        ends early once the stop variable is set. The global step is
+        incremented by the number of iterations performed. A limit on
+        the steps of the training is only checked between runs and may
+        thus be exceeded by up to `iterationsPerRun - 1` iterations. This
+        is not supported for minibatches, which are served once per run.
+        """
+        if iterationsPerRun > 1 and nRows is not None:
+            raise NotImplementedError("several iterations per run are not "
+                                      "supported for minibatches")
 
         def model_fn(features, labels, mode):
             es = cls.__estimatorSpec(mode=mode, features=features,
@@ -580,11 +872,19 @@ class TensorFactorisation(object):
                                      stopCriterionEM=stopCriterionEM,
                                      stopCriterionBCD=stopCriterionBCD,
                                      cv=cv, path=path, K=K,
-                                     transform=False, dtype=dtype)
+                                     transform=False, dtype=dtype,
+                                     nRows=nRows, incremental=incremental,
+                                     componentBlockSize=componentBlockSize,
+                                     summarySteps=summarySteps,
+                                     sparseShape=sparseShape,
+                                     numerics=numerics,
+                                     iterationsPerRun=iterationsPerRun)
             return(es)
 
         est = tf.estimator.Estimator(model_fn=model_fn,
-                                     model_dir=path)
+                                     model_dir=path,
+                                     config=cls.runConfig(checkpoints,
+                                                          summarySteps))
         return(est)
 
     @classmethod
@@ -594,13 +894,19 @@ class TensorFactorisation(object):
                               stopCriterionInit=LlhStall(10),
                               stopCriterionEM=LlhStall(100),
                               stopCriterionBCD=LlhImprovementThreshold(1e-2),
-                              path: str = "/tmp", device: str = "/cpu:0"):
+                              path: str = "/tmp", device: str = "/cpu:0",
+                              componentBlockSize: int = 1,
+                              checkpoints: Union[str, int] = "final",
+                              summarySteps: int = 1,
+                              numerics: Numerics = CHECKED,
+                              iterationsPerRun: int = 1):
         # configuring warm start settings
         reader = pywrap_tensorflow.NewCheckpointReader(chptFile)
         varList = [v for v in reader.get_variable_to_shape_map().keys()
                    if (v != "U/0" and
                        v != "global_step" and
                        v != "stop" and
+                       not v.endswith("normX2") and
                        not v.startswith(f"stopCriterion{Phase.INIT.name}/") and
                        not v.startswith(f"stopCriterion{Phase.EM.name}/") and
                        not v.startswith(f"stopCriterion{Phase.BCD.name}/"))]
@@ -617,10 +923,16 @@ class TensorFactorisation(object):
                                      stopCriterionEM=stopCriterionEM,
                                      stopCriterionBCD=stopCriterionBCD,
                                      K=K, path=path, cv=None,
-                                     transform=True, dtype=dtype)
+                                     transform=True, dtype=dtype,
+                                     componentBlockSize=componentBlockSize,
+                                     summarySteps=summarySteps,
+                                     numerics=numerics,
+                                     iterationsPerRun=iterationsPerRun)
             return(es)
 
         est = tf.estimator.Estimator(model_fn=model_fn,
                                      model_dir=path,
+                                     config=cls.runConfig(checkpoints,
+                                                          summarySteps),
                                      warm_start_from=ws)
         return(est)
@@ -0,0 +1,63 @@
+import pytest
+import numpy as np
+import scipy as sp
+import scipy.optimize
+
+from decompose.models.closedFormTransform import ClosedFormTransform
+from decompose.distributions.cenNnNormal import CenNnNormal
+from decompose.distributions.cenNormalRankOne import CenNormalRankOne
+from decompose.distributions.nnNormal import NnNormal
+
+
+@pytest.mark.parametrize("nonNegative", [False, True])
+def test_transform(nonNegative):
+    K, M, N, tau = 4, (7, 5), 6, 2.
+    U = tuple(np.random.normal(size=(K, Mf)) for Mf in M)
+    X = np.random.normal(size=(N,) + M)
+    mu, tauPrior = np.random.random(K), np.random.random(K)
+
+    transform = ClosedFormTransform(U=U, tau=tau, mu=mu, tauPrior=tauPrior,
+                                    nonNegative=nonNegative)
+    U0 = transform.transform(X)
+    assert(U0.shape == (K, N))
+
+    # least squares problem of each row including the prior
+    V = np.einsum("ka,kb->abk", *U).reshape(-1, K)
+    A = np.concatenate((np.sqrt(tau)*V, np.diag(np.sqrt(tauPrior))))
+    for n in range(N):
+        b = np.concatenate((np.sqrt(tau)*X[n].flatten(),
+                            np.sqrt(tauPrior)*mu))
+        if nonNegative:
+            U0gt = sp.optimize.nnls(A, b)[0]
+        else:
+            U0gt = np.linalg.lstsq(A, b, rcond=None)[0]
+        assert(np.allclose(U0gt, U0[:, n], atol=1e-6))
+
+
+def test_fromParameters_cenNnNormal():
+    """Tests that `CenNnNormal` is a non-negative prior with zero mean."""
+    K, M, N, tau = 4, (7,), 6, 2.
+    U1 = np.random.normal(size=(K, M[0]))
+    X = np.random.normal(size=(N,) + M)
+    tauPrior = np.random.random(K)
+    parameters = {"U/1": U1,
+                  "likelihood/CenNormal/tau": np.array([tau]),
+                  "prior0/CenNnNormal/tau": tauPrior}
+
+    prior = CenNnNormal()
+    assert(ClosedFormTransform.supports(prior))
+    assert(set(ClosedFormTransform.parameterNames(prior, F=2))
+           == set(parameters.keys()))
+    transform = ClosedFormTransform.fromParameters(parameters, prior=prior,
+                                                   F=2)
+    transformGt = ClosedFormTransform(U=(U1,), tau=tau, mu=np.zeros(K),
+                                      tauPrior=tauPrior, nonNegative=True)
+    U0 = transform.transform(X)
+    assert(np.all(U0 >= 0.))
+    assert(np.allclose(U0, transformGt.transform(X)))
+
+
+def test_supports_exactTypes():
+    """Tests that subclasses with other parameters are not supported."""
+    assert(ClosedFormTransform.supports(NnNormal()))
+    assert(not ClosedFormTransform.supports(CenNormalRankOne()))
@@ -0,0 +1,64 @@
+import pytest
+import numpy as np
+
+from decompose.models.numpyTensorFactorisation import NumpyTensorFactorisation
+from decompose.models.numpyTensorFactorisation import GaussianPrior
+from decompose.models.numpyTensorFactorisation import fitNnNormal
+from decompose.distributions.cenNormal import CenNormal
+from decompose.distributions.nnNormal import NnNormal
+from decompose.distributions.cenNnNormal import CenNnNormal
+from decompose.distributions.cenNormalRankOne import CenNormalRankOne
+from decompose.stopCriterions.llhStall import LlhStall
+from decompose.stopCriterions.llhImprovementThreshold import LlhImprovementThreshold
+
+
+@pytest.fixture(scope="module",
+                params=[CenNormal, NnNormal])
+def priorType(request):
+    priorType = request.param
+    return(priorType)
+
+
+def test_fit(priorType):
+    K, M = 3, (500, 200)
+    U = [np.random.normal(size=(K, M[0])), np.random.normal(size=(K, M[1]))]
+    if priorType().nonNegative:
+        U = [np.abs(Uf) for Uf in U]
+    X = np.dot(U[0].T, U[1]) + np.random.normal(size=M, scale=0.1)
+
+    priors = (priorType(), priorType())
+    tefa = NumpyTensorFactorisation(
+        priors=priors, K=K, dtype=np.float64,
+        stopCriterionInit=LlhStall(10), stopCriterionEM=LlhStall(10),
+        stopCriterionBCD=LlhImprovementThreshold(.1), maxIterations=200)
+    tefa.fit(X)
+
+    r = X - np.dot(tefa.U[0].T, tefa.U[1])
+    assert(1. - np.var(r)/np.var(X) > 0.95)
+    assert(np.isfinite(tefa.llh))
+    assert(np.isclose(tefa.loss, np.sum(r**2)))
+    if priorType().nonNegative:
+        assert(np.all(tefa.U[0] >= 0.) and np.all(tefa.U[1] >= 0.))
+
+    U0 = tefa.transform(X[:50])
+    r = X[:50] - np.dot(U0.T, tefa.U[1])
+    assert(1. - np.var(r)/np.var(X[:50]) > 0.95)
+
+
+def test_fitNnNormal():
+    # the bounds do not hold for every sample
+    np.random.seed(0)
+    mu, tau = np.array([1., -1.]), np.array([1., 4.])
+    gp = GaussianPrior(NnNormal(), K=2, dtype=np.float64)
+    data = gp.draw(np.ones((10000, 2))*mu, np.ones((10000, 2))*tau,
+                   sample=True)
+    muFit, tauFit = fitNnNormal(np.zeros(2), np.ones(2), data)
+    assert(np.allclose(mu, muFit, atol=0.3))
+    assert(np.allclose(tau, tauFit, rtol=0.3))
+
+
+@pytest.mark.parametrize("prior", [CenNnNormal(), CenNormalRankOne()])
+def test_gaussianPrior_subclasses(prior):
+    """Subclasses of the supported priors define different models."""
+    with pytest.raises(NotImplementedError):
+        GaussianPrior(prior, K=2, dtype=np.float64)
@@ -0,0 +1,111 @@
+import time
+import pytest
+import numpy as np
+import tensorflow as tf
+
+from decompose.models.tensorFactorisation import TensorFactorisation, Phase
+from decompose.likelihoods.normal2dLikelihood import Normal2dLikelihood
+from decompose.distributions.cenNormal import CenNormal
+from decompose.stopCriterions.stopCriterion import NoStop, STOP
+from decompose.tests.fixtures import device, dtype
+
+
+def test_switchedPhase(device, dtype):
+    """Test that the phase of a single model is switched at runtime."""
+    npdtype = dtype.as_numpy_dtype
+    M, K = (20, 30), 3
+    data = tf.constant(np.random.normal(size=M).astype(npdtype))
+    lh = Normal2dLikelihood(M=M, K=K, dtype=dtype)
+    lh.init(data=data)
+    priors = [CenNormal().random(shape=(K,), latentShape=(M[f],),
+                                 name=f"prior{f}", dtype=dtype)
+              for f in range(2)]
+    stopCriterion = NoStop()
+    stopCriterion.init(ns="stopCriterion")
+    isEm = tf.placeholder(dtype=tf.bool, shape=())
+    tefa = TensorFactorisation.random(priorU=priors, likelihood=lh, M=M, K=K,
+                                      dtype=dtype, phase=Phase.EM,
+                                      stopCriterion=stopCriterion, isEm=isEm)
+    U = tefa.update(X=data)
+    variables = [lh.noiseDistribution.vars("tau"),
+                 priors[0].vars("tau"), priors[1].vars("tau")]
+
+    with tf.Session() as sess:
+        sess.run(tf.global_variables_initializer())
+        init = sess.run(variables)
+
+        # BCD keeps the noise and the priors
+        sess.run(U, feed_dict={isEm: False})
+        bcd = sess.run(variables)
+        for valueInit, valueBcd in zip(init, bcd):
+            assert(np.allclose(valueInit, valueBcd))
+
+        # EM fits the noise and the priors
+        sess.run(U, feed_dict={isEm: True})
+        em = sess.run(variables)
+        for valueInit, valueEm in zip(init, em):
+            assert(not np.allclose(valueInit, valueEm))
+    tf.reset_default_graph()
+
+
+def test_estimatorSpec_iterationsPerRun(tmpdir):
+    """Test that a run performs several iterations and provides the stop."""
+    M, K, iterationsPerRun = (20, 30), 3, 5
+    priors = (CenNormal(), CenNormal())
+    est = TensorFactorisation.getEstimator(priors=priors, K=K,
+                                           path=str(tmpdir),
+                                           iterationsPerRun=iterationsPerRun,
+                                           checkpoints="off")
+    data = np.random.normal(size=M).astype(np.float32)
+
+    graph = tf.Graph()
+    with graph.as_default():
+        X = tf.placeholder(dtype=tf.float32, shape=M)
+        spec = est.model_fn({"train": X}, None, tf.estimator.ModeKeys.TRAIN,
+                            est.config)
+        stop = tf.get_collection(STOP)
+        assert(len(stop) == 1)
+        step = tf.train.get_global_step()
+
+        with tf.Session() as sess:
+            sess.run([tf.global_variables_initializer(),
+                      tf.local_variables_initializer()])
+            for run in range(3):
+                _, isStop = sess.run([spec.train_op, stop[0]],
+                                     feed_dict={X: data})
+                assert(not isStop)
+                assert(sess.run(step) == (run + 1)*iterationsPerRun)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("M", [(1000, 1000), (100, 100, 100)])
+def test_estimatorSpec_benchmark(M, tmpdir):
+    """Benchmarks the graph construction and the steps of the estimator."""
+    K, nSteps = 5, 20
+    priors = tuple(CenNormal() for f in range(len(M)))
+    est = TensorFactorisation.getEstimator(priors=priors, K=K,
+                                           path=str(tmpdir),
+                                           checkpoints="off")
+    data = np.random.normal(size=M).astype(np.float32)
+
+    graph = tf.Graph()
+    with graph.as_default():
+        X = tf.placeholder(dtype=tf.float32, shape=M)
+        t0 = time.perf_counter()
+        spec = est.model_fn({"train": X}, None, tf.estimator.ModeKeys.TRAIN,
+                            est.config)
+        buildTime = time.perf_counter() - t0
+        nOps = len(graph.get_operations())
+        graphBytes = graph.as_graph_def().ByteSize()
+
+        with tf.Session() as sess:
+            sess.run([tf.global_variables_initializer(),
+                      tf.local_variables_initializer()])
+            sess.run(spec.train_op, feed_dict={X: data})
+            t0 = time.perf_counter()
+            for step in range(nSteps):
+                sess.run(spec.train_op, feed_dict={X: data})
+            stepTime = (time.perf_counter() - t0)/nSteps
+
+    print(f"M={M}: graph built in {buildTime:.2f}s with {nOps} ops "
+          f"({graphBytes/1e6:.2f}MB), step time {stepTime:.4f}s")
@@ -0,0 +1,82 @@
+import asyncio
+import pytest
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+from decompose.models.transformService import TransformService, loadBenchmark
+from decompose.models.closedFormTransform import ClosedFormTransform
+
+
+def linearTransform(X):
+    return(np.stack((X.sum(axis=1), X[:, 0])))
+
+
+def test_transform():
+    X = np.random.normal(size=(100, 5))
+    with TransformService(linearTransform, maxBatchSize=32,
+                          maxLatency=0.01) as service:
+        with ThreadPoolExecutor(8) as executor:
+            U0 = list(executor.map(lambda n: service.transform(X[n:n+2]),
+                                   range(0, 100, 2)))
+        stats = service.stats()
+
+    assert(np.allclose(np.concatenate(U0, axis=1), linearTransform(X)))
+    assert(stats["meanBatchRows"] > 2)
+    assert(stats["p50"] <= stats["p99"])
+
+
+def test_transformAsync():
+    X = np.random.normal(size=(10, 5))
+
+    async def requests(service):
+        U0 = await asyncio.gather(*[service.transformAsync(X[n:n+1])
+                                    for n in range(10)])
+        return(U0)
+
+    loop = asyncio.new_event_loop()
+    with TransformService(linearTransform) as service:
+        U0 = loop.run_until_complete(requests(service))
+    loop.close()
+    assert(np.allclose(np.concatenate(U0, axis=1), linearTransform(X)))
+
+
+def test_transformError():
+    def failingTransform(X):
+        raise ValueError("invalid data")
+
+    with TransformService(failingTransform) as service:
+        futures = [service.submit(np.zeros((1, 3))) for i in range(3)]
+        for future in futures:
+            with pytest.raises(ValueError):
+                future.result()
+
+
+def test_transformClosed():
+    X = np.random.normal(size=(10, 5))
+    with TransformService(linearTransform) as service:
+        U0 = service.transform(X)
+    assert(np.allclose(U0, linearTransform(X)))
+
+    # requests after closing fail instead of waiting forever
+    with pytest.raises(RuntimeError):
+        service.transform(X)
+    with pytest.raises(RuntimeError):
+        service.submit(X)
+    service.close()
+
+
+@pytest.mark.slow
+def test_loadBenchmark():
+    """Reports the latency and the throughput of the closed form transform."""
+    K, M1, N = 10, 1000, 10000
+    transform = ClosedFormTransform(U=(np.random.normal(size=(K, M1)),),
+                                    tau=1., mu=np.zeros(K),
+                                    tauPrior=np.ones(K), nonNegative=True)
+    X = np.random.normal(size=(N, M1))
+    with TransformService(transform.transform, maxBatchSize=256,
+                          maxLatency=0.002) as service:
+        stats = loadBenchmark(service, X, nClients=32, nRequests=5000)
+    print(f"p50 {1e3*stats['p50']:.2f}ms, p99 {1e3*stats['p99']:.2f}ms, "
+          f"throughput {stats['throughput']:.0f} rows/s, "
+          f"{stats['meanBatchRows']:.1f} rows per batch")
+    assert(stats["p99"] < 1.)
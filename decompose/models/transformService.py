@@ -0,0 +1,190 @@
+from typing import Callable, Dict, List
+import asyncio
+import collections
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+import numpy as np
+from numpy import ndarray
+
+
+class Request(object):
+    """Rows of new data waiting to be transformed."""
+    def __init__(self, X: ndarray) -> None:
+        self.X = X
+        self.future = Future()  # type: Future
+        self.t0 = time.perf_counter()
+
+
+class TransformService(object):
+    """Transforms new data of concurrent callers in micro-batches.
+
+    The service keeps the transform of a fitted model resident and runs
+    it in a worker thread. Requests that arrive within `maxLatency`
+    seconds after the first request of a batch are concatenated along
+    the first axis and transformed at once, unless the batch already
+    has `maxBatchSize` rows. `transform` blocks the calling thread,
+    `transformAsync` can be awaited in an event loop. All methods are
+    thread-safe. After `close` no further requests are accepted.
+
+    Arguments:
+        transform: `Callable` that maps data of shape `(N, ...)` to
+            filters of shape `(K, N)`, e.g. `ClosedFormTransform.transform`.
+        maxBatchSize: `int`, number of rows at which a batch is closed.
+        maxLatency: `float`, seconds a request waits for other requests.
+        nLatencies: `int`, number of recent latencies kept for `stats`.
+    """
+    def __init__(self, transform: Callable[[ndarray], ndarray],
+                 maxBatchSize: int = 1024, maxLatency: float = 0.002,
+                 nLatencies: int = 10000) -> None:
+        self.__transform = transform
+        self.__maxBatchSize = maxBatchSize
+        self.__maxLatency = maxLatency
+        self.__queue = queue.Queue()  # type: queue.Queue
+        self.__lock = threading.Lock()
+        self.__closed = False
+        self.__latencies = collections.deque(maxlen=nLatencies)
+        self.__nRows = 0
+        self.__nBatches = 0
+        self.__tStart = time.perf_counter()
+        self.__worker = threading.Thread(target=self.__run, daemon=True)
+        self.__worker.start()
+
+    @classmethod
+    def fromModel(cls, model, **kwargs) -> "TransformService":
+        """Serves the closed form transform of a fitted `DECOMPOSE` model."""
+        return(cls(model.closedFormTransform.transform, **kwargs))
+
+    def submit(self, X: ndarray) -> Future:
+        """Queues the rows `X` and returns the future of their filters.
+
+        Raises:
+            RuntimeError: if the service is closed.
+        """
+        request = Request(np.asarray(X))
+        with self.__lock:
+            if self.__closed:
+                raise RuntimeError("the transform service is closed")
+            self.__queue.put(request)
+        return(request.future)
+
+    def transform(self, X: ndarray) -> ndarray:
+        """Filters of shape `(K, N)` of the rows `X`."""
+        return(self.submit(X).result())
+
+    async def transformAsync(self, X: ndarray) -> ndarray:
+        """Same as `transform` but awaitable."""
+        return(await asyncio.wrap_future(self.submit(X)))
+
+    def close(self) -> None:
+        """Transforms the pending requests and stops the worker.
+
+        Further calls do nothing.
+        """
+        with self.__lock:
+            if self.__closed:
+                return
+            self.__closed = True
+            self.__queue.put(None)
+        self.__worker.join()
+
+    def __enter__(self) -> "TransformService":
+        return(self)
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __run(self) -> None:
+        stop = False
+        while not stop:
+            request = self.__queue.get()
+            if request is None:
+                break
+            batch = [request]
+            nRows = len(request.X)
+            deadline = request.t0 + self.__maxLatency
+            while nRows < self.__maxBatchSize:
+                timeout = deadline - time.perf_counter()
+                try:
+                    if timeout > 0.:
+                        request = self.__queue.get(timeout=timeout)
+                    else:
+                        request = self.__queue.get_nowait()
+                except queue.Empty:
+                    break
+                if request is None:
+                    stop = True
+                    break
+                batch.append(request)
+                nRows += len(request.X)
+            self.__process(batch)
+
+    def __process(self, batch: List[Request]) -> None:
+        try:
+            X = np.concatenate([request.X for request in batch], axis=0)
+            U0 = self.__transform(X)
+        except Exception as e:
+            for request in batch:
+                request.future.set_exception(e)
+            return
+        start = 0
+        t = time.perf_counter()
+        latencies = []
+        for request in batch:
+            stop = start + len(request.X)
+            request.future.set_result(U0[:, start:stop])
+            latencies.append(t - request.t0)
+            start = stop
+        with self.__lock:
+            self.__latencies.extend(latencies)
+            self.__nRows += start
+            self.__nBatches += 1
+
+    def stats(self) -> Dict[str, float]:
+        """Latency percentiles in seconds and throughput in rows per second.
+
+        The throughput is averaged since the service or the last call of
+        `resetStats` was started.
+        """
+        with self.__lock:
+            latencies = np.array(self.__latencies)
+            nRows, nBatches = self.__nRows, self.__nBatches
+            duration = time.perf_counter() - self.__tStart
+        if len(latencies) == 0:
+            latencies = np.array([np.nan])
+        stats = {"p50": float(np.percentile(latencies, 50)),
+                 "p99": float(np.percentile(latencies, 99)),
+                 "throughput": nRows/duration,
+                 "meanBatchRows": nRows/max(nBatches, 1)}
+        return(stats)
+
+    def resetStats(self) -> None:
+        with self.__lock:
+            self.__latencies.clear()
+            self.__nRows = 0
+            self.__nBatches = 0
+            self.__tStart = time.perf_counter()
+
+
+def loadBenchmark(service: TransformService, X: ndarray,
+                  nClients: int = 16, nRequests: int = 1000,
+                  rowsPerRequest: int = 1) -> Dict[str, float]:
+    """Sends requests of `nClients` concurrent callers to `service`.
+
+    Each request contains `rowsPerRequest` random rows of `X`.
+
+    Returns:
+        `Dict` of the latency percentiles and the throughput as reported
+        by `TransformService.stats`.
+    """
+    def client(seed: int) -> None:
+        randomState = np.random.RandomState(seed)
+        for i in range(nRequests//nClients):
+            rows = randomState.randint(len(X), size=rowsPerRequest)
+            service.transform(X[rows])
+
+    service.resetStats()
+    with ThreadPoolExecutor(nClients) as executor:
+        list(executor.map(client, range(nClients)))
+    return(service.stats())
@@ -0,0 +1,59 @@
+from contextlib import contextmanager
+from enum import Enum
+from typing import Iterator, List
+import weakref
+import tensorflow as tf
+from tensorflow import Tensor
+
+
+class Numerics(Enum):
+    """Policy for the numerical checks in the graph of a model."""
+    CHECKED = 1
+    """Indicates that intermediate results are validated with `tf.Assert`
+    ops and that invalid updates of a component are skipped with a
+    `tf.cond`."""
+
+    FAST = 2
+    """Indicates that no `tf.Assert` ops are created and that invalid
+    updates of a component are discarded by branch-free masking."""
+
+
+CHECKED = Numerics.CHECKED
+FAST = Numerics.FAST
+
+
+__policies = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary
+
+
+def getNumerics() -> Numerics:
+    """The policy of the default graph, `CHECKED` unless set otherwise."""
+    return(__policies.get(tf.get_default_graph(), CHECKED))
+
+
+@contextmanager
+def numericsPolicy(policy: Numerics) -> Iterator[None]:
+    """Sets the policy of the default graph while the context is active.
+
+    Arguments:
+        policy: `Numerics` used for the ops created within the context.
+    """
+    graph = tf.get_default_graph()
+    previousPolicy = getNumerics()
+    __policies[graph] = policy
+    try:
+        yield
+    finally:
+        __policies[graph] = previousPolicy
+
+
+def assertAll(condition: Tensor, data: List[Tensor],
+              name: str) -> List[tf.Operation]:
+    """Asserts that all elements of `condition` are true.
+
+    Returns:
+        `List` with the `tf.Assert` op, which is empty for the `FAST`
+        policy, to be used as control dependencies.
+    """
+    if getNumerics() == FAST:
+        return([])
+    return([tf.Assert(tf.reduce_all(condition), data, name=name)])
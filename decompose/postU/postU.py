@@ -5,16 +5,37 @@ from copy import copy
 
 from decompose.distributions.distribution import Distribution
 from decompose.likelihoods.likelihood import Likelihood
+from decompose.numerics import getNumerics, FAST
 
 
 class PostU(object):
+    """Posterior of the `f`-th filter bank.
+
+    The components are updated one after the other if `blockSize` is 1.
+    Otherwise blocks of `blockSize` components are updated jointly where
+    each component in a block is conditioned on the state of all other
+    components before the update of the block. For components whose
+    filters are orthogonal to each other in the other factors the
+    blocked update equals the sequential update.
+
+    Components whose update is not finite or zero keep their previous
+    filters. This is decided by a `tf.cond` per component unless the
+    numerics policy is `FAST` (see `decompose.numerics`).
+
+    Arguments:
+        likelihood: `Likelihood` of the data.
+        prior: `Distribution` of the filters.
+        f: `int`, number of the factor.
+        blockSize: `int`, number of components updated jointly.
+    """
 
     def __init__(self, likelihood: Likelihood, prior: Distribution,
-                 f: int) -> None:
+                 f: int, blockSize: int = 1) -> None:
         self.__likelihood = likelihood
         self.__prior = prior
         self.__f = f
         self.__K = likelihood.K
+        self.__blockSize = blockSize
 
     def f(self) -> int:
         return(self.__f)
@@ -23,8 +44,14 @@ class PostU(object):
     def prior(self):
         return(self.__prior)
 
+    @property
+    def blockSize(self) -> int:
+        return(self.__blockSize)
+
     def updateUf(self, Uf, Ufk, k):
-        UfUpdated = tf.concat((Uf[:k], Ufk, Uf[k+1:]), 0)
+        """Replaces the filters `k` of `Uf` by the rows of `Ufk`."""
+        K = self.__K
+        UfUpdated = tf.dynamic_stitch([tf.range(K), k], [Uf, Ufk])
         return(UfUpdated)
 
     def update(self, U: List[Tensor], X: Tensor,
@@ -42,6 +69,12 @@ class PostU(object):
         prepVars = self.__likelihood.prepVars(f=f, U=U, X=X)
 
         # update the filters of the f-th factor
+        if self.blockSize > 1:
+            for start in range(0, K, self.blockSize):
+                stop = min(start + self.blockSize, K)
+                U = self.updateBlock(start, stop, prepVars, U)
+            return(U[f])
+
         def cond(k, U):
             return(tf.less(k, K))
 
@@ -54,6 +87,30 @@ class PostU(object):
         _, U = tf.while_loop(cond, body, loop_vars)
         return(U[f])
 
+    def updateBlock(self, start, stop, prepVars, U):
+        f = self.__f
+        UfShape = U[f].get_shape()
+
+        lhUfBlock = self.__likelihood.lhUfBlock(U[f], prepVars, f,
+                                                start, stop)
+        postfBlock = lhUfBlock*self.prior[start:stop].cond()
+        UfBlock = tf.transpose(postfBlock.draw())
+
+        # keep the previous filters of components with invalid updates
+        normUfBlock = tf.norm(UfBlock, axis=-1)
+        notNanNorm = tf.logical_not(tf.is_nan(normUfBlock))
+        finiteNorm = tf.is_finite(normUfBlock)
+        positiveNorm = normUfBlock > 0.
+        isValid = tf.logical_and(notNanNorm,
+                                 tf.logical_and(finiteNorm,
+                                                positiveNorm))
+        UfBlock = tf.where(isValid, UfBlock, U[f][start:stop])
+
+        Uf = self.updateUf(U[f], UfBlock, tf.range(start, stop))
+        Uf.set_shape(UfShape)
+        U[f] = Uf
+        return(U)
+
     def updateK(self, k, prepVars, U):
         f = self.__f
         UfShape = U[f].get_shape()
@@ -70,8 +127,14 @@ class PostU(object):
         isValid = tf.logical_and(notNanNorm,
                                  tf.logical_and(finiteNorm,
                                                 positiveNorm))
-        Uf = tf.cond(isValid, lambda: self.updateUf(U[f], Ufk, k),
-                     lambda: U[f])
+        if getNumerics() == FAST:
+            # keep the previous filter without branching on the host
+            Ufk = tf.where(isValid, Ufk, U[f][k][None])
+            Uf = self.updateUf(U[f], Ufk, k[None])
+        else:
+            Uf = tf.cond(isValid,
+                         lambda: self.updateUf(U[f], Ufk, k[None]),
+                         lambda: U[f])
 
         # TODO: if valid -> self.__likelihood.lhU()[f].updateUfk(U[f][k], k)
         Uf.set_shape(UfShape)
@@ -1,4 +1,5 @@
 from unittest.mock import MagicMock
+import time
 import pytest
 import numpy as np
 import scipy as sp
@@ -8,8 +9,11 @@ import tensorflow as tf
 from decompose.likelihoods.normal2dLikelihood import Normal2dLikelihood
 from decompose.tests.fixtures import device, dtype
 from decompose.distributions.distribution import UpdateType, Properties
+from decompose.distributions.distribution import DrawType
 from decompose.distributions.uniform import Uniform
+from decompose.distributions.cenNnFullyElasticNet import CenNnFullyElasticNet
 from decompose.postU.postU import PostU
+from decompose.numerics import FAST, numericsPolicy
 
 
 @pytest.fixture(scope="module",
@@ -59,3 +63,152 @@ def test_update(device, f, dtype):
     assert(not np.allclose(npU[f], npUfupdated))
 
     tf.reset_default_graph()
+
+
+def test_updateBlock(device, f, dtype):
+    """The blocked update equals the sequential update for orthogonal filters.
+    """
+    npdtype = dtype.as_numpy_dtype
+    M, K, tau = (20, 30), 4, 0.1
+    npU = [np.random.normal(size=(K, M[0])).astype(npdtype),
+           np.random.normal(size=(K, M[1])).astype(npdtype)]
+    npU[1-f] = np.linalg.qr(npU[1-f].T)[0].T.astype(npdtype)
+    U = [tf.constant(npU[0]), tf.constant(npU[1])]
+    npnoise = np.random.normal(size=M).astype(npdtype)
+    npdata = np.dot(npU[0].T, npU[1]) + npnoise
+    data = tf.constant(npdata, dtype=dtype)
+
+    lh = Normal2dLikelihood(M=M, K=K, tau=tau, dtype=dtype,
+                            drawType=DrawType.MODE)
+    lh.init(data=data)
+
+    properties = Properties(persistent=True,
+                            dtype=dtype)
+    prior = Uniform(dummy=tf.constant(np.random.random(K).astype(npdtype),
+                                      dtype=dtype),
+                    properties=properties)
+
+    Ufsequential = PostU(lh, prior, f).update(U, data, transform=False)
+    Ufblocked = PostU(lh, prior, f, blockSize=2).update(U, data,
+                                                        transform=False)
+
+    with tf.Session() as sess:
+        sess.run(tf.global_variables_initializer())
+        npUfsequential, npUfblocked = sess.run([Ufsequential, Ufblocked])
+
+    assert(np.allclose(npUfsequential, npUfblocked, atol=1e-4, rtol=1e-4))
+
+    tf.reset_default_graph()
+
+
+def test_update_fastNumerics(device, f, dtype):
+    """The update without checks equals the checked update."""
+    npdtype = dtype.as_numpy_dtype
+    M, K, tau = (20, 30), 3, 0.1
+    npU = (np.random.normal(size=(K, M[0])).astype(npdtype),
+           np.random.normal(size=(K, M[1])).astype(npdtype))
+    U = [tf.constant(npU[0]), tf.constant(npU[1])]
+    npnoise = np.random.normal(size=M).astype(npdtype)
+    npdata = np.dot(npU[0].T, npU[1]) + npnoise
+    data = tf.constant(npdata, dtype=dtype)
+
+    lh = Normal2dLikelihood(M=M, K=K, tau=tau, dtype=dtype,
+                            drawType=DrawType.MODE)
+    lh.init(data=data)
+
+    properties = Properties(persistent=True,
+                            dtype=dtype)
+    prior = Uniform(dummy=tf.constant(np.random.random(K).astype(npdtype),
+                                      dtype=dtype),
+                    properties=properties)
+
+    Ufchecked = PostU(lh, prior, f).update(U, data, transform=False)
+    with numericsPolicy(FAST):
+        Uffast = PostU(lh, prior, f).update(U, data, transform=False)
+
+    with tf.Session() as sess:
+        sess.run(tf.global_variables_initializer())
+        npUfchecked, npUffast = sess.run([Ufchecked, Uffast])
+
+    assert(np.allclose(npUfchecked, npUffast))
+
+    tf.reset_default_graph()
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("K", [10, 50, 200])
+def test_updateBlock_benchmark(K):
+    """Reports the speedup of the blocked over the sequential update."""
+    M, tau, f, dtype, nRuns = (2000, 1000), 0.1, 0, tf.float32, 10
+    npdtype = dtype.as_numpy_dtype
+    npU = (np.random.normal(size=(K, M[0])).astype(npdtype),
+           np.random.normal(size=(K, M[1])).astype(npdtype))
+    U = [tf.constant(npU[0]), tf.constant(npU[1])]
+    data = tf.constant(np.random.normal(size=M).astype(npdtype))
+
+    lh = Normal2dLikelihood(M=M, K=K, tau=tau, dtype=dtype)
+    lh.init(data=data)
+    properties = Properties(persistent=True,
+                            dtype=dtype)
+    prior = Uniform(dummy=tf.constant(np.random.random(K).astype(npdtype),
+                                      dtype=dtype),
+                    properties=properties)
+
+    durations = {}
+    with tf.Session() as sess:
+        for blockSize in [1, 5, 10]:
+            Uf = PostU(lh, prior, f, blockSize=blockSize).update(
+                U, data, transform=False)
+            sess.run(tf.global_variables_initializer())
+            sess.run(Uf)
+            start = time.time()
+            for i in range(nRuns):
+                sess.run(Uf)
+            durations[blockSize] = (time.time() - start)/nRuns
+
+    for blockSize, duration in durations.items():
+        print(f"K={K} blockSize={blockSize}: {duration*1000:.1f}ms, "
+              f"speedup {durations[1]/duration:.2f}")
+
+    tf.reset_default_graph()
+
+
+@pytest.mark.slow
+def test_update_cenNnFullyElasticNet_benchmark():
+    """Reports the time of an update and of the llh of the prior."""
+    M, K, tau, f, dtype, nRuns = (2000, 1000), 30, 0.1, 0, tf.float32, 10
+    npdtype = dtype.as_numpy_dtype
+    npU = (np.random.normal(size=(K, M[0])).astype(npdtype),
+           np.random.normal(size=(K, M[1])).astype(npdtype))
+    U = [tf.constant(npU[0]), tf.constant(npU[1])]
+    data = tf.constant(np.random.normal(size=M).astype(npdtype))
+
+    lh = Normal2dLikelihood(M=M, K=K, tau=tau, dtype=dtype)
+    lh.init(data=data)
+    properties = Properties(persistent=True,
+                            dtype=dtype)
+    ones = np.ones(K, dtype=npdtype)
+    prior = CenNnFullyElasticNet(
+        b=tf.constant((np.arange(K) % 3).astype(npdtype)),
+        mu=tf.constant(ones), tau=tf.constant(ones),
+        betaExponential=tf.constant(ones), alpha=tf.constant(ones),
+        beta=tf.constant(ones),
+        tauLomax=tf.constant(np.ones((M[f], K), dtype=npdtype)),
+        properties=properties)
+
+    Uf = PostU(lh, prior, f).update(U, data, transform=False)
+    llh = tf.reduce_sum(prior.llh(tf.transpose(tf.abs(U[f]))))
+    durations = {}
+    with tf.Session() as sess:
+        sess.run(tf.global_variables_initializer())
+        for name, op in [("update", Uf), ("llh", llh)]:
+            sess.run(op)
+            start = time.time()
+            for i in range(nRuns):
+                sess.run(op)
+            durations[name] = (time.time() - start)/nRuns
+
+    for name, duration in durations.items():
+        print(f"CenNnFullyElasticNet {name}: {duration*1000:.1f}ms")
+
+    tf.reset_default_graph()
@@ -1,11 +1,15 @@
-from typing import Tuple, List, Dict
+from typing import Tuple, Dict, Union, List
 import numpy as np
-import string
+import scipy as sp
+import scipy.sparse
 import tensorflow as tf
 from tensorflow.python import pywrap_tensorflow
 
 from decompose.models.tensorFactorisation import TensorFactorisation
 from decompose.models.tensorFactorisation import NoiseUniformity
+from decompose.models.numpyTensorFactorisation import NumpyTensorFactorisation
+from decompose.models.resultHook import ResultHook
+from decompose.models.closedFormTransform import ClosedFormTransform
 from decompose.distributions.cenNormal import CenNormal
 from decompose.stopCriterions.stopCriterion import StopHook
 from decompose.stopCriterions.llhImprovementThreshold import LlhImprovementThreshold
@@ -13,13 +17,48 @@ from decompose.stopCriterions.llhStall import LlhStall
 from decompose.stopCriterions.stopCriterion import StopCriterion
 from decompose.distributions.distribution import Distribution
 from decompose.cv.cv import CV
+from decompose.data.rowBlocks import RowBlocks
+from decompose.data.residentData import ResidentData
+from decompose.numerics import Numerics, CHECKED
 
 
 HOMOGENEOUS = NoiseUniformity.HOMOGENEOUS
 
 
 class DECOMPOSE(object):
-    """An interface to DECMPOSE similar to sklearn.decompose."""
+    """An interface to DECMPOSE similar to sklearn.decompose.
+
+    The results of the training are fetched from the training session.
+    Checkpoints are written as configured by `checkpoints` which is
+    either `"off"`, `"final"` or the number of steps between checkpoints.
+    The iterative `transform` and `parameters` require checkpoints, the
+    closed form `transform` does not. Summaries for
+    tensorboard are written every `summarySteps` steps or not at all if
+    `summarySteps` is `None`.
+
+    If `residentData` is `True` a matrix or tensor that is trained on as
+    a whole is loaded once into the graph and its missing values are
+    replaced once instead of in every step (see `ResidentData`).
+
+    The model is trained with tensorflow unless `backend` is `"numpy"`.
+    The numpy backend supports fully observed matrices with homogeneous
+    noise and the priors `Normal`, `CenNormal` and `NnNormal`. It does
+    not build a graph nor write checkpoints which makes it considerably
+    faster on small and medium sized data.
+
+    The `numerics` policy `CHECKED` validates intermediate results with
+    `tf.Assert` ops, `FAST` omits these checks and discards invalid
+    updates of components without branching (see `decompose.numerics`).
+
+    With `iterationsPerRun` larger than 1 up to that many iterations are
+    performed in the graph per run of the training session, which saves
+    the overhead of the runs on small and medium sized data. The
+    iterations then also count as steps for `maxIterations`, which is
+    however only checked between the runs such that up to
+    `iterationsPerRun - 1` iterations more than `maxIterations` are
+    performed unless it is a multiple of `iterationsPerRun`. This is
+    not supported for minibatches and data streamed in blocks.
+    """
 
     def __init__(self, modelDirectory: str,
                  priors: Tuple[Distribution, ...] = (CenNormal(), CenNormal()),
@@ -32,7 +71,15 @@ class DECOMPOSE(object):
                  stopCriterionInit: StopCriterion = LlhStall(100),
                  stopCriterionEM: StopCriterion = LlhStall(100),
                  stopCriterionBCD: StopCriterion = LlhImprovementThreshold(.1),
-                 device: str = "/cpu:0") -> None:
+                 device: str = "/cpu:0",
+                 batchSize: int = None,
+                 componentBlockSize: int = 1,
+                 backend: str = "tensorflow",
+                 checkpoints: Union[str, int] = "final",
+                 summarySteps: int = 1,
+                 residentData: bool = True,
+                 numerics: Numerics = CHECKED,
+                 iterationsPerRun: int = 1) -> None:
         self.__isFullyObserved = isFullyObserved
         self.__maxIterations = maxIterations
         self.__n_components = n_components
@@ -45,24 +92,75 @@ class DECOMPOSE(object):
         self.__stopCriterionInit = stopCriterionInit
         self.__stopCriterionEM = stopCriterionEM
         self.__stopCriterionBCD = stopCriterionBCD
+        self.__batchSize = batchSize
+        self.__componentBlockSize = componentBlockSize
+        self.__backend = backend
+        self.__checkpoints = checkpoints
+        self.__summarySteps = summarySteps
+        self.__residentData = residentData
+        self.__numerics = numerics
+        self.__iterationsPerRun = iterationsPerRun
+        self.__parameters = None  # type: Dict[str, np.ndarray]
+        self.__closedFormTransform = None  # type: ClosedFormTransform
+        self.__results = {}  # type: Dict[str, np.ndarray]
+        self.__maskShape = None  # type: Tuple[int, ...]
+        self.__observedMask = None  # type: np.ndarray
+        if backend == "numpy":
+            if (cv is not None or not isFullyObserved
+                    or noiseUniformity != HOMOGENEOUS
+                    or batchSize is not None):
+                raise NotImplementedError("the numpy backend only supports "
+                                          "fully observed data with "
+                                          "homogeneous noise")
+            self.__tefa = NumpyTensorFactorisation(
+                priors=priors, K=n_components, dtype=dtype,
+                stopCriterionInit=stopCriterionInit,
+                stopCriterionEM=stopCriterionEM,
+                stopCriterionBCD=stopCriterionBCD,
+                maxIterations=maxIterations)
+        elif backend != "tensorflow":
+            raise ValueError(f"unknown backend {backend}")
+        elif batchSize is None:
+            self.__tefa = self.__getEstimator()
+
+    def __getEstimator(self, nRows: int = None,
+                       incremental: bool = False,
+                       sparseShape: Tuple[int, ...] = None
+                       ) -> tf.estimator.Estimator:
         tefa = TensorFactorisation.getEstimator(
-            priors=priors,
+            priors=self.__priors,
             K=self.n_components,
-            isFullyObserved=isFullyObserved,
-            dtype=tf.as_dtype(dtype),
-            path=modelDirectory,
-            noiseUniformity=noiseUniformity,
-            cv=cv,
-            stopCriterionInit=stopCriterionInit,
-            stopCriterionEM=stopCriterionEM,
-            stopCriterionBCD=stopCriterionBCD,
-            device=self.__device)
-        self.__tefa = tefa
+            isFullyObserved=self.__isFullyObserved,
+            dtype=tf.as_dtype(self.__dtype),
+            path=self.__modelDirectory,
+            noiseUniformity=self.__noiseUniformity,
+            cv=self.__cv,
+            stopCriterionInit=self.__stopCriterionInit,
+            stopCriterionEM=self.__stopCriterionEM,
+            stopCriterionBCD=self.__stopCriterionBCD,
+            device=self.__device,
+            nRows=nRows,
+            incremental=incremental,
+            componentBlockSize=self.__componentBlockSize,
+            checkpoints=self.__checkpoints,
+            summarySteps=self.__summarySteps,
+            sparseShape=sparseShape,
+            numerics=self.__numerics,
+            iterationsPerRun=self.__iterationsPerRun)
+        return(tefa)
 
     @property
     def noiseUniformity(self) -> bool:
         return(self.__noiseUniformity)
 
+    @property
+    def backend(self) -> str:
+        return(self.__backend)
+
+    @property
+    def batchSize(self) -> int:
+        return(self.__batchSize)
+
     @property
     def cv(self) -> CV:
         return(self.__cv)
@@ -85,90 +183,285 @@ class DECOMPOSE(object):
 
     @property
     def trainMask(self) -> np.ndarray:
-        return(self.__trainMask)
+        """Mask of the training entries, generated when it is requested.
+
+        The mask is `None` for streamed and sparse data.
+        """
+        observedMask = self.observedMask
+        if observedMask is None or self.cv is None:
+            return(observedMask)
+        foldMask = self.cv.npMask(self.__maskShape)
+        return(np.logical_and(observedMask, np.logical_not(foldMask)))
 
     @property
     def testMask(self) -> np.ndarray:
-        return(self.__testMask)
+        """Mask of the entries not used for training, see `trainMask`."""
+        trainMask = self.trainMask
+        if trainMask is None:
+            return(None)
+        return(np.logical_not(trainMask))
 
     @property
     def observedMask(self) -> np.ndarray:
+        """Mask of the observed entries, see `trainMask`."""
+        if self.__maskShape is None:
+            return(None)
+        if self.__observedMask is None:
+            return(np.ones(self.__maskShape, dtype=bool))
         return(self.__observedMask)
 
-    def __calc_variance_ratio(self, data, U):
-        varData = np.var(data)
+    @property
+    def parameters(self) -> Dict[str, np.ndarray]:
+        """All variables of the model.
+
+        The variables are read from the final checkpoint when they are
+        accessed for the first time.
+        """
+        if self.__parameters is None:
+            ckptFile = self.__tefa.latest_checkpoint()
+            if ckptFile is None:
+                raise ValueError("parameters require checkpoints")
+            ckptReader = pywrap_tensorflow.NewCheckpointReader(ckptFile)
+            variables = tf.contrib.framework.list_variables(ckptFile)
+            parameters = {}  # type: Dict[str, np.ndarray]
+            for variableName, _ in variables:
+                parameters[variableName] = ckptReader.get_tensor(variableName)
+            self.__parameters = parameters
+        return(self.__parameters)
+
+    def __calc_variance_ratio(self, varData, U):
+        # the variance of the rank one reconstruction of each component
+        # is calculated from the moments of its filters
         evr = np.zeros(self.n_components)
-        F = len(U)
-        axisIds = string.ascii_lowercase[:F]
-        subscripts = f'k{",k".join(axisIds)}->{axisIds}'
         for k in range(self.n_components):
-            Uks = []
+            mean, meanSquare = 1., 1.
             for Uf in U:
-                Uks.append(Uf[k][None, ...])
-            recons = np.einsum(subscripts, *Uks)
-            evr[k] = np.var(recons)/varData
+                mean = mean*np.mean(Uf[k])
+                meanSquare = meanSquare*np.mean(Uf[k]**2)
+            evr[k] = (meanSquare - mean**2)/varData
         return(evr)
 
-    def fit(self, X: np.ndarray) -> "DECOMPOSE":
+    def fit(self, X: Union[np.ndarray, RowBlocks,
+                           sp.sparse.spmatrix]) -> "DECOMPOSE":
+        """Fits the model to the data `X`.
+
+        Data that does not reside in memory (a `np.memmap` or an HDF5
+        dataset) or a `RowBlocks` data source is streamed in blocks of
+        rows. The statistics of the full data are then accumulated
+        block by block.
+
+        For a sparse matrix only its stored entries are considered to be
+        observed, all other entries are treated as missing values. Every
+        row and every column must contain at least one stored entry.
+
+        Arguments:
+            X: `ndarray`, `np.memmap`, `h5py.Dataset`, `RowBlocks` or
+                `scipy.sparse.spmatrix`.
+
+        Returns:
+            The fitted model.
+        """
+        if sp.sparse.issparse(X):
+            return(self.__fitSparse(X))
+        if isinstance(X, np.memmap) or not isinstance(X, (np.ndarray,
+                                                          RowBlocks)):
+            blockSize = self.batchSize
+            if blockSize is None:
+                blockSize = min(X.shape[0], 1000)
+            X = RowBlocks(X, blockSize=blockSize, dtype=self.__dtype)
+        if isinstance(X, RowBlocks):
+            return(self.__fitRowBlocks(X))
+        if self.backend == "numpy":
+            return(self.__fitNumpy(X))
+
         # create input_fn
-        x = {"train": X.astype(self.__dtype)}
-        input_fn = tf.estimator.inputs.numpy_input_fn(
-            x, y=None, batch_size=X.shape[0],
-            shuffle=False, num_epochs=None, )
+        x = {"train": X.astype(self.__dtype, copy=False)}
+        hooks = []  # type: List[tf.train.SessionRunHook]
+        if self.batchSize is None and self.__residentData:
+            data = ResidentData(x["train"], dtype=self.__dtype,
+                                isFullyObserved=self.__isFullyObserved)
+            input_fn = data.input_fn
+            hooks.append(data.hook)
+        elif self.batchSize is None:
+            input_fn = tf.estimator.inputs.numpy_input_fn(
+                x, y=None, batch_size=X.shape[0],
+                shuffle=False, num_epochs=None, )
+        else:
+            # serve shuffled minibatches of rows along with their indices
+            x["rows"] = np.arange(X.shape[0])
+            input_fn = tf.estimator.inputs.numpy_input_fn(
+                x, y=None, batch_size=self.batchSize,
+                shuffle=True, num_epochs=None)
+            self.__tefa = self.__getEstimator(nRows=X.shape[0])
 
         # train the model
-        self.__tefa.train(input_fn=input_fn,
-                          steps=self.__maxIterations,
-                          hooks=[StopHook()])
+        results = self.__train(input_fn=input_fn, F=len(X.shape),
+                               hooks=hooks)
 
         # store result
-        ckptFile = self.__tefa.latest_checkpoint()
-        ckptReader = pywrap_tensorflow.NewCheckpointReader(ckptFile)
-        UsList = []  # type: List[tf.Tensor]
-        F = len(X.shape)
-        for f in range(F):
-            Uf = ckptReader.get_tensor(f"U/{f}")
-            UsList.append(Uf)
-        Us = tuple(UsList)
-        self.__variance_ratio = self.__calc_variance_ratio(X, Us)
-        self.__components_ = Us[1:]
+        Us = self.__storeResults(results, F=len(X.shape))
+        self.__variance_ratio = self.__calc_variance_ratio(np.var(X), Us)
 
-        # store the masks
+        # only the missing values are stored, the other masks are
+        # generated when they are requested
+        self.__maskShape = X.shape
         if not self.__isFullyObserved:
             self.__observedMask = np.logical_not(np.isnan(X))
         else:
-            self.__observedMask = np.ones_like(X)
+            self.__observedMask = None
 
-        if self.cv is not None:
-            trainMask = ckptReader.get_tensor("trainMask")
-            self.__trainMask = np.logical_and(self.__observedMask,
-                                              trainMask)
-        else:
-            self.__trainMask = self.__observedMask
+        return(self)
 
-        self.__testMask = np.logical_not(self.__trainMask)
+    def __train(self, input_fn, F: int,
+                hooks: List[tf.train.SessionRunHook] = None
+                ) -> Dict[str, np.ndarray]:
+        """Trains the model and fetches the results from the session."""
+        names = [f"U/{f}" for f in range(F)] + ["llh/llh", "loss/loss"]
+        # the parameters of the closed form transform are fetched as well
+        # such that it does not require checkpoints
+        if self.__supportsClosedForm:
+            names = names + [name for name in ClosedFormTransform
+                             .parameterNames(self.__priors[0], F)
+                             if name not in names]
+        resultHook = ResultHook(names)
+        self.__tefa.train(input_fn=input_fn,
+                          steps=self.__maxIterations,
+                          hooks=[StopHook(), resultHook, *(hooks or [])])
+        return(resultHook.results)
+
+    def __storeResults(self, results: Dict[str, np.ndarray],
+                       F: int) -> Tuple[np.ndarray, ...]:
+        Us = tuple([results[f"U/{f}"] for f in range(F)])
+        self.__U0 = Us[0]
+        self.__components_ = Us[1:]
+        self.__parameters = None
+        self.__closedFormTransform = None
+        self.__results = results
+        self.llh = results["llh/llh"]
+        self.loss = results["loss/loss"]
+        return(Us)
+
+    def __fitNumpy(self, X: np.ndarray) -> "DECOMPOSE":
+        tefa = self.__tefa.fit(X)
+        Us = self.__storeResults(tefa.parameters, F=len(X.shape))
+        self.__parameters = tefa.parameters
+        self.__variance_ratio = self.__calc_variance_ratio(np.var(X), Us)
+        self.__maskShape = X.shape
+        self.__observedMask = None
+        return(self)
+
+    def __fitRowBlocks(self, X: RowBlocks) -> "DECOMPOSE":
+        if (not self.__isFullyObserved or self.cv is not None
+                or self.backend == "numpy"):
+            raise NotImplementedError("data streamed in blocks must be "
+                                      "fully observed and without cv")
+
+        # train the model
+        self.__tefa = self.__getEstimator(nRows=X.shape[0], incremental=True)
+        results = self.__train(input_fn=X.input_fn, F=len(X.shape))
+
+        # store result
+        Us = self.__storeResults(results, F=len(X.shape))
+        self.__variance_ratio = self.__calc_variance_ratio(X.var(), Us)
+
+        # the masks are not available for streamed data
+        self.__maskShape = None
+        self.__observedMask = None
+
+        return(self)
+
+    def __fitSparse(self, X: sp.sparse.spmatrix) -> "DECOMPOSE":
+        if (len(X.shape) != 2 or self.cv is not None
+                or self.backend == "numpy" or self.batchSize is not None
+                or self.noiseUniformity != HOMOGENEOUS):
+            raise NotImplementedError("sparse data is only supported for "
+                                      "matrices with homogeneous noise and "
+                                      "without cv or minibatches")
+
+        # serve the observed entries in COO format
+        X = sp.sparse.coo_matrix(X)
+        X.sum_duplicates()
+        x = {"indices": np.stack((X.row, X.col), axis=-1).astype(np.int64),
+             "values": X.data.astype(self.__dtype)}
+        input_fn = tf.estimator.inputs.numpy_input_fn(
+            x, y=None, batch_size=X.nnz, shuffle=False, num_epochs=None)
+
+        # train the model
+        self.__tefa = self.__getEstimator(sparseShape=X.shape)
+        results = self.__train(input_fn=input_fn, F=2)
 
-        # store all parameters of the model
-        variables = tf.contrib.framework.list_variables(ckptFile)
-        self.parameters = {}  # type: Dict[str, np.ndarray]
-        for variableName, _ in variables:
-            self.parameters[variableName] = ckptReader.get_tensor(variableName)
+        # store result
+        Us = self.__storeResults(results, F=2)
+        self.__variance_ratio = self.__calc_variance_ratio(np.var(X.data), Us)
 
-        # store the likelihood and loss
-        self.llh = ckptReader.get_tensor("llh/llh")
-        self.loss = ckptReader.get_tensor("loss/loss")
+        # the masks are not available for sparse data
+        self.__maskShape = None
+        self.__observedMask = None
 
         return(self)
 
     def fit_transform(self, X: np.ndarray) -> np.ndarray:
         self.fit(X)
-        ckptFile = self.__tefa.latest_checkpoint()
-        ckptReader = pywrap_tensorflow.NewCheckpointReader(ckptFile)
-        U0 = ckptReader.get_tensor("U/0")
-        return(U0)
+        return(self.__U0)
+
+    @property
+    def closedFormTransform(self) -> ClosedFormTransform:
+        """Closed form transform of the fitted model (see `transform`).
+
+        It is created once per fit such that the factorised Hessian is
+        reused for all calls.
+        """
+        if self.__closedFormTransform is None:
+            F = len(self.__components_) + 1
+            names = ClosedFormTransform.parameterNames(self.__priors[0], F)
+            if all(name in self.__results for name in names):
+                parameters = self.__results
+            else:
+                parameters = self.parameters
+            self.__closedFormTransform = ClosedFormTransform.fromParameters(
+                parameters, prior=self.__priors[0], F=F)
+        return(self.__closedFormTransform)
+
+    @property
+    def __supportsClosedForm(self) -> bool:
+        return(self.noiseUniformity == HOMOGENEOUS
+               and ClosedFormTransform.supports(self.__priors[0]))
 
     def transform(self, X: np.ndarray,
-                  transformModelDirectory: str) -> np.ndarray:
+                  transformModelDirectory: str = None,
+                  method: str = "auto") -> np.ndarray:
+        """Estimates the first filter bank for new data `X`.
+
+        The `"closedForm"` method solves for the BCD fixed point of the
+        new filters directly (see `ClosedFormTransform`). It requires
+        homogeneous noise and a normal or uniform prior of the first
+        factor. The `"iterative"` method runs the INIT, EM and BCD phases
+        on the new data. `"auto"` uses the closed form if possible.
+
+        Arguments:
+            X: `ndarray` of shape `(N, M[1], ..., M[F-1])`.
+            transformModelDirectory: `str`, directory of the model of the
+                iterative transform.
+            method: `str`, one of `"auto"`, `"closedForm"` and
+                `"iterative"`.
+
+        Returns:
+            `ndarray` of shape `(K, N)`.
+        """
+        closedForm = self.__supportsClosedForm
+        if method not in ("auto", "closedForm", "iterative"):
+            raise ValueError(f"unknown method {method}")
+        elif method == "closedForm" and not closedForm:
+            raise NotImplementedError("the closed form transform requires "
+                                      "homogeneous noise and a normal or "
+                                      "uniform prior of the first factor")
+        if closedForm and method != "iterative":
+            U0 = self.closedFormTransform.transform(X)
+            return(U0.astype(self.__dtype))
+
+        if self.backend == "numpy":
+            return(self.__tefa.transform(X))
+
         # create input_fn
         x = {"test": X.astype(self.__dtype)}
         input_fn = tf.estimator.inputs.numpy_input_fn(
@@ -176,6 +469,8 @@ class DECOMPOSE(object):
             shuffle=False, num_epochs=None)
 
         ckptFile = self.__tefa.latest_checkpoint()
+        if ckptFile is None:
+            raise ValueError("transform requires checkpoints")
         tefaTransform = TensorFactorisation.getTransformEstimator(
             priors=self.__priors,
             K=self.n_components,
@@ -185,11 +480,15 @@ class DECOMPOSE(object):
             noiseUniformity=self.noiseUniformity,
             stopCriterionInit=self.__stopCriterionInit,
             stopCriterionEM=self.__stopCriterionEM,
-            stopCriterionBCD=self.__stopCriterionBCD)
+            stopCriterionBCD=self.__stopCriterionBCD,
+            componentBlockSize=self.__componentBlockSize,
+            checkpoints="off",
+            summarySteps=self.__summarySteps,
+            numerics=self.__numerics,
+            iterationsPerRun=self.__iterationsPerRun)
+        resultHook = ResultHook(["U/0tr"])
         tefaTransform.train(input_fn=input_fn,
                             steps=self.__maxIterations,
-                            hooks=[StopHook()])
-        ckptFile = tefaTransform.latest_checkpoint()
-        ckptReader = pywrap_tensorflow.NewCheckpointReader(ckptFile)
-        U0 = ckptReader.get_tensor("U/0tr")
+                            hooks=[StopHook(), resultHook])
+        U0 = resultHook.results["U/0tr"]
         return(U0)
@@ -24,13 +24,21 @@ class LlhImprovementThreshold(StopCriterion):
 
     def update(self, model, X: Tensor):
         llh = tf.cast(model.llh(X), tf.float64)
-        llhOld = self.llhVar
+        llhOld = self.llhVar.read_value()
         cond = tf.greater(self.llhImprovementThreshold, llh - llhOld)
         u0 = tf.assign(self.stopVar, cond)
         with tf.control_dependencies([u0]):
             u1 = tf.assign(self.llhVar, llh)
         return([u0, u1])
 
+    def npInit(self) -> None:
+        self.__npLlh = -np.inf
+
+    def npUpdate(self, llh: float) -> bool:
+        stop = self.llhImprovementThreshold > llh - self.__npLlh
+        self.__npLlh = llh
+        return(bool(stop))
+
     @property
     def stopVar(self) -> tf.Variable:
         return(self.__stopVar)
@@ -25,7 +25,7 @@ class LlhStall(StopCriterion):
 
     def update(self, model, X: Tensor):
         llh = tf.cast(model.llh(X), tf.float64)
-        llhsVar = self.llhsVar
+        llhsVar = self.llhsVar.read_value()
         llhsUpdated = tf.concat((llh[None], llhsVar[1:]), axis=0)
         llhsUpdated = tf.manip.roll(llhsUpdated, shift=1, axis=0)
         cond = tf.reduce_all(tf.greater_equal(llhsUpdated[0], llhsUpdated[1:]))
@@ -34,6 +34,15 @@ class LlhStall(StopCriterion):
             u1 = tf.assign(self.llhsVar, llhsUpdated)
         return([u0, u1])
 
+    def npInit(self) -> None:
+        self.__npLlhs = -np.inf*np.ones(self.__nStalledIterationsThrehold)
+
+    def npUpdate(self, llh: float) -> bool:
+        llhs = np.concatenate(([llh], self.__npLlhs[1:]))
+        llhs = np.roll(llhs, shift=1)
+        self.__npLlhs = llhs
+        return(bool(np.all(llhs[0] >= llhs[1:])))
+
     @property
     def stopVar(self) -> tf.Variable:
         return(self.__stopVar)
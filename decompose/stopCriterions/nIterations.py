@@ -21,11 +21,21 @@ class NIterations(StopCriterion):
             self.__stopVar = stopVar
 
     def update(self, model, X: Tensor):
-        u0 = tf.assign(self.iterationNumberVar, self.iterationNumberVar + 1)
-        u1 = tf.assign(self.stopVar, tf.greater_equal(self.iterationNumberVar,
+        iterationNumber = self.iterationNumberVar.read_value()
+        u0 = tf.assign(self.iterationNumberVar, iterationNumber + 1)
+        u1 = tf.assign(self.stopVar, tf.greater_equal(iterationNumber,
                                                       self.__nIterations))
         return([u0, u1])
 
+    def npInit(self) -> None:
+        self.__npIterationNumber = 0
+
+    def npUpdate(self, llh: float) -> bool:
+        # like `update` the number of previous iterations is compared
+        stop = self.__npIterationNumber >= self.__nIterations
+        self.__npIterationNumber += 1
+        return(stop)
+
     @property
     def stopVar(self):
         return(self.__stopVar)
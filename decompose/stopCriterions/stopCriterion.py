@@ -3,12 +3,28 @@ import tensorflow as tf
 from tensorflow import Tensor
 
 
+STOP = "stop"
+"""Collection of the flag that indicates after a training run whether the
+training has to be stopped. The flag is fetched along with the train op."""
+
+
 class StopCriterion(ABC):
 
     @abstractmethod
     def init(self, ns: str) -> None:
         ...
 
+    def npInit(self) -> None:
+        """Resets the state of the criterion for the numpy backend."""
+        ...
+
+    def npUpdate(self, llh: float) -> bool:
+        """Updates the criterion with `llh` and returns whether to stop.
+
+        This is the counterpart of `update` for the numpy backend.
+        """
+        raise NotImplementedError
+
 
 class NoStop(StopCriterion):
     def __init__(self):
@@ -25,17 +41,69 @@ class NoStop(StopCriterion):
     def update(self, model, X: Tensor):
         return([])
 
+    def npUpdate(self, llh: float) -> bool:
+        return(False)
+
     @property
     def stopVar(self) -> tf.Variable:
         return(self.__stopVar)
 
 
+class SwitchedStopCriterion(StopCriterion):
+    """Updates one of two criterions chosen at runtime by `condition`.
+
+    Used by a model whose phase is switched at runtime. The criterions
+    keep their own variables and have to be initialized on their own,
+    e. g. with the namespaces of their phases.
+
+    Arguments:
+        condition: scalar boolean `Tensor`.
+        ifTrue: `StopCriterion` updated if `condition` is true.
+        ifFalse: `StopCriterion` updated otherwise.
+    """
+    def __init__(self, condition: Tensor, ifTrue: StopCriterion,
+                 ifFalse: StopCriterion) -> None:
+        self.__condition = condition
+        self.__ifTrue = ifTrue
+        self.__ifFalse = ifFalse
+
+    def init(self, ns: str = "stopCriterion") -> None:
+        pass
+
+    def update(self, model, X: Tensor):
+        # the llh is shared with the rest of the step, which is not
+        # possible once it is cached within a branch
+        model.llh(X)
+
+        def branch(stopCriterion):
+            def update():
+                with tf.control_dependencies(stopCriterion.update(model, X)):
+                    return(stopCriterion.stopVar.read_value())
+            return(update)
+
+        stop = tf.cond(self.__condition, branch(self.__ifTrue),
+                       branch(self.__ifFalse))
+        return([stop])
+
+
 class StopHook(tf.train.SessionRunHook):
+    """Requests to stop the training once the stop variable is set.
+
+    The flag in the collection `STOP` is fetched in the same run as the
+    train op. Graphs without the flag fall back to the variable
+    `stopCriterion/stop`.
+    """
+    def begin(self):
+        flags = tf.get_collection(STOP)
+        if len(flags) > 0:
+            self.__stop = flags[0]
+        else:
+            graph = tf.get_default_graph()
+            self.__stop = graph.get_tensor_by_name("stopCriterion/stop:0")
+
+    def before_run(self, run_context):
+        return(tf.train.SessionRunArgs(self.__stop))
+
     def after_run(self, run_context, run_values):
-        with tf.variable_scope("", reuse=tf.AUTO_REUSE):
-            stopVar = tf.get_variable("stopCriterion/stop",
-                                      dtype=tf.bool,
-                                      shape=())
-            condition = run_context.session.run(stopVar)
-        if condition:
+        if run_values.results:
             run_context.request_stop()
@@ -0,0 +1,27 @@
+import tensorflow as tf
+
+from decompose.stopCriterions.nIterations import NIterations
+
+
+def test_nIterations_backends():
+    """Test that both backends stop after the same number of updates."""
+    nIterations = 5
+
+    stopCriterion = NIterations(nIterations)
+    stopCriterion.init()
+    update = stopCriterion.update(model=None, X=None)
+    with tf.Session() as sess:
+        sess.run(tf.global_variables_initializer())
+        nUpdates = 0
+        while not sess.run(stopCriterion.stopVar):
+            sess.run(update)
+            nUpdates += 1
+    tf.reset_default_graph()
+
+    stopCriterion.npInit()
+    npUpdates = 1
+    while not stopCriterion.npUpdate(llh=0.):
+        npUpdates += 1
+
+    assert(nUpdates == nIterations + 1)
+    assert(npUpdates == nUpdates)
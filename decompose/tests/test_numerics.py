@@ -0,0 +1,18 @@
+import tensorflow as tf
+
+from decompose.numerics import CHECKED, FAST, getNumerics, numericsPolicy
+from decompose.numerics import assertAll
+
+
+def test_numericsPolicy():
+    """Test that the policy is set for the default graph in the context."""
+    assert(getNumerics() == CHECKED)
+    with numericsPolicy(FAST):
+        assert(getNumerics() == FAST)
+        assert(assertAll(tf.constant([True]), [], name="check") == [])
+        with tf.Graph().as_default():
+            assert(getNumerics() == CHECKED)
+            assert(len(assertAll(tf.constant([True]), [],
+                                 name="check")) == 1)
+    assert(getNumerics() == CHECKED)
+    tf.reset_default_graph()
@@ -1,9 +1,17 @@
+import os
+import time
 import pytest
 import numpy as np
 import tensorflow as tf
 from decompose.distributions.cenNormal import CenNormal
+from decompose.distributions.normal import Normal
+from decompose.distributions.cenNnNormal import CenNnNormal
+from decompose.distributions.nnUniform import NnUniform
 from decompose.sklearn import DECOMPOSE
 from decompose.data.lowRank import LowRank
+from decompose.numerics import CHECKED, FAST
+from decompose.stopCriterions.nIterations import NIterations
+from decompose.stopCriterions.stopCriterion import NoStop
 
 
 tf.logging.set_verbosity(tf.logging.INFO)
@@ -44,3 +52,164 @@ def test_sklearn(tmpdir):
     U0test = model.transform(transformModelDirectory=transformModelDirectory,
                              X=lrData.test)
     assert(0.95 <= lrData.var_expl_test((U0test, U1)) <= 1.)
+
+
+@pytest.mark.system
+@pytest.mark.slow
+@pytest.mark.parametrize("priors", [(CenNormal(), CenNormal()),
+                                    (NnUniform(), Normal()),
+                                    (CenNnNormal(), Normal())])
+def test_sklearn_transform_closedForm(tmpdir, priors):
+    """Tests the closed form transform against the iterative transform."""
+    modelDirectory = str(tmpdir.mkdir("model"))
+
+    K, M_train, M_test = 3, [500, 100], [200, 100]
+    lrData = LowRank(rank=K, M_train=M_train, M_test=M_test)
+
+    model = DECOMPOSE(modelDirectory, priors=priors, n_components=K,
+                      dtype=np.float64)
+    model.fit(lrData.training)
+
+    directory = str(tmpdir.mkdir("transformModel"))
+    t0 = time.time()
+    U0iterative = model.transform(X=lrData.test, method="iterative",
+                                  transformModelDirectory=directory)
+    t1 = time.time()
+    U0closedForm = model.transform(X=lrData.test, method="closedForm")
+    t2 = time.time()
+    print(f"iterative {t1-t0:.3f}s, closed form {t2-t1:.3f}s")
+
+    U1 = model.components_
+    relDiff = (np.linalg.norm(U0iterative - U0closedForm)
+               / np.linalg.norm(U0iterative))
+    assert(relDiff < 1e-2)
+    assert(lrData.var_expl_test((U0closedForm, U1))
+           >= lrData.var_expl_test((U0iterative, U1)) - 1e-4)
+
+
+@pytest.mark.system
+@pytest.mark.slow
+def test_sklearn_checkpoints_off(tmpdir):
+    """Tests that the results are available without any checkpoints."""
+    modelDirectory = str(tmpdir.mkdir("model"))
+
+    K, M_train, M_test = 3, [5000, 1000], [5000, 1000]
+    lrData = LowRank(rank=K, M_train=M_train, M_test=M_test)
+
+    priors, K, dtype = [CenNormal(), CenNormal()], K, np.float32
+    model = DECOMPOSE(modelDirectory, priors=priors, n_components=K,
+                      dtype=dtype, checkpoints="off")
+    U0 = model.fit_transform(lrData.training)
+    U1 = model.components_
+    assert(0.95 <= lrData.var_expl_training((U0, U1)) <= 1.)
+    assert(np.isfinite(model.llh))
+    assert(tf.train.latest_checkpoint(modelDirectory) is None)
+
+    # the parameters and the iterative transform require a checkpoint
+    with pytest.raises(ValueError):
+        model.parameters
+    with pytest.raises(ValueError):
+        model.transform(X=lrData.test, method="iterative")
+
+    # the closed form transform uses the fetched parameters
+    U0test = model.transform(X=lrData.test)
+    assert(0.95 <= lrData.var_expl_test((U0test, U1)) <= 1.)
+
+
+@pytest.mark.system
+@pytest.mark.slow
+def test_sklearn_no_summaries(tmpdir):
+    """Tests that no events are written without summaries and checkpoints."""
+    modelDirectory = str(tmpdir.mkdir("model"))
+
+    K, M_train, M_test = 3, [500, 100], [500, 100]
+    lrData = LowRank(rank=K, M_train=M_train, M_test=M_test)
+
+    priors, K, dtype = [CenNormal(), CenNormal()], K, np.float32
+    model = DECOMPOSE(modelDirectory, priors=priors, n_components=K,
+                      dtype=dtype, summarySteps=None,
+                      checkpoints="off")
+    U0 = model.fit_transform(lrData.training)
+    U1 = model.components_
+    assert(0.95 <= lrData.var_expl_training((U0, U1)) <= 1.)
+    events = [name for name in os.listdir(modelDirectory)
+              if name.startswith("events.out.tfevents")]
+    assert(len(events) == 0)
+
+
+@pytest.mark.system
+@pytest.mark.slow
+def test_sklearn_numerics(tmpdir):
+    """Reports the training time with and without the numerical checks."""
+    K, M_train, M_test = 3, [2000, 1000], [200, 1000]
+    lrData = LowRank(rank=K, M_train=M_train, M_test=M_test)
+
+    fitTimes = {}
+    for numerics in [CHECKED, FAST]:
+        modelDirectory = str(tmpdir.mkdir(f"model{numerics.name}"))
+        model = DECOMPOSE(modelDirectory, priors=[CenNormal(), CenNormal()],
+                          n_components=K, dtype=np.float32,
+                          maxIterations=200, checkpoints="off",
+                          summarySteps=None, numerics=numerics)
+        t0 = time.time()
+        U0 = model.fit_transform(lrData.training)
+        fitTimes[numerics] = time.time() - t0
+        U1 = model.components_
+        assert(0.95 <= lrData.var_expl_training((U0, U1)) <= 1.)
+
+    print(f"checked {fitTimes[CHECKED]:.2f}s, fast {fitTimes[FAST]:.2f}s")
+
+
+@pytest.mark.system
+@pytest.mark.slow
+def test_sklearn_iterationsPerRun(tmpdir):
+    """Tests the training with several iterations per run."""
+    modelDirectory = str(tmpdir.mkdir("model"))
+
+    K, M_train, M_test = 3, [500, 100], [500, 100]
+    lrData = LowRank(rank=K, M_train=M_train, M_test=M_test)
+
+    priors, K, dtype = [CenNormal(), CenNormal()], K, np.float32
+    model = DECOMPOSE(modelDirectory, priors=priors, n_components=K,
+                      dtype=dtype, iterationsPerRun=10)
+    U0 = model.fit_transform(lrData.training)
+    U1 = model.components_
+    assert(0.95 <= lrData.var_expl_training((U0, U1)) <= 1.)
+    assert(np.isfinite(model.llh))
+
+    transformModelDirectory = str(tmpdir.mkdir("transformModel"))
+    U0test = model.transform(transformModelDirectory=transformModelDirectory,
+                             X=lrData.test, method="iterative")
+    assert(0.95 <= lrData.var_expl_test((U0test, U1)) <= 1.)
+
+
+@pytest.mark.system
+@pytest.mark.slow
+def test_sklearn_iterationsPerRun_benchmark(tmpdir):
+    """Reports the iterations per second for several iterations per run."""
+    K, M_train, M_test = 3, [1000, 1000], [100, 1000]
+    lrData = LowRank(rank=K, M_train=M_train, M_test=M_test)
+    nIterations = 300
+
+    iterationsPerSecond = {}
+    for iterationsPerRun in [1, 10, 100]:
+        modelDirectory = str(tmpdir.mkdir(f"model{iterationsPerRun}"))
+        # the BCD phase never stops such that all models perform
+        # exactly `nIterations` iterations
+        model = DECOMPOSE(modelDirectory, priors=[CenNormal(), CenNormal()],
+                          n_components=K, dtype=np.float32,
+                          stopCriterionInit=NIterations(50),
+                          stopCriterionEM=NIterations(50),
+                          stopCriterionBCD=NoStop(),
+                          maxIterations=nIterations, checkpoints="off",
+                          summarySteps=None,
+                          iterationsPerRun=iterationsPerRun)
+        t0 = time.time()
+        U0 = model.fit_transform(lrData.training)
+        iterationsPerSecond[iterationsPerRun] = nIterations/(time.time()-t0)
+        U1 = model.components_
+        assert(0.95 <= lrData.var_expl_training((U0, U1)) <= 1.)
+
+    print(", ".join(f"{iterationsPerRun} per run {value:.1f} it/s"
+                    for iterationsPerRun, value
+                    in iterationsPerSecond.items()))
@@ -4,7 +4,7 @@ import tensorflow as tf
 from decompose.distributions.cenNormal import CenNormal
 from decompose.sklearn import DECOMPOSE
 from decompose.data.lowRank import LowRank
-from decompose.cv.cv import Block
+from decompose.cv.cv import Block, RandomEntries
 
 
 tf.logging.set_verbosity(tf.logging.INFO)
@@ -47,3 +47,29 @@ def test_sklearn_cv(tmpdir):
     testVarExpl = 1. - np.var(testResiduals)/np.var(testData)
     print("testVarExpl", testVarExpl)
     assert(0.95 <= lrData.var_expl_training((U0, U1)) <= 1.)
+
+
+@pytest.mark.system
+@pytest.mark.slow
+def test_sklearn_cv_randomEntries(tmpdir):
+    """Tests the cross validation on randomly held out entries."""
+    modelDirectory = str(tmpdir.mkdir("model"))
+
+    K, M_train, M_test = 3, [500, 100], [200, 100]
+    lrData = LowRank(rank=K, M_train=M_train, M_test=M_test)
+
+    priors, K, dtype = [CenNormal(), CenNormal()], K, np.float32
+    cv = RandomEntries(holdout=0.1, seed=1)
+    model = DECOMPOSE(modelDirectory, priors=priors, n_components=K,
+                      cv=cv, dtype=dtype)
+    U0 = model.fit_transform(lrData.training)
+
+    # the masks are regenerated from the seed
+    testMask = model.testMask
+    assert(np.all(testMask == cv.npMask(lrData.training.shape)))
+
+    U1 = model.components_
+    testResiduals = (np.dot(U0.T, U1) - lrData.training)[testMask]
+    testData = lrData.training[testMask]
+    testVarExpl = 1. - np.var(testResiduals)/np.var(testData)
+    assert(testVarExpl > 0.95)
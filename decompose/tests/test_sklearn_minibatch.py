@@ -0,0 +1,75 @@
+import time
+import pytest
+import numpy as np
+import tensorflow as tf
+from decompose.distributions.cenNormal import CenNormal
+from decompose.sklearn import DECOMPOSE
+from decompose.data.lowRank import LowRank
+from decompose.stopCriterions.nIterations import NIterations
+
+
+tf.logging.set_verbosity(tf.logging.INFO)
+
+
+@pytest.mark.system
+@pytest.mark.slow
+def test_sklearn_minibatch(tmpdir):
+    """Compares minibatch training with full batch training.
+
+    Both models are trained on the same low rank data and have to
+    reconstruct it very well. The wall clock time and the variance
+    explained of both trainings are reported as a benchmark.
+    """
+    # create a synthetic low rank dataset
+    K, M_train, M_test = 3, [20000, 1000], [100, 1000]
+    lrData = LowRank(rank=K, M_train=M_train, M_test=M_test)
+
+    results = {}
+    for batchSize in [None, 2000]:
+        # create temporary directory where the model is stored
+        modelDirectory = str(tmpdir.mkdir(f"model{batchSize}"))
+
+        # instantiate a model
+        priors, dtype = [CenNormal(), CenNormal()], np.float32
+        model = DECOMPOSE(modelDirectory, priors=priors, n_components=K,
+                          dtype=dtype, batchSize=batchSize,
+                          stopCriterionInit=NIterations(50),
+                          stopCriterionEM=NIterations(50),
+                          stopCriterionBCD=NIterations(100))
+
+        # train the model
+        start = time.time()
+        U0 = model.fit_transform(lrData.training)
+        duration = time.time() - start
+
+        U1 = model.components_
+        varExpl = lrData.var_expl_training((U0, U1))
+        results[batchSize] = (duration, varExpl)
+        assert(0.95 <= varExpl <= 1.)
+
+    for batchSize, (duration, varExpl) in results.items():
+        print(f"batchSize={batchSize}: {duration:.2f}s, "
+              f"variance explained {varExpl:.4f}")
+
+
+@pytest.mark.system
+@pytest.mark.slow
+def test_sklearn_memmap(tmpdir):
+    """Fits a model to data that is streamed in blocks from a `.npy` file."""
+    K, M_train, M_test = 3, [20000, 1000], [100, 1000]
+    lrData = LowRank(rank=K, M_train=M_train, M_test=M_test)
+    path = str(tmpdir.join("training.npy"))
+    np.save(path, lrData.training)
+    X = np.load(path, mmap_mode="r")
+
+    modelDirectory = str(tmpdir.mkdir("model"))
+    priors, dtype = [CenNormal(), CenNormal()], np.float32
+    model = DECOMPOSE(modelDirectory, priors=priors, n_components=K,
+                      dtype=dtype, batchSize=2000,
+                      stopCriterionInit=NIterations(50),
+                      stopCriterionEM=NIterations(50),
+                      stopCriterionBCD=NIterations(100))
+    U0 = model.fit_transform(X)
+
+    U1 = model.components_
+    assert(0.95 <= lrData.var_expl_training((U0, U1)) <= 1.)
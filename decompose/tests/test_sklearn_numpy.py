@@ -0,0 +1,45 @@
+import time
+import pytest
+import numpy as np
+import tensorflow as tf
+from decompose.distributions.cenNormal import CenNormal
+from decompose.sklearn import DECOMPOSE
+from decompose.data.lowRank import LowRank
+
+
+tf.logging.set_verbosity(tf.logging.INFO)
+
+
+@pytest.mark.system
+@pytest.mark.slow
+def test_sklearn_numpy(tmpdir):
+    """Compares the numpy backend with the tensorflow backend.
+
+    Both backends have to reconstruct low rank data very well. The wall
+    clock time of both fits is reported as a benchmark.
+    """
+    K, M_train, M_test = 3, [2000, 500], [500, 500]
+    lrData = LowRank(rank=K, M_train=M_train, M_test=M_test)
+
+    durations = {}
+    for backend in ["tensorflow", "numpy"]:
+        modelDirectory = str(tmpdir.mkdir(backend))
+        priors, dtype = [CenNormal(), CenNormal()], np.float32
+        start = time.time()
+        model = DECOMPOSE(modelDirectory, priors=priors, n_components=K,
+                          dtype=dtype, backend=backend)
+        U0 = model.fit_transform(lrData.training)
+        durations[backend] = time.time() - start
+
+        U1 = model.components_
+        assert(0.95 <= lrData.var_expl_training((U0, U1)) <= 1.)
+        assert(np.isfinite(model.llh))
+        assert(model.variance_ratio_.shape == (K,))
+
+        transformModelDirectory = str(tmpdir.mkdir(f"{backend}Transform"))
+        U0test = model.transform(
+            transformModelDirectory=transformModelDirectory, X=lrData.test)
+        assert(0.95 <= lrData.var_expl_test((U0test, U1)) <= 1.)
+
+    for backend, duration in durations.items():
+        print(f"{backend}: {duration:.2f}s")
@@ -0,0 +1,42 @@
+import pytest
+import numpy as np
+import scipy as sp
+import scipy.sparse
+import tensorflow as tf
+from decompose.distributions.cenNormal import CenNormal
+from decompose.sklearn import DECOMPOSE
+
+
+tf.logging.set_verbosity(tf.logging.INFO)
+
+
+@pytest.mark.system
+@pytest.mark.slow
+def test_sklearn_sparse(tmpdir):
+    """Fits a low rank matrix of which only 5% of the entries are observed.
+
+    The learned filter banks have to recover the missing entries.
+    """
+    modelDirectory = str(tmpdir.mkdir("model"))
+
+    # create a sparse sample of a low rank matrix
+    K, M, density = 3, (2000, 1000), 0.05
+    U0 = np.random.normal(size=(K, M[0]))
+    U1 = np.random.normal(size=(K, M[1]))
+    X = np.dot(U0.T, U1)
+    observed = np.random.random(size=M) < density
+    rows, cols = np.nonzero(observed)
+    Xsparse = sp.sparse.coo_matrix((X[observed], (rows, cols)), shape=M)
+
+    # fit the model to the observed entries
+    priors, dtype = [CenNormal(), CenNormal()], np.float32
+    model = DECOMPOSE(modelDirectory, priors=priors, n_components=K,
+                      dtype=dtype, isFullyObserved=False)
+    U0hat = model.fit_transform(Xsparse)
+    U1hat = model.components_
+    Xhat = np.dot(U0hat.T, U1hat)
+
+    # the missing entries have to be recovered
+    missing = np.logical_not(observed)
+    varExpl = 1. - np.var(X[missing] - Xhat[missing])/np.var(X[missing])
+    assert(0.95 <= varExpl <= 1.)